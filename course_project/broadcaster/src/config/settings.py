@@ -27,6 +27,15 @@ class Settings(BaseSettings):
     nats_connect_timeout: int = Field(default=10, description="NATS connection timeout")
     nats_max_reconnect_attempts: int = Field(default=60, description="Max reconnection attempts")
 
+    # JetStream Consumer (todo-backend must also run with NATS_JETSTREAM_ENABLED=true)
+    nats_jetstream_enabled: bool = Field(default=False, description="Consume from a JetStream durable consumer")
+    nats_stream_name: str = Field(default="TODOS", description="JetStream stream holding todo events")
+    nats_replay_from_sequence: int | None = Field(
+        default=None, ge=1, description="Stream sequence a newly created durable consumer starts from"
+    )
+    nats_max_deliver: int = Field(default=5, ge=1, description="Deliveries of one event before giving up on it")
+    nats_ack_wait_seconds: int = Field(default=120, ge=1, description="Redeliver an event not acked within this")
+
     # Webhook Configuration
     webhook_url: str = Field(..., description="Webhook URL for HTTP POST (required)")
     webhook_timeout: int = Field(default=30, description="Webhook request timeout")
@@ -35,6 +44,12 @@ class Settings(BaseSettings):
     # Metrics Configuration
     metrics_port: int = Field(default=8002, description="Prometheus metrics port")
 
+    # Tracing Configuration (continues the traces todo-backend sends in NATS headers)
+    tracing_buffer_size: int = Field(
+        default=2048, ge=0, description="Recent spans kept in memory for GET /traces; 0 = none"
+    )
+    tracing_file: str = Field(default="", description="File spans are appended to as OTLP JSON lines; empty = none")
+
     # Kubernetes Detection
     kubernetes_namespace: str | None = Field(default=None, description="Current Kubernetes namespace (auto-detected)")
 
@@ -0,0 +1 @@
+"""Todo event wire format shared with todo-backend."""
@@ -12,9 +12,10 @@ from fastapi import FastAPI
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.api.routes import health
+from src.api.routes import health, traces
 from src.api.routes import metrics as metrics_router
 from src.config.settings import settings
+from src.observability.tracing import configure_tracing
 from src.services.broadcaster_service import BroadcasterService
 
 # Configure logging
@@ -26,6 +27,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Spans go to an in-memory ring buffer and optionally a file; tracing is off with neither
+configure_tracing("broadcaster", settings.tracing_buffer_size, settings.tracing_file)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -79,6 +83,7 @@ def create_app() -> FastAPI:
     # Include health check routes
     app.include_router(health.router)
     app.include_router(metrics_router.router)
+    app.include_router(traces.router)
 
     return app
 
@@ -0,0 +1 @@
+"""Tracing shared with todo-backend."""
@@ -1,15 +1,17 @@
 """NATS consumer service for subscribing to messages and forwarding via webhooks."""
 
 import asyncio
-import json
 import logging
 
 import nats
 from nats.aio.client import Client as NATS
 from nats.aio.msg import Msg
+from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
 
 from ..config.settings import settings
+from ..events.schema import InvalidEventError, UnsupportedEventError, decode_event
 from ..metrics.prometheus import messages_processed_total, nats_connection_status
+from ..observability.tracing import TRACEPARENT_HEADER, SpanKind, tracer
 from .webhook_client import WebhookClient
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,7 @@ class BroadcasterService:
     def __init__(self):
         """Initialize broadcaster service."""
         self.nc: NATS | None = None
+        self.js = None  # JetStream context when consuming from a stream
         self.webhook_client = WebhookClient()
         self.is_running = False
         self.subscription = None
@@ -104,6 +107,10 @@ class BroadcasterService:
         if not self.nc:
             raise RuntimeError("NATS connection not established")
 
+        if self.settings.nats_jetstream_enabled:
+            await self._subscribe_to_stream()
+            return
+
         self.subscription = await self.nc.subscribe(
             subject=self.settings.nats_topic, queue=self.settings.nats_queue_group, cb=self._message_handler
         )
@@ -112,30 +119,101 @@ class BroadcasterService:
             f"Subscribed to topic '{self.settings.nats_topic}' with queue group '{self.settings.nats_queue_group}'"
         )
 
+    async def _subscribe_to_stream(self) -> None:
+        """Bind the queue group to a durable JetStream consumer with explicit acks.
+
+        The queue group name doubles as the durable consumer name. Replicas share it, so each event
+        is delivered to one of them and redelivered until acked, even across broadcaster restarts.
+        ``nats_replay_from_sequence`` only applies when the durable consumer is created; an existing
+        one resumes where it left off.
+        """
+        config = ConsumerConfig(
+            ack_policy=AckPolicy.EXPLICIT,
+            max_deliver=self.settings.nats_max_deliver,
+            ack_wait=self.settings.nats_ack_wait_seconds,
+        )
+        if self.settings.nats_replay_from_sequence:
+            config.deliver_policy = DeliverPolicy.BY_START_SEQUENCE
+            config.opt_start_seq = self.settings.nats_replay_from_sequence
+
+        self.js = self.nc.jetstream()
+        self.subscription = await self.js.subscribe(
+            self.settings.nats_topic,
+            queue=self.settings.nats_queue_group,
+            stream=self.settings.nats_stream_name,
+            cb=self._message_handler,
+            manual_ack=True,
+            config=config,
+        )
+
+        logger.info(
+            f"Consuming '{self.settings.nats_topic}' from stream '{self.settings.nats_stream_name}' "
+            f"as durable '{self.settings.nats_queue_group}'"
+        )
+
     async def _message_handler(self, msg: Msg) -> None:
-        """Handle incoming NATS messages."""
-        try:
-            # Parse message data
-            message_data = json.loads(msg.data.decode())
-            logger.info(f"Received message: {message_data}")
+        """Handle incoming NATS messages.
+
+        The body is JSON or msgpack, as declared by the envelope headers. In JetStream mode a
+        forwarded message is acked, a failed webhook or an event version this replica does not
+        know is nak'ed for redelivery, and a message that can never be decoded is terminated.
+
+        Handling runs in a ``CONSUMER`` span that continues the publisher's trace from the
+        message's ``traceparent`` header, with the webhook call in a ``CLIENT`` span below it.
+        """
+        headers = msg.headers or {}
+        attributes = {"messaging.system": "nats", "messaging.destination.name": msg.subject}
+        with tracer.span(
+            "BroadcasterService.handle_event", SpanKind.CONSUMER, attributes, headers.get(TRACEPARENT_HEADER)
+        ) as span:
+            try:
+                # Decode the event according to its envelope headers
+                message_data = decode_event(msg.data, msg.headers)
+                logger.info(f"Received message: {message_data}")
+                span.set_attribute("todo.action", str(message_data.get("action")))
+
+                # Forward to webhook
+                with tracer.span("WebhookClient.send_webhook", SpanKind.CLIENT) as webhook_span:
+                    success = await self.webhook_client.send_webhook(message_data)
+                    if not success:
+                        webhook_span.set_error("Webhook delivery failed")
+
+                if success:
+                    messages_processed_total.labels(status="success").inc()
+                    logger.debug("Message successfully forwarded to webhook")
+                    await self._settle(msg, msg.ack)
+                else:
+                    messages_processed_total.labels(status="error").inc()
+                    logger.warning("Failed to forward message to webhook")
+                    span.set_error("Webhook delivery failed")
+                    await self._settle(msg, msg.nak)
 
-            # Forward to webhook
-            success = await self.webhook_client.send_webhook(message_data)
+            except InvalidEventError as e:
+                logger.error(f"Failed to decode message: {e}")
+                messages_processed_total.labels(status="error").inc()
+                span.set_error(f"InvalidEventError: {e}")
+                await self._settle(msg, msg.term)
 
-            if success:
-                messages_processed_total.labels(status="success").inc()
-                logger.debug("Message successfully forwarded to webhook")
-            else:
+            except UnsupportedEventError as e:
+                logger.error(f"Cannot process message: {e}")
                 messages_processed_total.labels(status="error").inc()
-                logger.warning("Failed to forward message to webhook")
+                span.set_error(f"UnsupportedEventError: {e}")
+                await self._settle(msg, msg.nak)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse message JSON: {e}")
-            messages_processed_total.labels(status="error").inc()
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
+                messages_processed_total.labels(status="error").inc()
+                span.set_error(f"{type(e).__name__}: {e}")
+                await self._settle(msg, msg.nak)
 
+    async def _settle(self, msg: Msg, settle) -> None:
+        """Ack, nak or term a JetStream message; core NATS messages need no acknowledgement."""
+        if not self.settings.nats_jetstream_enabled:
+            return
+        try:
+            await settle()
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
-            messages_processed_total.labels(status="error").inc()
+            logger.warning(f"Failed to acknowledge message {msg.subject}: {e}")
 
     async def _error_callback(self, error: Exception) -> None:
         """Handle NATS connection errors."""
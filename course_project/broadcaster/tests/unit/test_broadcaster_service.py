@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.events.schema import EventEncoding, encode_event
+from src.observability.tracing import TRACEPARENT_HEADER, RingBufferSpanExporter, SpanKind, tracer
 from src.services.broadcaster_service import BroadcasterService
 
 
@@ -50,6 +52,7 @@ class TestBroadcasterService:
         # Create mock message
         mock_msg = MagicMock()
         mock_msg.data = json.dumps({"test": "data"}).encode()
+        mock_msg.headers = None
 
         await service._message_handler(mock_msg)
 
@@ -66,9 +69,143 @@ class TestBroadcasterService:
         # Create mock message with invalid JSON
         mock_msg = MagicMock()
         mock_msg.data = b"invalid json"
+        mock_msg.headers = None
 
         # Should not raise exception
         await service._message_handler(mock_msg)
 
         # Webhook should not be called
         service.webhook_client.send_webhook.assert_not_called()
+
+
+class TestJetStreamConsumer:
+    """Test cases for consuming from a JetStream durable consumer."""
+
+    @staticmethod
+    def _service(mock_settings, **overrides) -> BroadcasterService:
+        service = BroadcasterService()
+        service.settings = mock_settings.model_copy(update={"nats_jetstream_enabled": True, **overrides})
+        service.webhook_client = AsyncMock()
+        return service
+
+    @staticmethod
+    def _js_message(data: bytes, headers: dict | None = None) -> MagicMock:
+        return MagicMock(data=data, headers=headers, ack=AsyncMock(), nak=AsyncMock(), term=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_subscribe_binds_queue_group_as_durable(self, mock_settings):
+        """Test that the queue group subscribes to the stream with explicit acks."""
+        service = self._service(mock_settings, nats_replay_from_sequence=42)
+        service.nc = MagicMock()
+        js = service.nc.jetstream.return_value
+        js.subscribe = AsyncMock()
+
+        await service._subscribe_to_topic()
+
+        kwargs = js.subscribe.call_args.kwargs
+        assert js.subscribe.call_args.args == ("test.events",)
+        assert kwargs["queue"] == "broadcaster-workers"
+        assert kwargs["stream"] == "TODOS"
+        assert kwargs["manual_ack"] is True
+        assert kwargs["config"].ack_policy == "explicit"
+        assert kwargs["config"].deliver_policy == "by_start_sequence"
+        assert kwargs["config"].opt_start_seq == 42
+        service.nc.subscribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_forwarded_message_is_acked(self, mock_settings):
+        """Test that a message is acked once the webhook accepted it."""
+        service = self._service(mock_settings)
+        service.webhook_client.send_webhook.return_value = True
+        msg = self._js_message(b'{"id": "1"}')
+
+        await service._message_handler(msg)
+
+        msg.ack.assert_awaited_once()
+        msg.nak.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_webhook_is_redelivered(self, mock_settings):
+        """Test that a webhook failure naks the message so JetStream redelivers it."""
+        service = self._service(mock_settings)
+        service.webhook_client.send_webhook.return_value = False
+        msg = self._js_message(b'{"id": "1"}')
+
+        await service._message_handler(msg)
+
+        msg.nak.assert_awaited_once()
+        msg.ack.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_is_terminated(self, mock_settings):
+        """Test that an unparseable message is not redelivered."""
+        service = self._service(mock_settings)
+        msg = self._js_message(b"invalid json")
+
+        await service._message_handler(msg)
+
+        msg.term.assert_awaited_once()
+        service.webhook_client.send_webhook.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_core_nats_messages_are_not_acked(self, mock_settings):
+        """Test that core NATS mode leaves acknowledgement alone."""
+        service = self._service(mock_settings, nats_jetstream_enabled=False)
+        service.webhook_client.send_webhook.return_value = True
+        msg = self._js_message(b'{"id": "1"}')
+
+        await service._message_handler(msg)
+
+        msg.ack.assert_not_called()
+
+
+class TestEventEnvelope:
+    """Test decoding of the todo event envelope."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", list(EventEncoding))
+    async def test_every_encoding_is_forwarded_as_json_payload(self, mock_settings, encoding):
+        """Test that JSON and msgpack events reach the webhook as the same dict."""
+        service = BroadcasterService()
+        service.webhook_client = AsyncMock()
+        event = {"id": "1", "text": "Todo", "action": "created"}
+        body, headers = encode_event(event, encoding)
+
+        await service._message_handler(MagicMock(data=body, headers=headers))
+
+        service.webhook_client.send_webhook.assert_called_once_with(event)
+
+    @pytest.mark.asyncio
+    async def test_newer_schema_version_is_redelivered(self, mock_settings):
+        """Test that an event from a newer producer is handed back for an up-to-date replica."""
+        service = TestJetStreamConsumer._service(mock_settings)
+        msg = TestJetStreamConsumer._js_message(b"{}", {"Todo-Event-Version": "2"})
+
+        await service._message_handler(msg)
+
+        msg.nak.assert_awaited_once()
+        msg.term.assert_not_called()
+        service.webhook_client.send_webhook.assert_not_called()
+
+
+class TestTracing:
+    """Test that handling an event continues the producer's trace."""
+
+    @pytest.mark.asyncio
+    async def test_consumer_span_continues_trace_from_headers(self, mock_settings, monkeypatch):
+        """Test that the traceparent header parents the consumer span, with the webhook call below it."""
+        spans = RingBufferSpanExporter(10)
+        monkeypatch.setattr(tracer, "exporters", [spans])
+        service = BroadcasterService()
+        service.webhook_client = AsyncMock()
+        service.webhook_client.send_webhook.return_value = True
+        body, headers = encode_event({"id": "1", "action": "created"})
+        headers[TRACEPARENT_HEADER] = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        await service._message_handler(MagicMock(data=body, headers=headers, subject="todos.events"))
+
+        webhook_span, consumer_span = spans.spans
+        assert (consumer_span.kind, consumer_span.trace_id) == (SpanKind.CONSUMER, "4bf92f3577b34da6a3ce929d0e0e4736")
+        assert consumer_span.parent_span_id == "00f067aa0ba902b7"
+        assert consumer_span.attributes["todo.action"] == "created"
+        assert (webhook_span.kind, webhook_span.parent_span_id) == (SpanKind.CLIENT, consumer_span.span_id)
@@ -42,6 +42,16 @@ class Settings(BaseSettings):
     todo_backend_url: str = Field(default="http://localhost:8001", description="Todo backend service URL")
     todo_backend_timeout: float = Field(default=10.0, description="Todo backend request timeout in seconds")
 
+    # Response compression, negotiated via Accept-Encoding
+    compression_enabled: bool = Field(default=True, description="Compress responses for clients that accept it")
+    compression_minimum_size: int = Field(default=1024, description="Smallest response body (bytes) to compress")
+    compression_encodings: str = Field(
+        default="zstd,br,gzip", description="Comma-separated content codings to offer, most preferred first"
+    )
+    compression_gzip_level: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    compression_brotli_quality: int = Field(default=4, ge=0, le=11, description="Brotli quality")
+    compression_zstd_level: int = Field(default=3, ge=1, le=22, description="Zstandard compression level")
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Ensure directories exist
@@ -57,6 +67,20 @@ class Settings(BaseSettings):
         """Get the path to the image metadata file."""
         return self.image_cache_path / "metadata.txt"
 
+    @property
+    def compression_encodings_list(self) -> list[str]:
+        """Parse the offered content codings into a list, most preferred first."""
+        return [coding.strip().lower() for coding in self.compression_encodings.split(",") if coding.strip()]
+
+    @property
+    def compression_levels(self) -> dict[str, int]:
+        """Compression level per content coding."""
+        return {
+            "gzip": self.compression_gzip_level,
+            "br": self.compression_brotli_quality,
+            "zstd": self.compression_zstd_level,
+        }
+
 
 # Global settings instance
 settings = Settings()
@@ -11,6 +11,7 @@ from .api.dependencies import get_background_task_manager_instance, initialize_d
 from .api.routes import health, images, todos
 from .config.settings import settings
 from .core.lifespan import create_lifespan_manager
+from .middleware.compression import CompressionMiddleware
 from .middleware.security import FrontendSecurityHeadersMiddleware
 
 # Configure logging
@@ -40,6 +41,15 @@ def create_app() -> FastAPI:
     # Add security middleware (should be first)
     app.add_middleware(FrontendSecurityHeadersMiddleware)
 
+    # Add response compression last so it wraps the security middleware too
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            encodings=settings.compression_encodings_list,
+            levels=settings.compression_levels,
+        )
+
     # Include routers
     app.include_router(images.router)
     app.include_router(health.router)
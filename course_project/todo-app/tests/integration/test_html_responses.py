@@ -192,3 +192,22 @@ class TestHTMLResponses:
         # Template rendering should be fast (<2 seconds)
         assert (end_time - start_time) < 2.0
         assert response.status_code == 200
+
+
+class TestHTMLCompression:
+    """Test that the rendered page is compressed for clients that accept it."""
+
+    def test_root_page_is_gzip_encoded(self, test_client: TestClient, mock_image_service):
+        """Test that index.html is sent gzip-encoded and smaller, with Vary: Accept-Encoding."""
+        mock_image_service.get_image_info.return_value = Mock(spec=ImageInfo)
+        mock_image_service.format_image_status.return_value = {"current_image": "test.jpg"}
+        mock_image_service.get_config_for_template.return_value = {"fetch_interval_hours": 1}
+
+        plain = test_client.get("/", headers={"Accept-Encoding": "identity"})
+        compressed = test_client.get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed.headers["vary"]
+        assert int(compressed.headers["content-length"]) < len(plain.content)
+        assert compressed.text == plain.text
@@ -0,0 +1 @@
+"""Micro-benchmarks for todo-backend hot paths. Run against the local dev database."""
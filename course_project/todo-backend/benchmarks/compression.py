@@ -0,0 +1,70 @@
+"""Bytes on the wire and CPU cost per response for each content coding the API can negotiate.
+
+Encodes synthetic ``GET /todos`` bodies of increasing size, exactly as the JSON read path renders
+them, and compresses each with the encoders ``CompressionMiddleware`` uses at the configured
+levels (``COMPRESSION_*`` settings). Needs no database.
+
+Usage:
+    uv run python -m benchmarks.compression [todos ...]    # default: 10 100 1000 10000
+"""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+from src.config.settings import settings
+from src.database.operations import TodoDatabase
+from src.middleware.compression import available_encoders
+
+REPEATS = 20
+
+
+def todos_body(count: int) -> bytes:
+    """Render ``count`` todos the way ``GET /todos`` does, with realistic text and timestamps."""
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    rows = [
+        (
+            i,
+            f"Todo number {i}: remember to check the deployment of service {i % 17}",
+            i % 3 == 0,
+            start + timedelta(seconds=i * 37),
+            start + timedelta(seconds=i * 41),
+        )
+        for i in range(count, 0, -1)
+    ]
+    return TodoDatabase._rows_to_json(rows)
+
+
+def measure(encoder_class, level: int, body: bytes) -> tuple[int, float]:
+    """Return the compressed size and the best CPU time (microseconds) over REPEATS runs."""
+    best = float("inf")
+    compressed = b""
+    for _ in range(REPEATS):
+        start = time.process_time()
+        encoder = encoder_class(level)
+        compressed = encoder.compress(body) + encoder.finish()
+        best = min(best, (time.process_time() - start) * 1_000_000)
+    return len(compressed), best
+
+
+def main(counts: list[int]) -> None:
+    encoders = available_encoders()
+    levels = settings.compression_levels
+    print(f"{'todos':>7}{'coding':>10}{'level':>7}{'bytes':>12}{'ratio':>8}{'cpu us/resp':>13}{'MB/s':>9}")
+    for count in counts:
+        body = todos_body(count)
+        print(f"{count:>7}{'identity':>10}{'-':>7}{len(body):>12}{1.0:>8.2f}{0.0:>13.0f}{'-':>9}")
+        for coding in settings.compression_encodings_list:
+            if coding not in encoders:
+                print(f"{count:>7}{coding:>10}  not installed")
+                continue
+            size, cpu_us = measure(encoders[coding], levels[coding], body)
+            throughput = len(body) / cpu_us if cpu_us else float("inf")
+            print(
+                f"{count:>7}{coding:>10}{levels[coding]:>7}{size:>12}"
+                f"{len(body) / size:>8.2f}{cpu_us:>13.0f}{throughput:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000, 10000])
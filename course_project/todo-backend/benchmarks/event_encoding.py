@@ -0,0 +1,75 @@
+"""Bytes and CPU per todo event for each event body encoding.
+
+Encodes and decodes realistic todo events (``Todo.event_payload()`` plus ``action``) with:
+
+- ``json.dumps``: the stdlib encoding events used before the envelope, decoded with ``json.loads``
+- ``json``: ``EventEncoding.JSON``, compact JSON written and read by orjson
+- ``msgpack``: ``EventEncoding.MSGPACK``
+
+The ``encode_event``/``decode_event`` rows include building the envelope headers and checking
+them, i.e. the full per-event cost on the producer and the consumer. Needs no database or NATS.
+
+Usage:
+    uv run python -m benchmarks.event_encoding [events ...]    # default: 1000 100000
+"""
+
+import json
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+from src.events.schema import EventEncoding, decode_event, encode_event
+from src.models.todo import Todo, TodoStatus
+
+REPEATS = 5
+
+
+def todo_events(count: int) -> list[dict]:
+    """Build ``count`` event messages the way the backend publishes them."""
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    events = []
+    for i in range(count):
+        todo = Todo(
+            id=f"0b7e{i:028x}",
+            text=f"Todo number {i}: remember to check the deployment of service {i % 17}",
+            status=TodoStatus.DONE if i % 3 == 0 else TodoStatus.NOT_DONE,
+            created_at=start + timedelta(seconds=i * 37),
+            updated_at=start + timedelta(seconds=i * 41),
+        )
+        events.append({**todo.event_payload(), "action": "updated"})
+    return events
+
+
+def best_us_per_event(function, items: list) -> float:
+    """Return the best CPU time per item (microseconds) over REPEATS passes."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.process_time()
+        for item in items:
+            function(item)
+        best = min(best, time.process_time() - start)
+    return best / len(items) * 1_000_000
+
+
+def main(counts: list[int]) -> None:
+    print(f"{'events':>8}{'encoding':>12}{'bytes/event':>13}{'encode us':>11}{'decode us':>11}")
+    for count in counts:
+        events = todo_events(count)
+
+        bodies = [json.dumps(event).encode() for event in events]
+        encode_us = best_us_per_event(lambda event: json.dumps(event).encode(), events)
+        decode_us = best_us_per_event(lambda body: json.loads(body.decode()), bodies)
+        size = sum(map(len, bodies)) / count
+        print(f"{count:>8}{'json.dumps':>12}{size:>13.1f}{encode_us:>11.2f}{decode_us:>11.2f}")
+
+        for encoding in EventEncoding:
+            encoded = [encode_event(event, encoding) for event in events]
+            assert all(decode_event(*pair) == event for pair, event in zip(encoded, events, strict=True))
+            encode_us = best_us_per_event(lambda event, encoding=encoding: encode_event(event, encoding), events)
+            decode_us = best_us_per_event(lambda pair: decode_event(*pair), encoded)
+            size = sum(len(body) for body, _ in encoded) / count
+            print(f"{count:>8}{encoding:>12}{size:>13.1f}{encode_us:>11.2f}{decode_us:>11.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 100000])
@@ -0,0 +1,89 @@
+"""Per-request latency added by the middleware stack: three BaseHTTPMiddleware layers vs. APIMiddleware.
+
+Serves the same routes from three in-process apps:
+
+- ``none``: no middleware, the baseline
+- ``base-http``: ``SecurityHeadersMiddleware``, ``XSSProtectionMiddleware`` and
+  ``RequestLoggingMiddleware``, as the app was configured before
+- ``asgi``: the single pure ASGI ``APIMiddleware``
+
+Routes are a small JSON body and a ``StreamingResponse`` of 20 chunks. Requests go through
+httpx's ASGI transport, so there is no network or database in the numbers. Request logs are
+built and handed to a NullHandler, so their formatting cost is included but nothing is written.
+
+Usage:
+    uv run python -m benchmarks.middleware_stack [requests]    # default: 5000
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.middleware.api_middleware import APIMiddleware
+from src.middleware.request_logging import RequestLoggingMiddleware
+from src.middleware.security import SecurityHeadersMiddleware, XSSProtectionMiddleware
+
+CHUNKS = 20
+
+
+def make_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_body():
+        return {"id": "1", "text": "Benchmark todo", "status": "not-done"}
+
+    @app.get("/stream")
+    async def stream_body():
+        async def lines():
+            for i in range(CHUNKS):
+                yield b'{"line":%d}\n' % i
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    if stack == "base-http":
+        app.add_middleware(SecurityHeadersMiddleware)
+        app.add_middleware(XSSProtectionMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(APIMiddleware)
+    return app
+
+
+async def microseconds_per_request(client: AsyncClient, path: str, requests: int) -> float:
+    """Issue ``requests`` sequential requests after a warm-up; return the mean latency."""
+    for _ in range(100):
+        (await client.get(path)).raise_for_status()
+    start = time.perf_counter()
+    for _ in range(requests):
+        (await client.get(path)).raise_for_status()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(requests: int) -> None:
+    request_logger = logging.getLogger("request_logger")
+    request_logger.addHandler(logging.NullHandler())
+    request_logger.setLevel(logging.INFO)
+    request_logger.propagate = False
+
+    stacks = ["none", "base-http", "asgi"]
+    print(f"{requests} sequential requests; mean us/request, and added over no middleware in brackets")
+    print(f"{'path':>8}" + "".join(f"{stack:>22}" for stack in stacks))
+    for path in ("/json", "/stream"):
+        latencies = []
+        for stack in stacks:
+            async with AsyncClient(transport=ASGITransport(app=make_app(stack)), base_url="http://bench") as client:
+                latencies.append(await microseconds_per_request(client, path, requests))
+        baseline = latencies[0]
+        print(
+            f"{path:>8}" + "".join(f"{latency:>12.0f} (+{latency - baseline:>5.0f})".rjust(22) for latency in latencies)
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
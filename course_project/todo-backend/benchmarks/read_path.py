@@ -0,0 +1,83 @@
+"""CPU time per full-list read: ORM + Pydantic response_model path vs. column tuples straight to JSON.
+
+The ORM path builds a TodoDB per row, converts it to a Todo, then re-validates and serializes the
+list the way FastAPI does for ``response_model=list[Todo]``. The fast path is what ``GET /todos``
+now does: select columns and encode the rows to JSON bytes. Both produce identical bodies.
+
+Inserts the benchmark rows, measures, then deletes them again.
+Needs a reachable PostgreSQL (``docker-compose -f docker-compose.dev.yml up -d postgres``).
+
+Usage:
+    uv run python -m benchmarks.read_path [rows ...]    # default: 10000 100000
+"""
+
+import asyncio
+import sys
+import time
+
+from pydantic import TypeAdapter
+
+from src.database.connection import db_manager
+from src.database.operations import TodoDatabase
+from src.models.todo import Todo
+
+TODO_LIST = TypeAdapter(list[Todo])
+INSERT_CHUNK = 1000
+REPEATS = 5
+
+
+async def orm_path(db: TodoDatabase) -> bytes:
+    """Previous GET /todos: ORM rows -> Todo -> response_model validation -> JSON."""
+    todos = await db.get_all_todos()
+    return TODO_LIST.dump_json(TODO_LIST.validate_python(todos))
+
+
+async def fast_path(db: TodoDatabase) -> bytes:
+    """Current GET /todos: column tuples -> JSON bytes."""
+    body, _ = await db.get_all_todos_json()
+    return body
+
+
+async def measure(path, db: TodoDatabase) -> tuple[float, float, int]:
+    """Return the best (CPU ms, wall ms) per request over REPEATS runs and the body size."""
+    best_cpu = best_wall = float("inf")
+    body = b""
+    for _ in range(REPEATS):
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        body = await path(db)
+        best_cpu = min(best_cpu, (time.process_time() - cpu_start) * 1000)
+        best_wall = min(best_wall, (time.perf_counter() - wall_start) * 1000)
+    return best_cpu, best_wall, len(body)
+
+
+async def run(db: TodoDatabase, rows: int) -> None:
+    ids = []
+    for start in range(0, rows, INSERT_CHUNK):
+        todos = await db.create_todos([f"bench {i}" for i in range(start, min(start + INSERT_CHUNK, rows))])
+        ids.extend(todo.id for todo in todos)
+
+    try:
+        assert await orm_path(db) == await fast_path(db), "paths must render identical bodies"
+        for label, path in (("orm", orm_path), ("fast", fast_path)):
+            cpu_ms, wall_ms, size = await measure(path, db)
+            print(f"{rows:>8}{label:>6}{cpu_ms:>12.1f}{wall_ms:>12.1f}{size / 1024:>12.0f}")
+    finally:
+        await db.delete_todos(ids)
+
+
+async def main(row_counts: list[int]) -> None:
+    await db_manager.initialize()
+    db = TodoDatabase()
+    try:
+        # Warm the pool and dialect so first-connect queries are not measured
+        await db.count_todos()
+
+        print(f"{'rows':>8}{'path':>6}{'cpu ms/req':>12}{'wall ms/req':>12}{'body KiB':>12}")
+        for rows in row_counts:
+            await run(db, rows)
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]))
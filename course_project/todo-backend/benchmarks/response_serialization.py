@@ -0,0 +1,98 @@
+"""Requests per second for list responses: response_model re-validation vs. PydanticJSONResponse.
+
+Serves the same pre-built ``list[Todo]`` from two in-process routes, both declaring
+``response_model=list[Todo]``:
+
+- ``model``: returns the list, so FastAPI re-validates it and then serializes the copy
+  (what ``POST /todos/batch`` and ``PATCH /todos`` did before) with the installed FastAPI
+- ``dict+json``: the same, done the way older FastAPI releases such as the 0.116 pinned in
+  ``uv.lock`` do it: dump to JSON-compatible Python objects, then ``json.dumps`` in JSONResponse
+- ``fast``: returns ``PydanticJSONResponse(todos)``, encoded once by pydantic-core
+
+Requests go through httpx's ASGI transport, so there is no network or database in the numbers;
+the difference between the rows is the serialization path alone. Both bodies are checked to be
+identical first.
+
+Usage:
+    uv run python -m benchmarks.response_serialization [items ...]    # default: 100 1000 10000
+"""
+
+import asyncio
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+
+import fastapi
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+
+from src.api.responses import PydanticJSONResponse
+from src.models.todo import Todo, TodoStatus
+
+TODO_LIST = TypeAdapter(list[Todo])
+MIN_SECONDS = 2.0
+MIN_REQUESTS = 20
+
+
+def make_todos(count: int) -> list[Todo]:
+    """Build ``count`` validated todos like the services return them."""
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        Todo(
+            id=str(i),
+            text=f"Todo number {i}: remember to check the deployment",
+            status=TodoStatus.DONE if i % 3 == 0 else TodoStatus.NOT_DONE,
+            created_at=start + timedelta(seconds=i),
+            updated_at=start + timedelta(seconds=2 * i),
+        )
+        for i in range(count)
+    ]
+
+
+def make_app(todos: list[Todo]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/model", response_model=list[Todo])
+    async def model_path():
+        return todos
+
+    @app.get("/dict-json", response_model=list[Todo])
+    async def dict_json_path():
+        return JSONResponse(TODO_LIST.dump_python(TODO_LIST.validate_python(todos), mode="json"))
+
+    @app.get("/fast", response_model=list[Todo])
+    async def fast_path():
+        return PydanticJSONResponse(todos)
+
+    return app
+
+
+async def requests_per_second(client: AsyncClient, path: str) -> float:
+    """Issue sequential requests for at least MIN_SECONDS and MIN_REQUESTS; return the rate."""
+    requests = 0
+    start = time.perf_counter()
+    while requests < MIN_REQUESTS or time.perf_counter() - start < MIN_SECONDS:
+        response = await client.get(path)
+        response.raise_for_status()
+        requests += 1
+    return requests / (time.perf_counter() - start)
+
+
+async def main(counts: list[int]) -> None:
+    paths = {"model": "/model", "dict+json": "/dict-json", "fast": "/fast"}
+    print(f"FastAPI {fastapi.__version__}; requests/s per path")
+    print(f"{'items':>7}" + "".join(f"{label:>12}" for label in paths) + f"{'body KiB':>10}")
+    for count in counts:
+        app = make_app(make_todos(count))
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            bodies = {label: (await client.get(path)).content for label, path in paths.items()}
+            assert len(set(bodies.values())) == 1, "paths must render identical bodies"
+
+            rates = [await requests_per_second(client, path) for path in paths.values()]
+        print(f"{count:>7}" + "".join(f"{rate:>12.0f}" for rate in rates) + f"{len(bodies['fast']) / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]))
@@ -0,0 +1,120 @@
+"""Round trips per write: legacy ORM write path vs. single-statement RETURNING path.
+
+Counts SQL statements and pool checkouts per create/update/delete and reports mean latency.
+Needs a reachable PostgreSQL (``docker-compose -f docker-compose.dev.yml up -d postgres``).
+
+Usage:
+    uv run python -m benchmarks.write_round_trips [iterations]
+"""
+
+import asyncio
+import sys
+import time
+
+from sqlalchemy import event, select, update
+
+from src.database.connection import db_manager
+from src.database.models import TodoDB
+from src.database.operations import TodoDatabase
+from src.models.todo import Todo, TodoStatus
+
+
+class LegacyTodoDatabase(TodoDatabase):
+    """The write path as it was before RETURNING: add/commit/refresh and UPDATE + re-SELECT."""
+
+    async def create_todo(self, text: str) -> Todo:
+        async with db_manager.get_session() as s:
+            todo_db = TodoDB(text=text, completed=False)
+            s.add(todo_db)
+            await s.commit()
+            await s.refresh(todo_db)
+            return self._db_to_pydantic(todo_db)
+
+    async def update_todo(self, todo_id: str, text: str | None = None, status: TodoStatus | None = None) -> Todo | None:
+        async with db_manager.get_session() as s:
+            values = {"text": text} if text is not None else {}
+            if status is not None:
+                values["completed"] = status == TodoStatus.DONE
+            result = await s.execute(update(TodoDB).where(TodoDB.id == int(todo_id)).values(**values))
+            await s.commit()
+            if result.rowcount == 0:
+                return None
+        async with db_manager.get_session() as s:
+            todo_db = (await s.execute(select(TodoDB).where(TodoDB.id == int(todo_id)))).scalar_one_or_none()
+            return self._db_to_pydantic(todo_db) if todo_db else None
+
+
+class Counters:
+    """SQL statement and pool checkout counters attached to the engine."""
+
+    def __init__(self):
+        self.statements = 0
+        self.checkouts = 0
+
+    def attach(self, sync_engine) -> None:
+        event.listen(sync_engine, "before_cursor_execute", self._on_statement)
+        event.listen(sync_engine.pool, "checkout", self._on_checkout)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.checkouts = 0
+
+    def _on_statement(self, *_args) -> None:
+        self.statements += 1
+
+    def _on_checkout(self, *_args) -> None:
+        self.checkouts += 1
+
+
+async def measure(db: TodoDatabase, counters: Counters, iterations: int) -> dict[str, tuple[float, float, float]]:
+    """Return (statements, checkouts, ms) per operation, averaged over ``iterations``."""
+    results = {}
+    todos = []
+
+    counters.reset()
+    start = time.perf_counter()
+    for i in range(iterations):
+        todos.append(await db.create_todo(f"bench {i}"))
+    results["create"] = (counters.statements, counters.checkouts, time.perf_counter() - start)
+
+    counters.reset()
+    start = time.perf_counter()
+    for todo in todos:
+        await db.update_todo(todo.id, status=TodoStatus.DONE)
+    results["update"] = (counters.statements, counters.checkouts, time.perf_counter() - start)
+
+    counters.reset()
+    start = time.perf_counter()
+    for todo in todos:
+        await db.delete_todo(todo.id)
+    results["delete"] = (counters.statements, counters.checkouts, time.perf_counter() - start)
+
+    return {
+        op: (stmts / iterations, outs / iterations, secs * 1000 / iterations)
+        for op, (stmts, outs, secs) in results.items()
+    }
+
+
+async def main(iterations: int) -> None:
+    await db_manager.initialize()
+    counters = Counters()
+    counters.attach(db_manager.engine.sync_engine)
+
+    try:
+        # Warm the pool and dialect so first-connect queries are not counted
+        await TodoDatabase().count_todos()
+
+        before = await measure(LegacyTodoDatabase(), counters, iterations)
+        after = await measure(TodoDatabase(), counters, iterations)
+    finally:
+        await db_manager.close()
+
+    print(f"{'operation':<10}{'path':<10}{'statements':>12}{'checkouts':>11}{'ms/op':>9}")
+    for op in ("create", "update", "delete"):
+        for label, numbers in (("before", before[op]), ("after", after[op])):
+            statements, checkouts, ms = numbers
+            print(f"{op:<10}{label:<10}{statements:>12.1f}{checkouts:>11.1f}{ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
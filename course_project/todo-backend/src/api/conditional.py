@@ -0,0 +1,96 @@
+"""Conditional GET support: ETag and Last-Modified validators, 304 responses and per-route Cache-Control.
+
+Validators come from cheap versions rather than from the response body: the todo collection
+is versioned by the change sequence in the ``todo_stats`` row and a single todo by its
+``updated_at``. A route can therefore answer ``If-None-Match`` / ``If-Modified-Since`` with
+304 Not Modified before it reads or serializes anything else.
+"""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from ..models.todo import Todo, TodoVersion
+
+
+def cache_control(policy: str) -> Callable[[Request], None]:
+    """Dependency declaring a route's Cache-Control policy for its successful GET responses.
+
+    ``APIMiddleware`` applies it; routes without one get the default no-store policy.
+    """
+
+    def declare(request: Request) -> None:
+        request.state.cache_control = policy
+
+    return declare
+
+
+def collection_etag(version: TodoVersion) -> str:
+    """Weak ETag for any todo listing, from the collection change sequence.
+
+    The change time is included so a recreated database, whose sequence restarts, cannot
+    repeat a tag a client already holds. The tag is weak because it names a version, not a
+    byte sequence: the compressed and identity 200s, and the 304, all send the same tag.
+    """
+    return f'W/"todos-{version.sequence}-{_microseconds(version.changed_at):x}"'
+
+
+def todo_etag(todo: Todo) -> str:
+    """Weak ETag for a single todo, from its ID and last update time."""
+    return f'W/"todo-{todo.id}-{_microseconds(todo.updated_at or todo.created_at):x}"'
+
+
+def todo_last_modified(todo: Todo) -> datetime:
+    """Last-Modified time of a single todo."""
+    return todo.updated_at or todo.created_at
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """True if the client's cached copy is current, per RFC 9110 section 13.2.2.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only considered without it,
+    because its one-second resolution can miss a second change within the same second.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified_response(etag: str, last_modified: datetime | None) -> Response:
+    """Build an empty 304 response carrying the current validators."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response: Response, etag: str, last_modified: datetime | None) -> None:
+    """Set the ETag and Last-Modified headers on a response."""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified.astimezone(UTC), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` list, as GET requires."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def _microseconds(moment: datetime) -> int:
+    """Microseconds since the epoch, so equal timestamps always produce the same tag."""
+    return int(moment.timestamp()) * 1_000_000 + moment.microsecond
@@ -0,0 +1,37 @@
+"""Response class that encodes already-validated Pydantic models straight to JSON bytes.
+
+When a route returns a model, FastAPI validates it again against ``response_model`` and then
+serializes the validated copy. The todo services only ever hand out models they built
+themselves, so routes wrap them in ``PydanticJSONResponse`` instead. FastAPI passes a returned
+``Response`` through untouched, so there is no second validation and no ``jsonable_encoder`` pass.
+The body is rendered by pydantic-core's serializer in one call and is byte-for-byte what the
+``response_model`` path produces. ``response_model`` stays on each route and still drives the
+OpenAPI schema.
+"""
+
+from functools import cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Typed serializer for ``list[model]``; faster than inferring the type of every element."""
+    return TypeAdapter(list[model])
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response for Pydantic models, lists of models, or plain JSON-compatible data."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize with the model's own pydantic-core serializer, falling back to ``to_json``."""
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+            model = type(content[0])
+            if all(type(item) is model for item in content):
+                return _list_adapter(model).dump_json(content)
+        return to_json(content)
@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException
 
 from ...api.dependencies import get_todo_service
 from ...config.settings import settings
+from ...services.health_monitor import health_monitor
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -25,52 +26,44 @@ async def health_check():
         },
     }
 
-    # Try to get todo count, but don't fail if database is unavailable
-    try:
-        todo_service = get_todo_service()
-        response["todos_count"] = await todo_service.get_todo_count()
-    except Exception as e:
+    # Todo count and database status as of the health monitor's last check
+    if health_monitor.database.healthy and health_monitor.todos_count is not None:
+        response["todos_count"] = health_monitor.todos_count
+    else:
         response["todos_count"] = "unavailable"
-        response["database_status"] = f"error: {str(e)}"
+        response["database_status"] = f"error: {health_monitor.database.error or 'not checked yet'}"
+
+    response["todo_cache"] = get_todo_service().cache.stats()
 
     return response
 
 
 @router.get("/health")
 async def comprehensive_health_check():
-    """Comprehensive health check endpoint with database connectivity."""
-    from ...database.connection import db_manager
+    """Readiness check from the health monitor's cached status; never touches the pool.
+
+    Returns 503 when the last database check failed, or when no check has completed within
+    ``health_stale_after_seconds`` (e.g. during startup or if the monitor is stuck).
+    """
+    snapshot = health_monitor.snapshot()
+    database = snapshot["database"]
 
     response = {
         "status": "healthy",
         "service": "todo-backend",
         "timestamp": datetime.now(UTC).isoformat(),
         "database": "connected",
+        "checked_at": database["checked_at"],
+        "nats": "connected" if snapshot["nats"]["healthy"] else "unavailable",
     }
 
-    # Check database connectivity - this is critical for readiness
-    try:
-        is_db_healthy = await db_manager.health_check(max_retries=1)
-        if not is_db_healthy:
-            response["status"] = "unhealthy"
-            response["database"] = "unavailable"
-            raise HTTPException(status_code=503, detail=response)
-
-        # If database is healthy, include todo count
-        todo_service = get_todo_service()
-        response["todos_count"] = await todo_service.get_todo_count()
-
-    except HTTPException:
-        # Re-raise 503 errors
-        raise
-    except Exception as e:
-        # Any other error also means unhealthy
-        logger.error(f"Health check failed: {e}")
+    if not snapshot["ready"]:
+        logger.warning(f"Health check not ready: database={database['error']} stale={snapshot['stale']}")
         response["status"] = "unhealthy"
-        response["database"] = "error"
-        response["error"] = "Database connectivity check failed"
-        raise HTTPException(status_code=503, detail=response) from None
+        response["database"] = "stale" if database["healthy"] else "unavailable"
+        raise HTTPException(status_code=503, detail=response)
 
+    response["todos_count"] = snapshot["todos_count"]
     return response
 
 
@@ -0,0 +1,72 @@
+"""Prometheus-style metrics endpoint."""
+
+import asyncio
+
+from fastapi import APIRouter, Request, Response
+
+from ...config import logging_setup
+from ...config.logging_setup import LogPipeline
+from ...database.pool_metrics import POOL_GAUGES
+from ...observability.metrics import registry
+from ...services.event_publisher import NATS_PUBLISH_QUEUE_CAPACITY, NATS_PUBLISH_QUEUE_DEPTH, BatchedEventPublisher
+
+router = APIRouter()
+
+
+def _update_pool_gauges(pool_stats: list[dict]) -> None:
+    """Set the occupancy gauges of each pool from its live stats."""
+    for stats in pool_stats:
+        for key, gauge in POOL_GAUGES.items():
+            gauge.labels(stats["pool"]).set(stats[key])
+
+
+def _update_publisher_gauges(publisher: BatchedEventPublisher | None) -> None:
+    """Set the publish queue gauges; once the publisher is gone, its queue is empty."""
+    if publisher is not None:
+        NATS_PUBLISH_QUEUE_DEPTH.labels().set(publisher.depth)
+        NATS_PUBLISH_QUEUE_CAPACITY.labels().set(publisher.max_queue_size)
+    elif NATS_PUBLISH_QUEUE_DEPTH.children:
+        NATS_PUBLISH_QUEUE_DEPTH.labels().set(0)
+
+
+def _log_pipeline_lines(pipeline: LogPipeline) -> list[str]:
+    """Render the log queue's depth and drops as Prometheus text lines."""
+    return [
+        "# HELP todo_backend_log_queue_depth Log records waiting for the writer thread",
+        "# TYPE todo_backend_log_queue_depth gauge",
+        f"todo_backend_log_queue_depth {pipeline.depth}",
+        "# HELP todo_backend_log_queue_capacity Most log records the queue holds",
+        "# TYPE todo_backend_log_queue_capacity gauge",
+        f"todo_backend_log_queue_capacity {pipeline.queue.maxsize}",
+        "# HELP todo_backend_log_records_dropped_total Log records discarded because the queue was full",
+        "# TYPE todo_backend_log_records_dropped_total counter",
+        f"todo_backend_log_records_dropped_total {pipeline.dropped}",
+    ]
+
+
+def render_metrics(nats_service) -> str:
+    """Render this process's registry and log queue metrics in the Prometheus text format."""
+    from ...database.connection import db_manager
+
+    _update_pool_gauges(db_manager.pool_stats())
+    publisher = getattr(nats_service, "publisher", None)
+    _update_publisher_gauges(publisher if isinstance(publisher, BatchedEventPublisher) else None)
+    lines = registry.render()
+    if logging_setup.log_pipeline is not None:
+        lines.extend(_log_pipeline_lines(logging_setup.log_pipeline))
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/metrics")
+async def metrics(request: Request) -> Response:
+    """Return request, database, NATS and log queue metrics in the Prometheus text format.
+
+    Rendering runs on the event loop, where the metrics are updated. Under several workers
+    (``metrics_multiproc_dir`` set) the response sums every worker's metrics, reading their
+    snapshot files from a thread.
+    """
+    body = render_metrics(getattr(request.app.state, "nats_service", None))
+    snapshots = getattr(request.app.state, "metrics_snapshots", None)
+    if snapshots is not None:
+        body = await asyncio.to_thread(snapshots.merged, body)
+    return Response(content=body, media_type="text/plain; version=0.0.4")
@@ -1,11 +1,36 @@
 """Todo CRUD endpoints."""
 
 import logging
+from collections.abc import AsyncIterator
+from enum import StrEnum
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from ...api.conditional import (
+    cache_control,
+    collection_etag,
+    is_not_modified,
+    not_modified_response,
+    set_validators,
+    todo_etag,
+    todo_last_modified,
+)
 from ...api.dependencies import get_nats_service, get_todo_service
-from ...models.todo import Todo, TodoCreate, TodoUpdate
+from ...api.responses import PydanticJSONResponse
+from ...config.settings import settings
+from ...database.pagination import InvalidCursorError
+from ...models.todo import (
+    Todo,
+    TodoBulkDeleteResult,
+    TodoBulkUpdate,
+    TodoCreate,
+    TodoSort,
+    TodoStats,
+    TodoStatus,
+    TodoUpdate,
+    TodoVersion,
+)
 from ...services.nats_service import NATSService
 from ...services.todo_service import TodoService
 
@@ -13,13 +38,123 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/todos", response_model=list[Todo])
-async def get_todos(todo_service: TodoService = Depends(get_todo_service)):
-    """Get all todos."""
-    logger.info("Fetching all todos")
-    todos = await todo_service.get_all_todos()
-    logger.info(f"Returning {len(todos)} todos")
-    return todos
+class StreamFormat(StrEnum):
+    """Wire formats for the streaming todo list."""
+
+    NDJSON = "ndjson"
+    JSON = "json"
+
+
+async def _ndjson_lines(todos: AsyncIterator[Todo]) -> AsyncIterator[bytes]:
+    """Encode todos as newline-delimited JSON, one object per line."""
+    async for todo in todos:
+        yield todo.model_dump_json().encode() + b"\n"
+
+
+async def _json_array_chunks(todos: AsyncIterator[Todo]) -> AsyncIterator[bytes]:
+    """Encode todos as a single JSON array emitted element by element."""
+    yield b"["
+    separator = b""
+    async for todo in todos:
+        yield separator + todo.model_dump_json().encode()
+        separator = b","
+    yield b"]"
+
+
+@router.get("/todos", response_model=list[Todo], dependencies=[Depends(cache_control(settings.todos_cache_control))])
+async def get_todos(
+    request: Request,
+    limit: int | None = Query(
+        None, ge=1, le=settings.todos_max_page_size, description="Page size; omit to get all matching todos"
+    ),
+    cursor: str | None = Query(None, max_length=200, description="Opaque cursor from a previous page"),
+    status_filter: TodoStatus | None = Query(None, alias="status", description="Only todos with this status"),
+    q: str | None = Query(None, min_length=1, max_length=140, description="Case-insensitive substring of the text"),
+    sort: TodoSort = Query(TodoSort.CREATED_DESC, description="Sort order; a leading '-' means descending"),
+    todo_service: TodoService = Depends(get_todo_service),
+):
+    """Get todos, newest first unless ``sort`` says otherwise, optionally filtered by status and text.
+
+    Without ``limit`` all matching todos are returned. With ``limit`` a single page is returned and,
+    when more todos exist, the next page is advertised via ``Link: <...>; rel="next"`` and
+    ``X-Next-Cursor`` headers; the next-page link carries the same filters and sort. The response
+    body is a plain list either way.
+
+    Filtering and sorting run in the database against dedicated indexes, and the body is encoded
+    straight from database rows (see ``TodoDatabase.get_all_todos_json``), so ``response_model``
+    only documents the shape and is not re-validated.
+
+    Every response carries an ETag and Last-Modified from the collection version. A matching
+    ``If-None-Match`` or ``If-Modified-Since`` gets 304 after a single-row version lookup, without
+    reading or encoding any todos.
+    """
+    version = await todo_service.get_todos_version()
+    if version and is_not_modified(request, collection_etag(version), version.changed_at):
+        return not_modified_response(collection_etag(version), version.changed_at)
+
+    if limit is None and cursor is None:
+        logger.info("Fetching all todos")
+        body, version = await todo_service.get_all_todos_json(status=status_filter, q=q, sort=sort)
+        return _versioned_json(body, version)
+
+    page_size = limit or settings.todos_default_page_size
+    try:
+        body, next_cursor, version = await todo_service.get_todos_page_json(
+            page_size, cursor, status=status_filter, q=q, sort=sort
+        )
+    except InvalidCursorError:
+        logger.warning("Invalid pagination cursor received")
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from None
+
+    response = _versioned_json(body, version)
+    if next_cursor:
+        next_url = request.url.include_query_params(limit=page_size, cursor=next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    logger.info("Returning page of todos")
+    return response
+
+
+def _versioned_json(body: bytes, version: TodoVersion | None) -> Response:
+    """Wrap an encoded todo listing, tagged with the collection version it was read at."""
+    response = Response(content=body, media_type="application/json")
+    if version:
+        set_validators(response, collection_etag(version), version.changed_at)
+    return response
+
+
+@router.get("/todos/stream", response_class=StreamingResponse)
+async def stream_todos(
+    output_format: StreamFormat = Query(
+        StreamFormat.NDJSON, alias="format", description="ndjson (default) or a chunked JSON array"
+    ),
+    todo_service: TodoService = Depends(get_todo_service),
+):
+    """Stream all todos, newest first, as rows arrive from a server-side cursor.
+
+    Intended for exports and full-list consumers: memory stays flat and the first bytes go out
+    before the whole table has been read. Each element has the same shape as in ``GET /todos``.
+    """
+    logger.info(f"Streaming all todos as {output_format.value}")
+    todos = todo_service.stream_all_todos(settings.todos_stream_batch_size)
+
+    if output_format is StreamFormat.JSON:
+        return StreamingResponse(_json_array_chunks(todos), media_type="application/json")
+    return StreamingResponse(_ndjson_lines(todos), media_type="application/x-ndjson")
+
+
+@router.get("/todos/stats", response_model=TodoStats)
+async def get_todo_stats(
+    exact: bool = Query(False, description="Count by scanning the table instead of reading the stats row"),
+    todo_service: TodoService = Depends(get_todo_service),
+):
+    """Get todo counts by status.
+
+    Counts come from a trigger-maintained stats row, so the cost does not grow with the table.
+    ``exact=true`` recounts from the todos table.
+    """
+    return PydanticJSONResponse(await todo_service.get_todo_stats(exact=exact))
 
 
 @router.post("/todos", response_model=Todo, status_code=status.HTTP_201_CREATED)
@@ -34,18 +169,81 @@ async def create_todo(
     # Pass NATS service to the creation method
     todo = await todo_service.create_todo(todo_data, nats_service=nats_service)
     logger.info(f"Created todo with ID: {todo.id}")
-    return todo
+    return PydanticJSONResponse(todo, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/todos/batch", response_model=list[Todo], status_code=status.HTTP_201_CREATED)
+async def create_todos_batch(
+    todos_data: list[TodoCreate] = Body(..., min_length=1, max_length=settings.todos_max_batch_size),
+    todo_service: TodoService = Depends(get_todo_service),
+    nats_service: NATSService | None = Depends(get_nats_service),
+):
+    """Create several todos in a single transaction, returned in request order."""
+    logger.info(f"Creating batch of {len(todos_data)} todos")
+    todos = await todo_service.create_todos(todos_data, nats_service=nats_service)
+    logger.info(f"Created batch of {len(todos)} todos")
+    return PydanticJSONResponse(todos, status_code=status.HTTP_201_CREATED)
+
+
+@router.patch("/todos", response_model=list[Todo])
+async def bulk_update_todos(
+    bulk_update: TodoBulkUpdate,
+    todo_service: TodoService = Depends(get_todo_service),
+    nats_service: NATSService | None = Depends(get_nats_service),
+):
+    """Set the text and/or status of several todos in one statement. Returns the updated todos."""
+    if bulk_update.text is None and bulk_update.status is None:
+        raise HTTPException(status_code=422, detail="Provide text and/or status to update")
+    if len(bulk_update.ids) > settings.todos_max_batch_size:
+        raise HTTPException(status_code=422, detail="Too many ids in bulk update")
+
+    logger.info(f"Bulk updating {len(bulk_update.ids)} todos")
+    todos = await todo_service.update_todos(
+        bulk_update.ids, text=bulk_update.text, status=bulk_update.status, nats_service=nats_service
+    )
+    return PydanticJSONResponse(todos)
 
 
-@router.get("/todos/{todo_id}", response_model=Todo)
-async def get_todo(todo_id: str, todo_service: TodoService = Depends(get_todo_service)):
-    """Get a specific todo by ID."""
+@router.delete("/todos", response_model=TodoBulkDeleteResult)
+async def bulk_delete_todos(
+    ids: list[str] | None = Query(None, max_length=settings.todos_max_batch_size, description="IDs to delete"),
+    status_filter: TodoStatus | None = Query(None, alias="status", description="Delete only todos with this status"),
+    todo_service: TodoService = Depends(get_todo_service),
+    nats_service: NATSService | None = Depends(get_nats_service),
+):
+    """Delete todos by ID list and/or status in one statement, e.g. ``DELETE /todos?status=done``.
+
+    At least one filter is required; both together delete only the listed todos with that status.
+    """
+    if ids is None and status_filter is None:
+        raise HTTPException(status_code=400, detail="Provide ids and/or status to select todos to delete")
+
+    logger.info("Bulk deleting todos")
+    deleted = await todo_service.delete_todos(ids, status=status_filter, nats_service=nats_service)
+    return PydanticJSONResponse(TodoBulkDeleteResult(deleted=len(deleted), ids=[todo.id for todo in deleted]))
+
+
+@router.get(
+    "/todos/{todo_id}", response_model=Todo, dependencies=[Depends(cache_control(settings.todos_cache_control))]
+)
+async def get_todo(todo_id: str, request: Request, todo_service: TodoService = Depends(get_todo_service)):
+    """Get a specific todo by ID.
+
+    Tagged with an ETag and Last-Modified from its ``updated_at``; a matching conditional request
+    gets 304 without the todo being serialized.
+    """
     logger.info("Fetching todo with ID: [REDACTED]")
     todo = await todo_service.get_todo_by_id(todo_id)
     if not todo:
         logger.warning("Todo not found - ID redacted for security")
         raise HTTPException(status_code=404, detail="Todo not found")
-    return todo
+
+    etag, last_modified = todo_etag(todo), todo_last_modified(todo)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    response = PydanticJSONResponse(todo)
+    set_validators(response, etag, last_modified)
+    return response
 
 
 @router.put("/todos/{todo_id}", response_model=Todo)
@@ -66,14 +264,18 @@ async def update_todo(
         logger.warning("Todo not found for update - ID redacted for security")
         raise HTTPException(status_code=404, detail="Todo not found")
     logger.info("Todo updated successfully")
-    return updated_todo
+    return PydanticJSONResponse(updated_todo)
 
 
 @router.delete("/todos/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo(todo_id: str, todo_service: TodoService = Depends(get_todo_service)):
+async def delete_todo(
+    todo_id: str,
+    todo_service: TodoService = Depends(get_todo_service),
+    nats_service: NATSService | None = Depends(get_nats_service),
+):
     """Delete a todo."""
     logger.info("Deleting todo - ID redacted for security")
-    deleted = await todo_service.delete_todo(todo_id)
+    deleted = await todo_service.delete_todo(todo_id, nats_service=nats_service)
     if not deleted:
         logger.warning("Todo not found for deletion - ID redacted for security")
         raise HTTPException(status_code=404, detail="Todo not found")
@@ -0,0 +1,21 @@
+"""Recent tracing spans from the in-memory ring buffer, as OTLP JSON."""
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+
+from ...observability.tracing import otlp_document, tracer
+
+router = APIRouter()
+
+
+@router.get("/traces")
+async def traces(
+    request_id: str | None = Query(default=None, description="Spans of the traces of this X-Request-ID"),
+    trace_id: str | None = Query(default=None, description="Spans of this trace"),
+    limit: int = Query(default=100, ge=1, le=10000, description="Most recent spans returned without a filter"),
+) -> Response:
+    """Return recent spans as an OTLP JSON ``ExportTraceServiceRequest``."""
+    if tracer.buffer is None:
+        raise HTTPException(status_code=404, detail="Span buffer is disabled")
+    spans = tracer.buffer.find(trace_id=trace_id, request_id=request_id, limit=limit)
+    return Response(orjson.dumps(otlp_document(spans, tracer.service_name)), media_type="application/json")
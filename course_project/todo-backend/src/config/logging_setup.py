@@ -0,0 +1,99 @@
+"""Logging that never blocks the event loop: records go through a bounded queue to a writer thread.
+
+``configure_logging`` installs a ``DroppingQueueHandler`` as the only root handler. Emitting a
+record only appends it to a bounded queue; a ``QueueListener`` thread formats it and writes it to
+stderr. Records are not formatted on the calling thread, so structured messages passed as
+``JSONMessage`` are encoded with orjson in the listener thread as well. When the writer falls
+behind and the queue is full, new records are dropped and counted instead of stalling requests.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JSONMessage:
+    """Log message rendered as compact JSON only when a handler formats it.
+
+    The payload must not be mutated after logging, since it may be encoded on another thread.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict[str, Any]):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return orjson.dumps(self.payload).decode()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never waits: a record that does not fit in the queue is dropped and counted."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record as is; the listener thread formats it (the queue never leaves the process)."""
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """The queue handler and its listener thread, with the numbers reported on ``/metrics``."""
+
+    def __init__(self, queue_size: int, handlers: list[logging.Handler]):
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.handler = DroppingQueueHandler(self.queue)
+        self.listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+
+    @property
+    def depth(self) -> int:
+        """Records waiting to be written."""
+        return self.queue.qsize()
+
+    @property
+    def dropped(self) -> int:
+        """Records discarded because the queue was full."""
+        return self.handler.dropped
+
+    def start(self) -> None:
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Write what is still queued and stop the listener thread."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+log_pipeline: LogPipeline | None = None
+
+
+def configure_logging(level: str, queue_size: int) -> LogPipeline:
+    """Route all logging through a bounded queue to a stderr writer thread; idempotent."""
+    global log_pipeline
+    if log_pipeline is not None:
+        return log_pipeline
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_pipeline = LogPipeline(queue_size, [stream_handler])
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level))
+    root.handlers = [log_pipeline.handler]
+    log_pipeline.start()
+    atexit.register(log_pipeline.stop)
+    return log_pipeline
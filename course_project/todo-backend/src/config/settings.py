@@ -1,11 +1,33 @@
 """Backend service configuration settings using Pydantic Settings. So, so."""
 
+import math
 import os
+from typing import Literal
 
-from pydantic import Field, computed_field
+from pydantic import Field, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _parse_route_sample_rates(value: str) -> dict[str, float]:
+    """Parse comma-separated ``route=rate`` entries, clamping each rate to [0, 1].
+
+    Raises ValueError naming the first malformed entry.
+    """
+    rates = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        route, _, rate = entry.strip().rpartition("=")
+        try:
+            parsed = float(rate)
+        except ValueError:
+            parsed = math.nan
+        if not route.strip() or math.isnan(parsed):
+            raise ValueError(f"REQUEST_LOG_ROUTE_SAMPLE_RATES entry {entry.strip()!r} is not route=rate")
+        rates[route.strip()] = min(1.0, max(0.0, parsed))
+    return rates
+
+
 class Settings(BaseSettings):
     """Backend application settings loaded from environment variables."""
 
@@ -23,6 +45,39 @@ class Settings(BaseSettings):
 
     # Logging configuration
     log_level: str = Field(default="INFO", description="Logging level")
+    log_queue_size: int = Field(
+        default=10000, ge=1, description="Most log records waiting for the writer thread; further records are dropped"
+    )
+
+    # Request log sampling: errors and slow requests are always logged
+    request_log_sample_rate: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Fraction of successful requests logged"
+    )
+    request_log_route_sample_rates: str = Field(
+        default="", description="Comma-separated route=rate overrides, e.g. '/todos=0.1,/todos/{todo_id}=0.2'"
+    )
+    request_log_exclude_paths: str = Field(
+        default="/healthz,/health,/be-health", description="Comma-separated paths whose successes are never logged"
+    )
+    request_log_slow_ms: float = Field(default=1000.0, description="Requests at least this slow are always logged")
+    request_log_target_per_second: float = Field(
+        default=0.0, ge=0.0, description="Lower sample rates when more successes than this would be logged; 0 = off"
+    )
+
+    # Metrics configuration
+    metrics_multiproc_dir: str = Field(
+        default="",
+        description="Directory where each worker writes its metrics for /metrics to sum; empty = one process",
+    )
+    metrics_flush_interval_seconds: float = Field(
+        default=1.0, gt=0, description="Time between snapshots of a worker's metrics in metrics_multiproc_dir"
+    )
+
+    # Tracing configuration
+    tracing_buffer_size: int = Field(
+        default=2048, ge=0, description="Recent spans kept in memory for GET /traces; 0 = none"
+    )
+    tracing_file: str = Field(default="", description="File spans are appended to as OTLP JSON lines; empty = none")
 
     # Database configuration
     postgres_host: str = Field(default="localhost", description="PostgreSQL host")
@@ -30,6 +85,70 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="todoapp", description="PostgreSQL database name")
     postgres_user: str = Field(description="PostgreSQL username")
     postgres_password: str = Field(description="PostgreSQL password")
+    postgres_read_replica_hosts: str = Field(
+        default="",
+        description="Comma-separated read replica hosts (host or host:port); empty = read from primary",
+    )
+    read_your_writes_seconds: float = Field(
+        default=1.0, description="After a write, route this process's reads to the primary for this long"
+    )
+    replica_retry_seconds: float = Field(
+        default=30.0, description="How long a failed read replica is skipped before it is tried again"
+    )
+
+    # Connection pool configuration (applies to the primary and each read replica)
+    db_pool_size: int = Field(default=5, description="Connections kept open per engine")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed when the pool is exhausted")
+    db_pool_timeout: float = Field(default=30.0, description="Seconds to wait for a free connection before failing")
+    db_pool_recycle: int = Field(default=3600, description="Replace connections older than this many seconds")
+    db_pool_pre_ping: bool = Field(default=True, description="Test connections on checkout and replace dead ones")
+    db_pool_use_lifo: bool = Field(
+        default=True, description="Reuse the most recently returned connection so idle ones can time out"
+    )
+
+    # Startup configuration
+    seed_sample_data: bool = Field(
+        default=False, description="Seed sample todos into an empty database at startup (or run `python -m src.seed`)"
+    )
+
+    # Pagination configuration
+    todos_default_page_size: int = Field(default=50, description="Page size used when only a cursor is given")
+    todos_max_page_size: int = Field(default=500, description="Largest page size a client may request")
+    todos_max_batch_size: int = Field(default=1000, description="Most todos accepted by POST /todos/batch")
+    todos_stream_batch_size: int = Field(default=500, description="Rows fetched per round trip when streaming todos")
+
+    # Read cache configuration
+    todo_cache_enabled: bool = Field(default=True, description="Cache todo reads in process")
+    todo_cache_ttl_seconds: float = Field(default=5.0, description="Lifetime of cached todo reads")
+    todo_cache_max_items: int = Field(default=1024, description="Most individual todos kept in the read cache")
+
+    # HTTP caching: Cache-Control per route; GET routes without a policy get the default
+    default_cache_control: str = Field(
+        default="no-cache, no-store, must-revalidate", description="Cache-Control for JSON GETs without a policy"
+    )
+    todos_cache_control: str = Field(
+        default="private, no-cache",
+        description="Cache-Control for GET /todos and GET /todos/{id}; no-cache makes clients revalidate via ETag",
+    )
+
+    # Response compression, negotiated via Accept-Encoding
+    compression_enabled: bool = Field(default=True, description="Compress responses for clients that accept it")
+    compression_minimum_size: int = Field(default=1024, description="Smallest response body (bytes) to compress")
+    compression_encodings: str = Field(
+        default="zstd,br,gzip", description="Comma-separated content codings to offer, most preferred first"
+    )
+    compression_gzip_level: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    compression_brotli_quality: int = Field(default=4, ge=0, le=11, description="Brotli quality")
+    compression_zstd_level: int = Field(default=3, ge=1, le=22, description="Zstandard compression level")
+
+    # Health monitor configuration
+    health_check_interval_seconds: float = Field(
+        default=5.0, description="How often the background monitor checks the database and NATS"
+    )
+    health_check_timeout_seconds: float = Field(default=2.0, description="Time limit for each dependency check")
+    health_stale_after_seconds: float = Field(
+        default=15.0, description="Report not-ready when the last completed check is older than this"
+    )
 
     # SQL debugging
     sql_debug: bool = Field(default=False, description="Enable SQL query debugging")
@@ -50,6 +169,60 @@ class Settings(BaseSettings):
     nats_topic: str = Field(default="todos.events", description="NATS topic for todo events")
     nats_connect_timeout: int = Field(default=10, description="NATS connection timeout")
     nats_max_reconnect_attempts: int = Field(default=5, description="Max NATS reconnection attempts")
+    nats_publish_mode: Literal["batched", "direct"] = Field(
+        default="batched", description="batched: queue events and publish them from a background task"
+    )
+    nats_publish_queue_size: int = Field(default=10000, ge=1, description="Most events waiting to be published")
+    nats_publish_batch_size: int = Field(default=100, ge=1, description="Publish as soon as this many events wait")
+    nats_publish_max_delay_seconds: float = Field(
+        default=0.01, description="Publish a partial batch once its oldest event has waited this long"
+    )
+    nats_publish_overflow: Literal["drop-oldest", "block", "error"] = Field(
+        default="drop-oldest", description="What happens to a new event when the publish queue is full"
+    )
+    nats_publish_block_timeout_seconds: float = Field(
+        default=1.0, description="Longest a write waits for queue room under the block policy"
+    )
+    nats_publish_flush_timeout_seconds: float = Field(
+        default=5.0, description="Time limit for NATS to confirm a published batch"
+    )
+    nats_event_encoding: Literal["json", "msgpack"] = Field(
+        default="json", description="Todo event body encoding, declared in the Content-Type header"
+    )
+    nats_jetstream_enabled: bool = Field(
+        default=False, description="Publish todo events to a JetStream stream so consumers can replay them"
+    )
+    nats_stream_name: str = Field(default="TODOS", description="JetStream stream holding the todo event subject")
+    nats_stream_max_age_seconds: float = Field(
+        default=7 * 24 * 3600, description="How long the stream keeps events available for replay"
+    )
+    nats_stream_duplicate_window_seconds: float = Field(
+        default=120.0, description="Window in which a republished event with the same Nats-Msg-Id is dropped"
+    )
+
+    # Transactional outbox: todo events are stored with the change and relayed to NATS in the background
+    outbox_enabled: bool = Field(
+        default=True, description="Queue todo events in the outbox table; false publishes inline after commit"
+    )
+    outbox_batch_size: int = Field(default=100, ge=1, description="Most outbox events published per relay round")
+    outbox_poll_interval_seconds: float = Field(
+        default=1.0, description="How often the relay checks for events from other replicas or earlier failures"
+    )
+    outbox_publish_timeout_seconds: float = Field(
+        default=5.0, description="Time limit for NATS to confirm a relayed batch"
+    )
+    outbox_claim_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="How long a relay round reserves its events; publishing stops after half of it",
+    )
+
+    @field_validator("request_log_route_sample_rates")
+    @classmethod
+    def _check_route_sample_rates(cls, value: str) -> str:
+        """Reject malformed entries at startup rather than when the middleware is built."""
+        _parse_route_sample_rates(value)
+        return value
 
     @computed_field
     @property
@@ -93,6 +266,30 @@ class Settings(BaseSettings):
         # Development/Feature environments: DEBUG=true for convenience
         return not self.is_production
 
+    @property
+    def compression_encodings_list(self) -> list[str]:
+        """Parse the offered content codings into a list, most preferred first."""
+        return [coding.strip().lower() for coding in self.compression_encodings.split(",") if coding.strip()]
+
+    @property
+    def compression_levels(self) -> dict[str, int]:
+        """Compression level per content coding."""
+        return {
+            "gzip": self.compression_gzip_level,
+            "br": self.compression_brotli_quality,
+            "zstd": self.compression_zstd_level,
+        }
+
+    @property
+    def request_log_route_sample_rates_map(self) -> dict[str, float]:
+        """Parse the per-route sample rates into a route template to rate mapping."""
+        return _parse_route_sample_rates(self.request_log_route_sample_rates)
+
+    @property
+    def request_log_exclude_paths_set(self) -> frozenset[str]:
+        """Paths excluded from request logging unless the request fails or is slow."""
+        return frozenset(path.strip() for path in self.request_log_exclude_paths.split(",") if path.strip())
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Get CORS origins as list, handling string input from environment."""
@@ -105,6 +302,19 @@ class Settings(BaseSettings):
         """Construct database URL from individual components."""
         return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
+    @property
+    def read_replica_urls(self) -> list[str]:
+        """Construct read replica URLs; replicas share the primary's credentials and database name."""
+        urls = []
+        for host in self.postgres_read_replica_hosts.split(","):
+            host = host.strip()
+            if not host:
+                continue
+            if ":" not in host:
+                host = f"{host}:{self.postgres_port}"
+            urls.append(f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{host}/{self.postgres_db}")
+        return urls
+
     @computed_field
     @property
     def effective_nats_url(self) -> str:
@@ -1,16 +1,20 @@
 """ "Database connection management with async SQLAlchemy. Handles local and Azure Cloud, yeah-yeah.."""
 
 import asyncio
+import contextlib
 import logging
 import os
+import time
 
-from sqlalchemy import text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, ProgrammingError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from src.config.settings import settings
 
-from .models import Base
+from .models import Base, SchemaVersionDB, schema_version
+from .pool_metrics import InstrumentedAsyncQueuePool, get_pool_metrics
 
 """Database connection management with async SQLAlchemy. Handles local and Azure Cloud, yeah-yeah.."""
 """
@@ -23,8 +27,12 @@ both local and Azure Cloud environments, supporting connection pooling and robus
 Key Features:
 - Asynchronous database engine creation with configurable connection pooling.
 - Session factory management for generating async database sessions.
-- Automatic creation of database tables based on SQLAlchemy models.
+- Automatic creation of database tables based on SQLAlchemy models, skipped when the stored
+  schema-version marker matches the running code.
+- Pool pre-warming so the first requests after startup do not pay for connection setup.
 - Health check functionality with retry logic and exponential backoff to ensure database connectivity.
+- Optional read replicas: read sessions are spread round-robin across replica engines, skip replicas
+  that recently failed, and fall back to the primary during the read-your-writes window after a write.
 - Graceful shutdown and disposal of database connections.
 
 Classes:
@@ -38,13 +46,15 @@ Global Variables:
 
 Usage:
     1. Call `await db_manager.initialize()` during application startup to set up the database.
-    2. Use `db_manager.get_session()` to obtain an async session for database operations.
+    2. Use `db_manager.get_session()` to obtain an async session on the primary for writes, and
+       `db_manager.get_read_session()` for reads that may be served by a replica.
     3. Optionally, use `await db_manager.health_check()` to verify connectivity.
     4. Call `await db_manager.close()` during application shutdown to release resources.
 
 Configuration:
     The database connection URL and other settings are sourced from the application's configuration
-    (see `src.config.settings`). Connection pool parameters can be adjusted as needed.
+    (see `src.config.settings`). Connection pool parameters come from the `db_pool_*` settings;
+    `pool_stats()` reports pool occupancy and checkout counts; `/metrics` sets the pool gauges from it.
 
 Logging:
     All major operations and errors are logged using the standard Python logging module.
@@ -52,6 +62,9 @@ Logging:
 
 logger = logging.getLogger(__name__)
 
+# pg_advisory_xact_lock key serializing schema setup across replicas starting together
+SCHEMA_LOCK_KEY = 0x746F646F  # "todo"
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
@@ -60,6 +73,13 @@ class DatabaseManager:
         self.engine: AsyncEngine | None = None
         self.session_factory: async_sessionmaker[AsyncSession] | None = None
 
+        # Read replicas (empty = all reads go to the primary)
+        self.read_engines: list[AsyncEngine] = []
+        self.read_session_factories: list[async_sessionmaker[AsyncSession]] = []
+        self._next_replica = 0
+        self._replica_retry_at: dict[int, float] = {}
+        self._last_write_at = 0.0
+
     @property
     def database_url(self) -> str:
         """Get database URL from enhanced settings."""
@@ -69,20 +89,22 @@ class DatabaseManager:
         """Initialize database connection with connection pooling."""
         try:
             # Create async engine with connection pooling
-            self.engine = create_async_engine(
-                self.database_url,
-                # Connection pool settings
-                pool_size=5,  # Number of connections to maintain
-                max_overflow=10,  # Additional connections when pool is full
-                pool_timeout=30,  # Seconds to wait for connection
-                pool_recycle=3600,  # Recycle connections after 1 hour
-                # Async settings
-                echo=os.getenv("SQL_DEBUG", "false").lower() == "true",
-            )
+            self.engine = self._create_engine(self.database_url, "primary")
 
             # Create session factory
             self.session_factory = async_sessionmaker(bind=self.engine, class_=AsyncSession, expire_on_commit=False)
 
+            # Replica engines connect lazily, so an unreachable replica does not block startup
+            self.read_engines = [
+                self._create_engine(url, f"replica-{index}") for index, url in enumerate(settings.read_replica_urls)
+            ]
+            self.read_session_factories = [
+                async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+                for engine in self.read_engines
+            ]
+            if self.read_engines:
+                logger.info(f"Routing reads across {len(self.read_engines)} read replica(s)")
+
             # Create tables if they don't exist
             await self._create_tables()
 
@@ -92,10 +114,76 @@ class DatabaseManager:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
+    @staticmethod
+    def _create_engine(url: str, name: str) -> AsyncEngine:
+        """Create an async engine whose instrumented pool reports metrics under ``name``."""
+        return create_async_engine(
+            url,
+            # Connection pool settings
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_logging_name=name,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,  # Replace connections dropped by failovers/idle timeouts
+            pool_use_lifo=settings.db_pool_use_lifo,  # Let surplus idle connections age out via recycle
+            # Async settings
+            echo=os.getenv("SQL_DEBUG", "false").lower() == "true",
+        )
+
     async def _create_tables(self) -> None:
-        """Create database tables."""
+        """Create database tables, indexes and triggers unless the schema-version marker is current."""
+        version = schema_version()
+        if await self._stored_schema_version() == version:
+            logger.info(f"Schema version {version[:12]} is current, skipping create_all")
+            return
+
         async with self.engine.begin() as conn:
+            # Replicas starting together apply the (idempotent) DDL one at a time
+            await conn.execute(select(func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY)))
             await conn.run_sync(Base.metadata.create_all)
+            # create_all skips tables that already exist, so add newly declared indexes explicitly
+            await conn.run_sync(self._create_missing_indexes)
+            await conn.execute(
+                insert(SchemaVersionDB)
+                .values(id=1, version=version)
+                .on_conflict_do_update(
+                    index_elements=[SchemaVersionDB.id], set_={"version": version, "applied_at": func.now()}
+                )
+            )
+        logger.info(f"Schema created or updated to version {version[:12]}")
+
+    async def _stored_schema_version(self) -> str | None:
+        """Read the schema-version marker; None if the marker table does not exist yet."""
+        async with self.engine.connect() as conn:
+            try:
+                result = await conn.execute(select(SchemaVersionDB.version).where(SchemaVersionDB.id == 1))
+            except ProgrammingError:
+                return None
+            return result.scalar_one_or_none()
+
+    @staticmethod
+    def _create_missing_indexes(sync_conn) -> None:
+        """Create declared indexes that are not yet present in the database."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
+    async def prewarm(self) -> None:
+        """Open ``db_pool_size`` primary connections at once so first requests skip connection setup.
+
+        Connections are held together so the pool really establishes that many, then returned.
+        Replicas stay lazy so an unreachable replica cannot slow startup.
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            results = await asyncio.gather(
+                *(stack.enter_async_context(self.engine.connect()) for _ in range(settings.db_pool_size)),
+                return_exceptions=True,
+            )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
 
     async def health_check(self, max_retries: int = 3) -> bool:
         """Check database connectivity with retries."""
@@ -119,8 +207,72 @@ class DatabaseManager:
 
         return self.session_factory()
 
+    def get_read_session(self) -> tuple[AsyncSession, int | None]:
+        """Get a session for read-only queries and the replica index serving it.
+
+        Replicas are used round-robin, skipping any that failed within ``replica_retry_seconds``.
+        The primary (index None) serves the read when there are no healthy replicas or when this
+        process wrote within ``read_your_writes_seconds``, so a client sees its own writes.
+        """
+        if not self.read_session_factories:
+            return self.get_session(), None
+
+        now = time.monotonic()
+        if now - self._last_write_at < settings.read_your_writes_seconds:
+            return self.get_session(), None
+
+        replica_count = len(self.read_session_factories)
+        for _ in range(replica_count):
+            index = self._next_replica
+            self._next_replica = (self._next_replica + 1) % replica_count
+            if self._replica_retry_at.get(index, 0.0) <= now:
+                return self.read_session_factories[index](), index
+
+        return self.get_session(), None
+
+    def mark_write(self) -> None:
+        """Record a committed write to start the read-your-writes window."""
+        self._last_write_at = time.monotonic()
+
+    def mark_replica_unhealthy(self, index: int, error: Exception) -> None:
+        """Take a replica out of rotation for ``replica_retry_seconds`` after a connection failure."""
+        self._replica_retry_at[index] = time.monotonic() + settings.replica_retry_seconds
+        logger.warning(f"Read replica {index} unavailable, reading from primary: {error}")
+
+    @staticmethod
+    def is_connection_error(error: Exception) -> bool:
+        """Check whether an error means the server was unreachable rather than the query failing."""
+        if isinstance(error, DBAPIError) and error.connection_invalidated:
+            return True
+        return isinstance(error, OperationalError | InterfaceError | OSError | TimeoutError)
+
+    def pool_stats(self) -> list[dict]:
+        """Return occupancy and checkout metrics for the primary and replica pools."""
+        engines = [self.engine] if self.engine else []
+        stats = []
+        for engine in [*engines, *self.read_engines]:
+            pool = engine.pool
+            name = pool.logging_name or "default"
+            metrics = get_pool_metrics(name)
+            stats.append(
+                {
+                    "pool": name,
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    # QueuePool counts overflow from -size; only connections beyond the pool size count here
+                    "overflow": max(pool.overflow(), 0),
+                    "max_overflow": settings.db_max_overflow,
+                    "checkouts": metrics.checkouts.value,
+                    "timeouts": metrics.timeouts.value,
+                }
+            )
+        return stats
+
     async def close(self) -> None:
         """Close database connections."""
+        for engine in self.read_engines:
+            await engine.dispose()
         if self.engine:
             await self.engine.dispose()
             logger.info("Database connections closed")
@@ -1,10 +1,17 @@
 """SQLAlchemy models for the todo application."""
 
+import hashlib
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import JSON, BigInteger, Boolean, DateTime, Index, SmallInteger, String, event, func, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+# Range of the 4-byte integer todos.id column; Postgres rejects parameters outside it
+TODO_ID_MIN = -(2**31)
+TODO_ID_MAX = 2**31 - 1
 
 
 class Base(AsyncAttrs, DeclarativeBase):
@@ -17,6 +24,16 @@ class TodoDB(Base):
     """Todo database model with creation and update timestamps."""
 
     __tablename__ = "todos"
+    __table_args__ = (
+        # Backs keyset pagination on (created_at DESC, id DESC); Postgres scans it backwards
+        Index("ix_todos_created_at_id", "created_at", "id"),
+        Index("ix_todos_updated_at_id", "updated_at", "id"),
+        # ?status= listings read only their status' slice of the table; predicates match TodoDatabase._list_query
+        Index("ix_todos_not_done_created_at_id", "created_at", "id", postgresql_where=text("NOT completed")),
+        Index("ix_todos_done_created_at_id", "created_at", "id", postgresql_where=text("completed")),
+        # ?q= substring search (ILIKE '%...%') via trigrams; needs the pg_trgm extension
+        Index("ix_todos_text_trgm", "text", postgresql_using="gin", postgresql_ops={"text": "gin_trgm_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     text: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -35,3 +52,168 @@ class TodoDB(Base):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+class SchemaVersionDB(Base):
+    """Single-row marker holding the ``schema_version()`` the database was last created with.
+
+    Startup skips ``create_all`` and the trigger DDL when it matches the running code.
+    """
+
+    __tablename__ = "schema_version"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    version: Mapped[str] = mapped_column(String(64), nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class TodoStatsDB(Base):
+    """Single-row todo counters kept current by statement-level triggers on ``todos``.
+
+    Lets health probes and ``/todos/stats`` read counts in O(1) instead of scanning the table.
+    ``version`` is a change sequence bumped by every statement that touches a todo, and
+    ``changed_at`` is the time of that statement; together they version the todo collection for
+    ETag and Last-Modified headers. Every write to ``todos`` updates this row in the same
+    transaction, so concurrent writers serialize on it briefly; that is fine at todo-app write rates.
+    """
+
+    __tablename__ = "todo_stats"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    done: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default=text("0"))
+    changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+TODO_STATS_ROW_ID = 1
+
+
+class TodoOutboxDB(Base):
+    """Todo events waiting to be published to NATS (transactional outbox).
+
+    Rows are inserted in the same transaction as the todo change they describe, so an event
+    exists exactly when its change was committed. ``OutboxRelay`` publishes them in ``id`` order
+    and deletes them once NATS has confirmed receipt. Events for one todo are always in commit
+    order: the write that queues an event holds the todo's row lock, so a later change to the
+    same todo can only draw its ``id`` after the earlier one has committed.
+    """
+
+    __tablename__ = "todo_outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    todo_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Complete NATS message, plus the writer's traceparent under TRACE_CONTEXT_KEY; json rather
+    # than jsonb keeps the key order it was written with
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Set while a relay publishes the event; other relays wait for it to be cleared or to pass
+    claimed_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+# Advisory lock held while a relay claims outbox events, so only one replica claims at a time
+OUTBOX_RELAY_LOCK_ID = 0x746F646F6F7574  # "todoout"
+
+# Adds the claim column to todo_outbox tables created before it existed
+TODO_OUTBOX_DDL = ("ALTER TABLE todo_outbox ADD COLUMN IF NOT EXISTS claimed_until timestamptz",)
+
+# Idempotent, so they run on every create_all: the function and triggers are (re)installed
+# for databases created before todo_stats existed, and the seed only fills a missing row.
+# CREATE TRIGGER locks todos against writes until commit, so the seed count cannot drift.
+# The ALTERs add the change-sequence columns to todo_stats tables created before they existed.
+TODO_STATS_DDL = (
+    "ALTER TABLE todo_stats ADD COLUMN IF NOT EXISTS version bigint NOT NULL DEFAULT 0",
+    "ALTER TABLE todo_stats ADD COLUMN IF NOT EXISTS changed_at timestamptz NOT NULL DEFAULT now()",
+    """
+    CREATE OR REPLACE FUNCTION todo_stats_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+    DECLARE
+        added bigint := 0;
+        added_done bigint := 0;
+        removed bigint := 0;
+        removed_done bigint := 0;
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            UPDATE todo_stats SET total = 0, done = 0, version = version + 1, changed_at = now() WHERE id = 1;
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            SELECT count(*), count(*) FILTER (WHERE completed) INTO added, added_done FROM new_rows;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            SELECT count(*), count(*) FILTER (WHERE completed) INTO removed, removed_done FROM old_rows;
+        END IF;
+        IF added > 0 OR removed > 0 THEN
+            UPDATE todo_stats
+            SET total = total + added - removed,
+                done = done + added_done - removed_done,
+                version = version + 1,
+                changed_at = now()
+            WHERE id = 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "DROP TRIGGER IF EXISTS todo_stats_insert ON todos",
+    "DROP TRIGGER IF EXISTS todo_stats_update ON todos",
+    "DROP TRIGGER IF EXISTS todo_stats_delete ON todos",
+    "DROP TRIGGER IF EXISTS todo_stats_truncate ON todos",
+    "CREATE TRIGGER todo_stats_insert AFTER INSERT ON todos REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_stats_apply()",
+    "CREATE TRIGGER todo_stats_update AFTER UPDATE ON todos REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_stats_apply()",
+    "CREATE TRIGGER todo_stats_delete AFTER DELETE ON todos REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION todo_stats_apply()",
+    "CREATE TRIGGER todo_stats_truncate AFTER TRUNCATE ON todos FOR EACH STATEMENT EXECUTE FUNCTION todo_stats_apply()",
+    """
+    INSERT INTO todo_stats (id, total, done)
+    SELECT 1, count(*), count(*) FILTER (WHERE completed) FROM todos
+    ON CONFLICT (id) DO NOTHING
+    """,
+)
+
+
+# Extensions the schema depends on; pg_trgm is a trusted extension, so the database owner can create it
+EXTENSIONS_DDL = ("CREATE EXTENSION IF NOT EXISTS pg_trgm",)
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_extensions(target, connection, **kw) -> None:
+    """Create required extensions before any table or index on PostgreSQL."""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in EXTENSIONS_DDL:
+        connection.execute(text(statement))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_todo_stats_triggers(target, connection, **kw) -> None:
+    """Install the todo_stats triggers and seed row after every create_all on PostgreSQL."""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in TODO_STATS_DDL:
+        connection.execute(text(statement))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _upgrade_todo_outbox(target, connection, **kw) -> None:
+    """Add columns missing from a todo_outbox table created by an earlier version."""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in TODO_OUTBOX_DDL:
+        connection.execute(text(statement))
+
+
+def schema_version() -> str:
+    """Fingerprint of the DDL that startup applies; changes whenever a model, index or trigger does."""
+    dialect = postgresql.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in sorted(table.indexes, key=str))
+    ddl.extend(EXTENSIONS_DDL)
+    ddl.extend(TODO_STATS_DDL)
+    ddl.extend(TODO_OUTBOX_DDL)
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()
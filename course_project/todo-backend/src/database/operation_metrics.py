@@ -0,0 +1,78 @@
+"""Latency, error and in-flight metrics and tracing spans for ``TodoDatabase`` operations.
+
+``@instrumented`` wraps a coroutine or async generator method and records it under the method's
+name (``create_todo``, ``get_all_todos``, ...). Its label children are bound when the method is
+decorated, so a call only reads the clock and updates three plain attributes. The time includes
+waiting for a pool connection, which ``todo_backend_db_pool_wait_seconds`` reports on its own;
+for async generators it runs until the iterator is exhausted or closed.
+
+Each call also runs in a ``TodoDatabase.<method>`` span under the current request's span. A
+stream's span does not become current, since the caller keeps running between its items.
+"""
+
+import contextlib
+import functools
+import inspect
+import time
+
+from ..observability.metrics import registry
+from ..observability.tracing import tracer
+
+DB_OPERATION_SECONDS = registry.histogram(
+    "todo_backend_db_operation_duration_seconds", "Time spent in a TodoDatabase operation", ("operation",)
+)
+DB_OPERATION_ERRORS = registry.counter(
+    "todo_backend_db_operation_errors_total", "TodoDatabase operations that raised", ("operation",)
+)
+DB_OPERATIONS_IN_FLIGHT = registry.gauge(
+    "todo_backend_db_operations_in_flight", "TodoDatabase operations running in this process", ("operation",)
+)
+
+
+def instrumented(method):
+    """Record the latency, errors, concurrency and a span of a ``TodoDatabase`` method under its name."""
+    operation = method.__name__
+    seconds = DB_OPERATION_SECONDS.labels(operation)
+    errors = DB_OPERATION_ERRORS.labels(operation)
+    in_flight = DB_OPERATIONS_IN_FLIGHT.labels(operation)
+    span_name = f"TodoDatabase.{operation}"
+    span_attributes = {"db.system": "postgresql", "db.operation.name": operation}
+
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def generator_wrapper(*args, **kwargs):
+            in_flight.inc()
+            start = time.perf_counter()
+            span = tracer.start_span(span_name, attributes=span_attributes)
+            try:
+                # aclosing() releases the method's session as soon as the caller stops iterating
+                async with contextlib.aclosing(method(*args, **kwargs)) as items:
+                    async for item in items:
+                        yield item
+            except Exception as e:
+                errors.inc()
+                span.set_error(f"{type(e).__name__}: {e}")
+                raise
+            finally:
+                in_flight.dec()
+                seconds.observe(time.perf_counter() - start)
+                tracer.end_span(span)
+
+        return generator_wrapper
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            with tracer.span(span_name, attributes=span_attributes):
+                return await method(*args, **kwargs)
+        except Exception:
+            errors.inc()
+            raise
+        finally:
+            in_flight.dec()
+            seconds.observe(time.perf_counter() - start)
+
+    return wrapper
@@ -10,74 +10,269 @@ for use in the application layer. Yeah.
 Intended for use with PostgreSQL, but can be adapted for other SQL databases supporting SQLAlchemy's async API.
 """
 
-from sqlalchemy import delete, func, select, update
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from datetime import timedelta
 
-from ..models.todo import Todo, TodoStatus
+from pydantic_core import to_json
+from sqlalchemy import Integer, Result, Row, Select, any_, bindparam, delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.todo import Todo, TodoSort, TodoStatus, TodoVersion
+from ..observability.tracing import TRACE_CONTEXT_KEY, current_span
 from .connection import db_manager
-from .models import TodoDB
+from .models import OUTBOX_RELAY_LOCK_ID, TODO_ID_MAX, TODO_ID_MIN, TODO_STATS_ROW_ID, TodoDB, TodoOutboxDB, TodoStatsDB
+from .operation_metrics import instrumented
+from .pagination import decode_cursor, encode_cursor
+
+# Columns selected by the JSON read path, in the order _rows_to_json unpacks them
+TODO_JSON_COLUMNS = (TodoDB.id, TodoDB.text, TodoDB.completed, TodoDB.created_at, TodoDB.updated_at)
+
+# Sort column and direction per sort order; each is backed by a (column, id) index
+_SORT_KEYS = {
+    TodoSort.CREATED_DESC: (TodoDB.created_at, True),
+    TodoSort.CREATED_ASC: (TodoDB.created_at, False),
+    TodoSort.UPDATED_DESC: (TodoDB.updated_at, True),
+    TodoSort.UPDATED_ASC: (TodoDB.updated_at, False),
+}
 
 
 class TodoDatabase:
     """Database operations for Todo entities.
 
     All operations are async and handle database sessions with proper rollback on errors.
-    Uses SQLAlchemy async sessions for PostgreSQL compatibility.
+    Uses SQLAlchemy async sessions for PostgreSQL compatibility. Reads go through
+    ``db_manager.get_read_session()`` and may be served by a read replica; writes always use
+    the primary and open the read-your-writes window.
+
+    Write methods take ``outbox=True`` to queue one NATS event per affected todo in
+    ``todo_outbox`` within the same transaction; ``relay_outbox`` publishes them.
+
+    Public operations are ``@instrumented``: their latency and errors are exported on ``/metrics``,
+    and each call is a tracing span.
     """
 
-    async def create_todo(self, text: str) -> Todo:
-        """Create a new todo item."""
+    @instrumented
+    async def create_todo(self, text: str, outbox: bool = False) -> Todo:
+        """Create a new todo item with a single INSERT ... RETURNING statement."""
         session = db_manager.get_session()
         async with session as s:
             try:
-                todo_db = TodoDB(text=text, completed=False)
-                s.add(todo_db)
+                # RETURNING brings back server defaults (id, timestamps) without a refresh round trip
+                result = await s.scalars(insert(TodoDB).values(text=text, completed=False).returning(TodoDB))
+                todo = self._db_to_pydantic(result.one())
+                if outbox:
+                    await self._queue_events(s, [todo], "created")
                 await s.commit()
-                await s.refresh(todo_db)
+                db_manager.mark_write()
 
-                # Convert database model to Pydantic model
-                return self._db_to_pydantic(todo_db)
+                return todo
             except Exception:
                 await s.rollback()
                 raise
 
-    async def get_todo(self, todo_id: str) -> Todo | None:
-        """Get a todo by ID."""
-        try:
-            todo_id_int = int(todo_id)
-        except ValueError:
-            return None
+    @instrumented
+    async def create_todos(self, texts: list[str], outbox: bool = False) -> list[Todo]:
+        """Create several todo items in one multi-row INSERT ... RETURNING statement.
+
+        All rows are inserted in a single transaction; the result preserves the input order.
+        """
+        if not texts:
+            return []
 
         session = db_manager.get_session()
         async with session as s:
             try:
-                result = await s.execute(select(TodoDB).where(TodoDB.id == todo_id_int))
-                todo_db = result.scalar_one_or_none()
+                result = await s.scalars(
+                    insert(TodoDB).returning(TodoDB, sort_by_parameter_order=True),
+                    [{"text": text, "completed": False} for text in texts],
+                )
+                todos = [self._db_to_pydantic(todo_db) for todo_db in result.all()]
+                if outbox:
+                    await self._queue_events(s, todos, "created")
+                await s.commit()
+                db_manager.mark_write()
 
-                if todo_db:
-                    return self._db_to_pydantic(todo_db)
-                return None
+                return todos
             except Exception:
                 await s.rollback()
                 raise
 
+    @instrumented
+    async def get_todo(self, todo_id: str) -> Todo | None:
+        """Get a todo by ID."""
+        todo_id_int = self._parse_id(todo_id)
+        if todo_id_int is None:
+            return None
+
+        result = await self._read(select(TodoDB).where(TodoDB.id == todo_id_int))
+        todo_db = result.scalar_one_or_none()
+
+        if todo_db:
+            return self._db_to_pydantic(todo_db)
+        return None
+
+    @instrumented
     async def get_all_todos(self) -> list[Todo]:
         """Get all todos ordered by creation date."""
-        session = db_manager.get_session()
+        result = await self._read(select(TodoDB).order_by(TodoDB.created_at.desc(), TodoDB.id.desc()))
+        todo_dbs = list(result.scalars().all())
+
+        return [self._db_to_pydantic(todo_db) for todo_db in todo_dbs]
+
+    @instrumented
+    async def get_all_todos_json(
+        self, status: TodoStatus | None = None, q: str | None = None, sort: TodoSort = TodoSort.CREATED_DESC
+    ) -> tuple[bytes, TodoVersion | None]:
+        """Get all todos matching the filters as a JSON array, skipping ORM and Pydantic objects.
+
+        Selects plain column tuples and encodes them directly; without filters the output is
+        byte-for-byte what ``GET /todos`` would render from ``get_all_todos()``. Also returns the
+        collection version, read just before the rows on the same session (see ``_read_all``).
+        """
+        version_result, result = await self._read_all(
+            self._version_query(), self._list_query(select(*TODO_JSON_COLUMNS), status=status, q=q, sort=sort)
+        )
+        return self._rows_to_json(result.all()), self._to_version(version_result.one_or_none())
+
+    @instrumented
+    async def get_todos_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        status: TodoStatus | None = None,
+        q: str | None = None,
+        sort: TodoSort = TodoSort.CREATED_DESC,
+    ) -> tuple[list[Todo], str | None]:
+        """Get one page of todos using keyset pagination on the sort column and ID.
+
+        Returns the page and an opaque cursor for the next page, or None on the last page.
+        Raises InvalidCursorError if the cursor cannot be decoded.
+        """
+        query = self._list_query(select(TodoDB), status=status, q=q, sort=sort, limit=limit, cursor=cursor)
+        result = await self._read(query)
+        todo_dbs = list(result.scalars().all())
+
+        next_cursor = None
+        if len(todo_dbs) > limit:
+            todo_dbs = todo_dbs[:limit]
+            next_cursor = self._next_cursor(todo_dbs[-1], sort)
+
+        return [self._db_to_pydantic(todo_db) for todo_db in todo_dbs], next_cursor
+
+    @instrumented
+    async def get_todos_page_json(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        status: TodoStatus | None = None,
+        q: str | None = None,
+        sort: TodoSort = TodoSort.CREATED_DESC,
+    ) -> tuple[bytes, str | None, TodoVersion | None]:
+        """Same as ``get_todos_page`` but returns the page as JSON bytes built from column tuples.
+
+        The collection version is returned as well, read like in ``get_all_todos_json``.
+        """
+        query = self._list_query(select(*TODO_JSON_COLUMNS), status=status, q=q, sort=sort, limit=limit, cursor=cursor)
+        version_result, result = await self._read_all(self._version_query(), query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._next_cursor(rows[-1], sort)
+
+        return self._rows_to_json(rows), next_cursor, self._to_version(version_result.one_or_none())
+
+    @staticmethod
+    def _list_query(
+        query: Select,
+        status: TodoStatus | None = None,
+        q: str | None = None,
+        sort: TodoSort = TodoSort.CREATED_DESC,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Select:
+        """Apply filters, keyset ordering and, when paging, the cursor bound and ``limit + 1``.
+
+        The status predicates are written exactly like the partial index predicates on
+        ``TodoDB`` so the planner can use them; ``q`` is a case-insensitive substring match
+        served by the trigram index on ``text``.
+        """
+        if status is TodoStatus.DONE:
+            query = query.where(TodoDB.completed)
+        elif status is TodoStatus.NOT_DONE:
+            query = query.where(~TodoDB.completed)
+
+        if q:
+            query = query.where(TodoDB.text.ilike(f"%{TodoDatabase._escape_like(q)}%", escape="\\"))
+
+        column, descending = _SORT_KEYS[sort]
+        if descending:
+            query = query.order_by(column.desc(), TodoDB.id.desc())
+        else:
+            query = query.order_by(column.asc(), TodoDB.id.asc())
+
+        if cursor:
+            value, todo_id = decode_cursor(cursor)
+            key = tuple_(column, TodoDB.id)
+            query = query.where(key < tuple_(value, todo_id) if descending else key > tuple_(value, todo_id))
+
+        # Fetch one extra row to learn whether another page exists
+        return query.limit(limit + 1) if limit is not None else query
+
+    @staticmethod
+    def _next_cursor(last, sort: TodoSort) -> str:
+        """Encode the sort key of the last row on a page (an ORM object or a column row)."""
+        column, _ = _SORT_KEYS[sort]
+        return encode_cursor(getattr(last, column.key), last.id)
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """Escape LIKE wildcards so user input is matched literally."""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @instrumented
+    async def stream_todos(self, batch_size: int = 500) -> AsyncIterator[Todo]:
+        """Stream all todos ordered by creation date from a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat regardless of table size.
+        The session is held open until the iterator is exhausted or closed.
+        """
+        query = (
+            select(TodoDB).order_by(TodoDB.created_at.desc(), TodoDB.id.desc()).execution_options(yield_per=batch_size)
+        )
+
+        session, replica = db_manager.get_read_session()
         async with session as s:
             try:
-                result = await s.execute(select(TodoDB).order_by(TodoDB.created_at.desc()))
-                todo_dbs = list(result.scalars().all())
+                result = await s.stream_scalars(query)
+            except Exception as e:
+                # Nothing has been sent yet, so an unreachable replica can still fall back to the primary
+                if replica is None or not db_manager.is_connection_error(e):
+                    raise
+                db_manager.mark_replica_unhealthy(replica, e)
+                result = None
 
-                return [self._db_to_pydantic(todo_db) for todo_db in todo_dbs]
-            except Exception:
-                await s.rollback()
-                raise
+            if result is not None:
+                async for todo_db in result:
+                    yield self._db_to_pydantic(todo_db)
+                return
 
-    async def update_todo(self, todo_id: str, text: str | None = None, status: TodoStatus | None = None) -> Todo | None:
-        """Update a todo item."""
-        try:
-            todo_id_int = int(todo_id)
-        except ValueError:
+        session = db_manager.get_session()
+        async with session as s:
+            result = await s.stream_scalars(query)
+            async for todo_db in result:
+                yield self._db_to_pydantic(todo_db)
+
+    @instrumented
+    async def update_todo(
+        self, todo_id: str, text: str | None = None, status: TodoStatus | None = None, outbox: bool = False
+    ) -> Todo | None:
+        """Update a todo item with a single UPDATE ... RETURNING statement on one session."""
+        todo_id_int = self._parse_id(todo_id)
+        if todo_id_int is None:
             return None
 
         session = db_manager.get_session()
@@ -91,49 +286,346 @@ class TodoDatabase:
                     update_values["completed"] = status == TodoStatus.DONE
 
                 if not update_values:
-                    return await self.get_todo(todo_id)
+                    result = await s.scalars(select(TodoDB).where(TodoDB.id == todo_id_int))
+                    todo_db = result.one_or_none()
+                    return self._db_to_pydantic(todo_db) if todo_db else None
+
+                # Perform update and read back the new row in the same statement
+                result = await s.scalars(
+                    update(TodoDB)
+                    .where(TodoDB.id == todo_id_int)
+                    .values(**update_values)
+                    .returning(TodoDB)
+                    .execution_options(synchronize_session=False)
+                )
+                todo_db = result.one_or_none()
+                todo = self._db_to_pydantic(todo_db) if todo_db else None
+                if todo and outbox:
+                    await self._queue_events(s, [todo], "updated")
+                await s.commit()
+                db_manager.mark_write()
+
+                return todo
+            except Exception:
+                await s.rollback()
+                raise
+
+    @instrumented
+    async def delete_todo(self, todo_id: str, outbox: bool = False) -> Todo | None:
+        """Delete a todo item. Returns the deleted todo, or None if not found."""
+        todo_id_int = self._parse_id(todo_id)
+        if todo_id_int is None:
+            return None
+
+        session = db_manager.get_session()
+        async with session as s:
+            try:
+                result = await s.scalars(
+                    delete(TodoDB)
+                    .where(TodoDB.id == todo_id_int)
+                    .returning(TodoDB)
+                    .execution_options(synchronize_session=False)
+                )
+                todo_db = result.one_or_none()
+                todo = self._db_to_pydantic(todo_db) if todo_db else None
+                if todo and outbox:
+                    await self._queue_events(s, [todo], "deleted")
+                await s.commit()
+                db_manager.mark_write()
+                return todo
+            except Exception:
+                await s.rollback()
+                raise
+
+    @instrumented
+    async def update_todos(
+        self, todo_ids: list[str], text: str | None = None, status: TodoStatus | None = None, outbox: bool = False
+    ) -> list[Todo]:
+        """Apply the same update to several todos in one UPDATE ... WHERE id = ANY(:ids) RETURNING statement.
 
-                # Perform update
-                result = await s.execute(update(TodoDB).where(TodoDB.id == todo_id_int).values(**update_values))
+        Unknown or malformed IDs are ignored; only the rows actually updated are returned.
+        """
+        ids = self._parse_ids(todo_ids)
+        update_values = {}
+        if text is not None:
+            update_values["text"] = text
+        if status is not None:
+            update_values["completed"] = status == TodoStatus.DONE
+
+        if not ids or not update_values:
+            return []
+
+        session = db_manager.get_session()
+        async with session as s:
+            try:
+                result = await s.scalars(
+                    update(TodoDB)
+                    .where(TodoDB.id == any_(self._ids_param(ids)))
+                    .values(**update_values)
+                    .returning(TodoDB)
+                    .execution_options(synchronize_session=False)
+                )
+                todos = [self._db_to_pydantic(todo_db) for todo_db in result.all()]
+                if outbox:
+                    await self._queue_events(s, todos, "updated")
                 await s.commit()
+                db_manager.mark_write()
+
+                return todos
+            except Exception:
+                await s.rollback()
+                raise
+
+    @instrumented
+    async def delete_todos(
+        self, todo_ids: list[str] | None = None, status: TodoStatus | None = None, outbox: bool = False
+    ) -> list[Todo]:
+        """Delete todos matching an ID list and/or status in one DELETE ... RETURNING statement.
+
+        At least one filter is required so a missing parameter can never empty the table.
+        Returns the deleted todos.
+        """
+        if todo_ids is None and status is None:
+            raise ValueError("delete_todos requires todo_ids or status")
 
-                if result.rowcount == 0:
-                    return None
+        query = delete(TodoDB)
+        if todo_ids is not None:
+            ids = self._parse_ids(todo_ids)
+            if not ids:
+                return []
+            query = query.where(TodoDB.id == any_(self._ids_param(ids)))
+        if status is not None:
+            query = query.where(TodoDB.completed == (status == TodoStatus.DONE))
 
-                # Return updated todo
-                return await self.get_todo(todo_id)
+        session = db_manager.get_session()
+        async with session as s:
+            try:
+                result = await s.scalars(query.returning(TodoDB).execution_options(synchronize_session=False))
+                todos = [self._db_to_pydantic(todo_db) for todo_db in result.all()]
+                if outbox:
+                    await self._queue_events(s, todos, "deleted")
+                await s.commit()
+                db_manager.mark_write()
+
+                return todos
             except Exception:
                 await s.rollback()
                 raise
 
-    async def delete_todo(self, todo_id: str) -> bool:
-        """Delete a todo item. Returns True if deleted, False if not found."""
+    @staticmethod
+    async def _queue_events(s: AsyncSession, todos: list[Todo], action: str) -> None:
+        """Insert one outbox event per todo in the caller's transaction, as a single statement.
+
+        Each event keeps the traceparent of the current span, so the relay's publish, and the
+        broadcaster after it, continue the trace of the request that made the change.
+        """
+        if not todos:
+            return
+        span = current_span()
+        trace_context = {TRACE_CONTEXT_KEY: span.traceparent} if span is not None else {}
+        await s.execute(
+            insert(TodoOutboxDB),
+            [
+                {"todo_id": int(todo.id), "payload": {**todo.event_payload(), "action": action, **trace_context}}
+                for todo in todos
+            ],
+        )
+
+    @instrumented
+    async def relay_outbox(
+        self, publish: Callable[[list[dict]], Awaitable[int]], limit: int, claim_seconds: float
+    ) -> int:
+        """Publish up to ``limit`` of the oldest outbox events and delete the ones ``publish`` confirms.
+
+        ``publish`` receives the messages in ``id`` order and returns how many of them, from the
+        start, reached NATS. The events are claimed for ``claim_seconds`` in one short transaction
+        and deleted in another, so no connection or lock is held while NATS is slow. While a claim
+        is live, relays on other replicas skip the round instead of publishing out of order, and
+        return 0. Publishing is cut off halfway through the claim, so it cannot outlive it.
+        Events whose deletion is lost to a crash are published again: delivery is at-least-once.
+        """
+        rows = await self._claim_outbox(limit, claim_seconds)
+        if not rows:
+            return 0
+
+        published = 0
         try:
-            todo_id_int = int(todo_id)
-        except ValueError:
-            return False
+            async with asyncio.timeout(claim_seconds / 2):
+                published = await publish([row.payload for row in rows])
+        except TimeoutError:
+            pass  # Nothing is known to be confirmed; the events are released and published again
+        finally:
+            await self._settle_outbox(rows, published)
+        return published
 
+    async def _claim_outbox(self, limit: int, claim_seconds: float) -> list[Row]:
+        """Claim the oldest ``limit`` outbox events; empty if another relay holds the lock or a live claim."""
         session = db_manager.get_session()
         async with session as s:
             try:
-                result = await s.execute(delete(TodoDB).where(TodoDB.id == todo_id_int))
+                if not await s.scalar(select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_ID))):
+                    await s.rollback()
+                    return []
+                if await s.scalar(select(TodoOutboxDB.id).where(TodoOutboxDB.claimed_until > func.now()).limit(1)):
+                    await s.rollback()
+                    return []
+
+                oldest = select(TodoOutboxDB.id).order_by(TodoOutboxDB.id).limit(limit)
+                result = await s.execute(
+                    update(TodoOutboxDB)
+                    .where(TodoOutboxDB.id.in_(oldest))
+                    .values(claimed_until=func.now() + timedelta(seconds=claim_seconds))
+                    .returning(TodoOutboxDB.id, TodoOutboxDB.payload, TodoOutboxDB.claimed_until)
+                    .execution_options(synchronize_session=False)
+                )
+                rows = sorted(result.all(), key=lambda row: row.id)
                 await s.commit()
-                return result.rowcount > 0
+                return rows
             except Exception:
                 await s.rollback()
                 raise
 
-    async def count_todos(self) -> int:
-        """Count total number of todos."""
+    async def _settle_outbox(self, rows: list[Row], published: int) -> None:
+        """Delete the first ``published`` claimed events and release the claim on the rest."""
         session = db_manager.get_session()
         async with session as s:
             try:
-                result = await s.execute(select(func.count(TodoDB.id)))
-                return result.scalar() or 0
+                if published:
+                    # Delete by id: an event committed late with a lower id was not part of this batch
+                    published_ids = [row.id for row in rows[:published]]
+                    await s.execute(delete(TodoOutboxDB).where(TodoOutboxDB.id.in_(published_ids)))
+                if published < len(rows):
+                    # Only our own claim: after it expired, another relay may have claimed the events anew
+                    await s.execute(
+                        update(TodoOutboxDB)
+                        .where(
+                            TodoOutboxDB.id.in_([row.id for row in rows[published:]]),
+                            TodoOutboxDB.claimed_until == rows[0].claimed_until,
+                        )
+                        .values(claimed_until=None)
+                        .execution_options(synchronize_session=False)
+                    )
+                await s.commit()
             except Exception:
                 await s.rollback()
                 raise
 
+    # Not @instrumented: the get_todo_stats call records the operation and its span
+    async def count_todos(self, exact: bool = False) -> int:
+        """Count total number of todos.
+
+        Reads the trigger-maintained ``todo_stats`` row in O(1); ``exact=True`` scans the table.
+        """
+        return (await self.get_todo_stats(exact))["total"]
+
+    @instrumented
+    async def get_todo_stats(self, exact: bool = False) -> dict[str, int]:
+        """Get total, done and not-done counts from ``todo_stats``, or by scanning todos if ``exact``.
+
+        Falls back to a scan if the stats row is missing, e.g. on a database without the triggers.
+        """
+        if not exact:
+            result = await self._read(
+                select(TodoStatsDB.total, TodoStatsDB.done).where(TodoStatsDB.id == TODO_STATS_ROW_ID)
+            )
+            row = result.one_or_none()
+            if row is not None:
+                return self._stats_dict(row.total, row.done)
+
+        result = await self._read(
+            select(func.count(TodoDB.id), func.count(TodoDB.id).filter(TodoDB.completed.is_(True)))
+        )
+        total, done = result.one()
+        return self._stats_dict(total, done)
+
+    @staticmethod
+    def _stats_dict(total: int, done: int) -> dict[str, int]:
+        """Build the counts dict returned by ``get_todo_stats``."""
+        return {"total": total, "done": done, "not_done": total - done}
+
+    @instrumented
+    async def get_todos_version(self) -> TodoVersion | None:
+        """Get the collection version from the ``todo_stats`` row in O(1).
+
+        None if the stats row is missing, e.g. on a database without the triggers.
+        """
+        result = await self._read(self._version_query())
+        return self._to_version(result.one_or_none())
+
+    @staticmethod
+    def _version_query() -> Select:
+        """Select the change sequence and last change time of the todo collection."""
+        return select(TodoStatsDB.version, TodoStatsDB.changed_at).where(TodoStatsDB.id == TODO_STATS_ROW_ID)
+
+    @staticmethod
+    def _to_version(row: Row | None) -> TodoVersion | None:
+        """Build a ``TodoVersion`` from a ``_version_query`` row."""
+        return TodoVersion(row.version, row.changed_at) if row is not None else None
+
+    async def _read(self, query: Select) -> Result:
+        """Execute a read-only query on a read replica when available, falling back to the primary."""
+        (result,) = await self._read_all(query)
+        return result
+
+    async def _read_all(self, *queries: Select) -> list[Result]:
+        """Execute read-only queries in order on one session, with the same fallback as ``_read``.
+
+        Running a version query first on the same session guarantees the rows that follow are
+        at least as new as that version, even when replicas lag by different amounts.
+        """
+        session, replica = db_manager.get_read_session()
+        try:
+            async with session as s:
+                return [await s.execute(query) for query in queries]
+        except Exception as e:
+            if replica is None or not db_manager.is_connection_error(e):
+                raise
+            db_manager.mark_replica_unhealthy(replica, e)
+
+        session = db_manager.get_session()
+        async with session as s:
+            return [await s.execute(query) for query in queries]
+
+    @staticmethod
+    def _parse_id(todo_id: str) -> int | None:
+        """Convert an API string ID to an integer, or None if it is not a valid ID."""
+        try:
+            value = int(todo_id)
+        except ValueError:
+            return None
+        # Outside the id column's range Postgres rejects the parameter; no row can match anyway
+        return value if TODO_ID_MIN <= value <= TODO_ID_MAX else None
+
+    @classmethod
+    def _parse_ids(cls, todo_ids: list[str]) -> list[int]:
+        """Convert API string IDs to integers, dropping any that are not valid IDs."""
+        return [value for value in map(cls._parse_id, todo_ids) if value is not None]
+
+    @staticmethod
+    def _ids_param(ids: list[int]):
+        """Bind an ID list as a single Postgres array parameter for ``= ANY(:ids)``."""
+        return bindparam("ids", ids, type_=ARRAY(Integer))
+
+    @staticmethod
+    def _rows_to_json(rows: Sequence[Row]) -> bytes:
+        """Encode ``TODO_JSON_COLUMNS`` rows as a JSON array of todos in the ``Todo`` response shape.
+
+        pydantic_core renders datetimes exactly like the ``response_model`` path does.
+        """
+        done, not_done = TodoStatus.DONE.value, TodoStatus.NOT_DONE.value
+        return to_json(
+            [
+                {
+                    "id": str(todo_id),
+                    "text": text,
+                    "status": done if completed else not_done,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                }
+                for todo_id, text, completed, created_at, updated_at in rows
+            ]
+        )
+
     def _db_to_pydantic(self, todo_db: TodoDB) -> Todo:
         """Convert database model to Pydantic model."""
         status = TodoStatus.DONE if todo_db.completed else TodoStatus.NOT_DONE
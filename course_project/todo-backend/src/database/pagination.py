@@ -0,0 +1,38 @@
+"""Keyset (cursor) pagination helpers for todo listings.
+
+Pages are ordered by ``(created_at DESC, id DESC)``. A cursor encodes the sort key of the
+last row on a page, so the next page is a single index range scan no matter how deep the
+client has paged. Cursors are opaque to clients: URL-safe base64 over a small JSON payload.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from .models import TODO_ID_MAX, TODO_ID_MIN
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, todo_id: int | str) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    payload = json.dumps([created_at.isoformat(), int(todo_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode an opaque cursor back into its ``(created_at, id)`` sort key."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, todo_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(created_at_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if not isinstance(todo_id, int) or isinstance(todo_id, bool) or not TODO_ID_MIN <= todo_id <= TODO_ID_MAX:
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    return created_at, todo_id
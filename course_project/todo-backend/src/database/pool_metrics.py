@@ -0,0 +1,89 @@
+"""Connection pool instrumentation for the async SQLAlchemy engines.
+
+``InstrumentedAsyncQueuePool`` is a drop-in ``AsyncAdaptedQueuePool`` that times every checkout
+(queue wait, new-connection setup and pre-ping) and counts checkout timeouts. Measurements go to
+the metrics registry, labelled with the engine's ``pool_logging_name`` so they survive
+``pool.recreate()``. The occupancy gauges are set from ``DatabaseManager.pool_stats()`` on each
+scrape of ``GET /metrics``.
+"""
+
+import logging
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..observability.metrics import registry
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Occupancy gauges by pool_stats() key, set from the live pools on each scrape
+POOL_GAUGES = {
+    "size": registry.gauge("todo_backend_db_pool_size", "Connections kept open by the pool", ("pool",)),
+    "checked_out": registry.gauge("todo_backend_db_pool_checked_out", "Connections currently in use", ("pool",)),
+    "checked_in": registry.gauge(
+        "todo_backend_db_pool_checked_in", "Idle connections available in the pool", ("pool",)
+    ),
+    "overflow": registry.gauge("todo_backend_db_pool_overflow", "Connections open beyond the pool size", ("pool",)),
+    "max_overflow": registry.gauge("todo_backend_db_pool_max_overflow", "Configured overflow limit", ("pool",)),
+}
+POOL_CHECKOUTS = registry.counter("todo_backend_db_pool_checkouts_total", "Successful connection checkouts", ("pool",))
+POOL_TIMEOUTS = registry.counter(
+    "todo_backend_db_pool_timeouts_total", "Checkouts that timed out waiting for a connection", ("pool",)
+)
+POOL_WAIT_SECONDS = registry.histogram(
+    "todo_backend_db_pool_wait_seconds", "Time spent waiting to check out a connection", ("pool",), WAIT_TIME_BUCKETS
+)
+
+
+class PoolMetrics:
+    """Checkout counters and wait-time histogram of one connection pool, bound to its ``pool`` label."""
+
+    def __init__(self, name: str):
+        """Bind the pool's series."""
+        self.name = name
+        self.wait_seconds = POOL_WAIT_SECONDS.labels(name)
+        self.checkouts = POOL_CHECKOUTS.labels(name)
+        self.timeouts = POOL_TIMEOUTS.labels(name)
+
+    def observe_wait(self, seconds: float) -> None:
+        """Record a successful checkout and how long it took."""
+        self.checkouts.inc()
+        self.wait_seconds.observe(seconds)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after ``pool_timeout``."""
+        self.timeouts.inc()
+
+
+# Metrics per pool name, bound once per name
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    """Get or create the metrics for a pool name."""
+    metrics = pool_metrics.get(name)
+    if metrics is None:
+        metrics = pool_metrics[name] = PoolMetrics(name)
+    return metrics
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time and timeouts."""
+
+    def connect(self):
+        """Check out a connection, timing the wait."""
+        metrics = get_pool_metrics(self._orig_logging_name or "default")
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            metrics.record_timeout()
+            raise
+        metrics.observe_wait(time.perf_counter() - start)
+        return connection
+
+
+# SQLAlchemy names pool loggers after the pool class; keep ours as quiet as its own "sqlalchemy.pool" loggers
+logging.getLogger(f"{__name__}.{InstrumentedAsyncQueuePool.__name__}").setLevel(logging.WARNING)
@@ -0,0 +1,83 @@
+"""Wire format of todo events, shared by todo-backend (producer) and broadcaster (consumer).
+
+An event is the todo's fields plus ``action`` (``created``, ``updated`` or ``deleted``). The
+envelope lives in NATS headers, so the body stays the event itself:
+
+- ``Todo-Event-Version``: schema version of the body, currently 1
+- ``Content-Type``: ``application/json`` (compact JSON written by orjson) or ``application/msgpack``
+
+Messages without these headers are version 1 JSON, as published before the envelope existed.
+A consumer rejects versions newer than it knows with ``UnsupportedEventError``, so an older
+replica can hand the event back for a newer one during a rolling deploy.
+
+This module is copied verbatim into both services, which are built separately. Change both
+copies together; todo-backend's unit tests check that they are identical.
+"""
+
+from collections.abc import Mapping
+from enum import StrEnum
+from typing import Any
+
+import msgpack
+import orjson
+
+TODO_EVENT_VERSION = 1
+VERSION_HEADER = "Todo-Event-Version"
+CONTENT_TYPE_HEADER = "Content-Type"
+
+
+class EventEncoding(StrEnum):
+    """Body encodings a producer can choose; consumers decode all of them."""
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+    @property
+    def content_type(self) -> str:
+        """Value of the ``Content-Type`` header for this encoding."""
+        return f"application/{self.value}"
+
+
+_ENCODING_BY_CONTENT_TYPE = {encoding.content_type: encoding for encoding in EventEncoding}
+
+
+class InvalidEventError(ValueError):
+    """The event body cannot be decoded; retrying will not help."""
+
+
+class UnsupportedEventError(ValueError):
+    """The event uses a schema version or encoding this consumer does not know."""
+
+
+def encode_event(message: dict[str, Any], encoding: EventEncoding = EventEncoding.JSON) -> tuple[bytes, dict[str, str]]:
+    """Encode an event message; returns the body and the envelope headers to publish it with."""
+    if encoding is EventEncoding.MSGPACK:
+        body = msgpack.packb(message)
+    else:
+        body = orjson.dumps(message)
+    return body, {VERSION_HEADER: str(TODO_EVENT_VERSION), CONTENT_TYPE_HEADER: encoding.content_type}
+
+
+def decode_event(data: bytes, headers: Mapping[str, str] | None = None) -> dict[str, Any]:
+    """Decode an event body according to its envelope headers.
+
+    Raises UnsupportedEventError for an unknown version or content type, and InvalidEventError
+    when the body is not a valid event in the declared encoding.
+    """
+    headers = headers or {}
+    version = headers.get(VERSION_HEADER, str(TODO_EVENT_VERSION))
+    if not version.isdigit() or not 1 <= int(version) <= TODO_EVENT_VERSION:
+        raise UnsupportedEventError(f"Unsupported todo event version {version!r}")
+
+    content_type = headers.get(CONTENT_TYPE_HEADER, EventEncoding.JSON.content_type)
+    encoding = _ENCODING_BY_CONTENT_TYPE.get(content_type)
+    if encoding is None:
+        raise UnsupportedEventError(f"Unsupported todo event content type {content_type!r}")
+
+    try:
+        message = msgpack.unpackb(data) if encoding is EventEncoding.MSGPACK else orjson.loads(data)
+    except ValueError as e:  # orjson.JSONDecodeError and msgpack's unpack errors are ValueErrors
+        raise InvalidEventError(f"Malformed {encoding} todo event: {e}") from e
+    if not isinstance(message, dict):
+        raise InvalidEventError(f"Todo event must be a map, got {type(message).__name__}")
+    return message
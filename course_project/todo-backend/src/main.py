@@ -1,8 +1,10 @@
 """Todo Backend API - Main application."""
 
 # Trigger CI/CD pipeline test - Azure Files ReadWriteMany backend update
+import asyncio
 import logging
 import sys
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -21,73 +23,111 @@ from src.api.error_handlers import (
     custom_server_error_handler,
     custom_validation_error_handler,
 )
-from src.api.routes import health, todos
+from src.api.routes import health, metrics, todos, traces
+from src.config.logging_setup import configure_logging
 from src.config.settings import settings
 from src.database.connection import db_manager
-from src.middleware.request_logging import RequestLoggingMiddleware
-from src.middleware.security import SecurityHeadersMiddleware, XSSProtectionMiddleware
+from src.middleware.api_middleware import APIMiddleware
+from src.middleware.compression import CompressionMiddleware
+from src.middleware.log_sampling import RequestLogSampler
+from src.observability.multiprocess import WorkerMetricsSnapshots
+from src.observability.tracing import configure_tracing
+from src.services.health_monitor import health_monitor
 from src.services.nats_service import NATSService
+from src.services.outbox_relay import outbox_relay
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
+# Configure logging: records are written by a background thread, never on the event loop
+configure_logging(settings.log_level, settings.log_queue_size)
+
+# Spans go to an in-memory ring buffer and optionally a file; tracing is off with neither
+configure_tracing("todo-backend", settings.tracing_buffer_size, settings.tracing_file)
 
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan handler for startup and shutdown."""
-    # Startup
-    logger.info("Starting up todo backend...")
-
+async def start_database() -> bool:
+    """Apply the schema if its version marker is stale and pre-warm the pool; False means degraded mode."""
     # Attempt to initialize database, but do not crash on failure
     try:
         await db_manager.initialize()
+        await db_manager.prewarm()
     except Exception as e:
         logger.warning(f"Database initialization failed: {e}")
         logger.warning("Application starting in degraded mode - health probes will handle database connectivity")
-    else:
-        # Check database health with graceful degradation
+        return False
+
+    logger.info(f"Database initialized, pool pre-warmed with {settings.db_pool_size} connections")
+
+    # Sample data is opt-in; normally seeded once by the `python -m src.seed` job
+    if settings.seed_sample_data:
         try:
-            is_db_healthy = await db_manager.health_check(max_retries=3)
-            if not is_db_healthy:
-                logger.warning("Database not immediately available - starting in degraded mode")
-                logger.warning(
-                    "Application will continue startup, database connectivity will be verified by health probes"
-                )
-            else:
-                logger.info("Database initialized and health check passed")
-
-                # Only initialize sample data if database is available
-                todo_service = get_todo_service()
-                await todo_service.initialize_with_sample_data()
-                logger.info("Sample data initialized")
+            await get_todo_service().initialize_with_sample_data()
+            logger.info("Sample data initialized")
         except Exception as e:
-            logger.warning(f"Database health check had issues: {e}")
-            logger.warning("Application starting in degraded mode - health probes will handle database connectivity")
+            logger.warning(f"Sample data initialization failed: {e}")
+    return True
 
-    # Initialize NATS service in app.state
+
+async def start_nats() -> NATSService | None:
+    """Connect to NATS and subscribe to todo events; None if NATS is unavailable."""
     try:
         nats_service = NATSService()
-        nats_connected = await nats_service.connect()
-        if nats_connected:
-            app.state.nats_service = nats_service
+        if await nats_service.connect():
             logger.info("✅ NATS service connected and stored in app.state")
-        else:
-            app.state.nats_service = None
-            logger.warning("❌ NATS connection failed - stored None in app.state")
+
+            # Keep the read cache coherent with writes made on other replicas
+            await nats_service.subscribe_todo_events(get_todo_service().handle_todo_event)
+            return nats_service
+        logger.warning("❌ NATS connection failed - stored None in app.state")
     except Exception as e:
         logger.warning(f"❌ NATS service initialization failed: {e}")
-        app.state.nats_service = None
+    return None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler for startup and shutdown."""
+    # Startup
+    started = time.perf_counter()
+    logger.info("Starting up todo backend...")
+
+    # Database and NATS setup are independent, so run them side by side
+    database_ready, nats_service = await asyncio.gather(start_database(), start_nats())
+    app.state.nats_service = nats_service
+
+    # Probes read the monitor's cached status instead of checking dependencies themselves
+    health_monitor.nats_service = nats_service
+    health_monitor.start()
+
+    # Events queued by writes are published to NATS in the background
+    if settings.outbox_enabled:
+        outbox_relay.nats_service = nats_service
+        outbox_relay.start()
+
+    # Under several workers, each one shares its metrics through files that /metrics sums
+    if settings.metrics_multiproc_dir:
+        app.state.metrics_snapshots = WorkerMetricsSnapshots(
+            settings.metrics_multiproc_dir,
+            settings.metrics_flush_interval_seconds,
+            lambda: metrics.render_metrics(app.state.nats_service),
+        )
+        app.state.metrics_snapshots.start()
+
+    logger.info(
+        f"Startup complete in {(time.perf_counter() - started) * 1000:.0f} ms "
+        f"(database: {'ready' if database_ready else 'degraded'}, "
+        f"nats: {'connected' if nats_service else 'unavailable'})"
+    )
 
     yield
 
     # Shutdown
     logger.info("Shutting down todo backend...")
+    await health_monitor.stop()
+    await outbox_relay.stop()
+    metrics_snapshots = getattr(app.state, "metrics_snapshots", None)
+    if metrics_snapshots:
+        await metrics_snapshots.stop()
 
     # Shutdown NATS service from app.state
     nats_service = getattr(app.state, "nats_service", None)
@@ -121,12 +161,18 @@ def create_app() -> FastAPI:
     app.add_exception_handler(404, custom_404_handler)
     app.add_exception_handler(Exception, custom_server_error_handler)
 
-    # Add security middleware (should be first for security headers)
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(XSSProtectionMiddleware)
-
-    # Add request logging middleware
-    app.add_middleware(RequestLoggingMiddleware)
+    # Add security headers, cache policy and request logging in one pure ASGI layer
+    app.add_middleware(
+        APIMiddleware,
+        default_cache_control=settings.default_cache_control,
+        sampler=RequestLogSampler(
+            sample_rate=settings.request_log_sample_rate,
+            route_sample_rates=settings.request_log_route_sample_rates_map,
+            exclude_paths=settings.request_log_exclude_paths_set,
+            slow_request_ms=settings.request_log_slow_ms,
+            target_per_second=settings.request_log_target_per_second,
+        ),
+    )
 
     # Add CORS middleware
     app.add_middleware(
@@ -137,9 +183,20 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Add response compression last so it wraps every other middleware
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            encodings=settings.compression_encodings_list,
+            levels=settings.compression_levels,
+        )
+
     # Include routers
     app.include_router(health.router)
     app.include_router(todos.router)
+    app.include_router(metrics.router)
+    app.include_router(traces.router)
 
     return app
 
@@ -150,7 +207,8 @@ app = create_app()
 
 def main():
     """Run the server."""
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    # log_config=None keeps uvicorn's own loggers on the queued root handler
+    uvicorn.run(app, host=settings.host, port=settings.port, log_config=None)
 
 
 if __name__ == "__main__":
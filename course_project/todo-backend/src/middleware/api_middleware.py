@@ -0,0 +1,208 @@
+"""Security headers, JSON cache policy, correlation IDs and request logging in one pure ASGI layer.
+
+Replaces the ``SecurityHeadersMiddleware``, ``XSSProtectionMiddleware`` and
+``RequestLoggingMiddleware`` stack. Each ``BaseHTTPMiddleware`` runs the rest of the app in a
+separate task and relays the body through a memory stream; this middleware only edits the
+headers of the ``http.response.start`` message and passes body messages through untouched, so
+``/todos/stream`` chunks reach the client as soon as they are produced.
+
+Each request is logged once, when its response is complete: one record with the request fields,
+the status, ``response_time_ms`` and the error classification (``event`` is ``RESPONSE`` or the
+error event). A ``sampler`` can skip records; each logged one carries its ``sample_weight`` (see
+``src.middleware.log_sampling``). The record is a ``JSONMessage``, so it is encoded by the logging
+writer thread (see ``src.config.logging_setup``), not on the event loop.
+
+It also records the request metrics: latency per method and route template, responses per
+status code, and requests in flight. Requests that match no route share one ``<unmatched>``
+label and unknown methods share ``OTHER``, so clients cannot grow the number of series.
+
+Every request runs in a ``SERVER`` span named after its method and route template, continuing
+the caller's trace if it sent a ``traceparent`` header. The span carries the request ID, and the
+request log record carries the trace ID, so logs, traces and X-Request-ID can be joined.
+"""
+
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config.logging_setup import JSONMessage
+from ..observability.metrics import registry
+from ..observability.tracing import TRACEPARENT_HEADER, SpanKind, tracer
+from .log_sampling import RequestLogSampler
+from .request_logging import LogEvent, classify_error, client_ip
+from .security import DEFAULT_CSP_POLICY, security_headers
+
+# Same logger as RequestLoggingMiddleware, so existing handlers and dashboards keep working
+request_logger = logging.getLogger("request_logger")
+
+# Route label of requests no route matched, and method label of non-standard methods
+UNMATCHED_ROUTE = "<unmatched>"
+OTHER_METHOD = "OTHER"
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "todo_backend_http_request_duration_seconds",
+    "Time from receiving a request to the end of its response",
+    ("method", "route"),
+)
+HTTP_RESPONSES = registry.counter(
+    "todo_backend_http_responses_total", "Responses by route and status code", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "todo_backend_http_requests_in_flight", "Requests being handled by this process"
+).labels()
+
+
+class APIMiddleware:
+    """Adds security headers, Cache-Control and X-Request-ID to every response and logs it.
+
+    Args:
+        app: ASGI application to wrap
+        default_cache_control: Cache-Control for JSON GET responses of routes without their own policy
+        csp_policy: Content Security Policy, uses the strict API default if None
+        sampler: Decides which requests are logged; every request is logged if None
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_cache_control: str = "no-cache, no-store, must-revalidate",
+        csp_policy: str | None = None,
+        sampler: RequestLogSampler | None = None,
+    ):
+        self.app = app
+        self.sampler = sampler
+        self.default_cache_control = default_cache_control.encode("latin-1")
+
+        # Encoded once; every response replaces any header of the same name the route set
+        self._security_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in security_headers(csp_policy or DEFAULT_CSP_POLICY).items()
+        ]
+        self._replaced = {name for name, _ in self._security_headers} | {b"x-request-id"}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        timestamp = time.time()
+        request_headers = Headers(scope=scope)
+        request_id = request_headers.get("x-request-id") or str(uuid.uuid4())
+        status_code = 500  # Reported if the app fails before starting a response
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        span = tracer.start_span(
+            scope["method"],
+            SpanKind.SERVER,
+            {"request_id": request_id, "http.request.method": scope["method"], "url.path": scope["path"]},
+            request_headers.get(TRACEPARENT_HEADER),
+        )
+        span_token = tracer.activate(span)
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = self._response_headers(scope, message, request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            duration = time.perf_counter() - start_time
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the shared scope; its template keeps the labels bounded
+            route = getattr(scope.get("route"), "path", None)
+            method = scope["method"] if scope["method"] in _METHODS else OTHER_METHOD
+            HTTP_REQUEST_SECONDS.labels(method, route or UNMATCHED_ROUTE).observe(duration)
+            HTTP_RESPONSES.labels(method, route or UNMATCHED_ROUTE, status_code).inc()
+
+            tracer.deactivate(span_token)
+            if route:
+                span.update_name(f"{scope['method']} {route}")
+                span.set_attribute("http.route", route)
+            span.set_attribute("http.response.status_code", status_code)
+            if status_code >= 500:
+                span.set_error(f"HTTP {status_code}")
+            tracer.end_span(span)
+
+            if request_logger.isEnabledFor(logging.INFO):
+                duration_ms = round(duration * 1000, 2)
+                if self.sampler is None:
+                    sample_weight = 1.0
+                else:
+                    sample_weight = self.sampler.weight(scope["path"], route, status_code, duration_ms)
+                if sample_weight is not None:
+                    self._log_request(
+                        scope,
+                        request_headers,
+                        request_id,
+                        span.trace_id,
+                        timestamp,
+                        duration_ms,
+                        status_code,
+                        sample_weight,
+                    )
+
+    def _log_request(
+        self,
+        scope: Scope,
+        request_headers: Headers,
+        request_id: str,
+        trace_id: str | None,
+        timestamp: float,
+        duration_ms: float,
+        status_code: int,
+        sample_weight: float,
+    ) -> None:
+        """Log one record describing the request and its response; it is JSON-encoded off the event loop."""
+        client = scope.get("client")
+        record = {
+            "request_id": request_id,
+            "trace_id": trace_id,
+            "event": LogEvent.RESPONSE.value,
+            "timestamp": timestamp,
+            "method": scope["method"],
+            "path": scope["path"],
+            "query_params": scope.get("query_string", b"").decode("latin-1") or None,
+            "user_agent": request_headers.get("user-agent"),
+            "client_ip": client_ip(request_headers, client[0] if client else None),
+            "status_code": status_code,
+            "response_time_ms": duration_ms,
+            "sample_weight": sample_weight,
+        }
+        error_info = classify_error(status_code)
+        if error_info:
+            record.update(error_info)
+        request_logger.info(JSONMessage(record))
+
+    def _response_headers(self, scope: Scope, message: Message, request_id: str) -> list[tuple[bytes, bytes]]:
+        """Return the response's raw headers with security headers, Cache-Control and X-Request-ID applied."""
+        headers = []
+        is_json = False
+        for name, value in message.get("headers", ()):
+            if name == b"content-type":
+                is_json = value.startswith(b"application/json")
+            if name not in self._replaced:
+                headers.append((name, value))
+        headers.extend(self._security_headers)
+        headers.append((b"x-request-id", request_id.encode("latin-1")))
+
+        if scope["method"] == "GET":
+            # Routes declare their policy with the cache_control() dependency; it also covers their 304s
+            route_policy = scope.get("state", {}).get("cache_control")
+            if route_policy and message["status"] in (200, 304):
+                cache_control = route_policy.encode("latin-1")
+            elif is_json:
+                # Prevent JSON hijacking
+                cache_control = self.default_cache_control
+            else:
+                return headers
+            headers = [(name, value) for name, value in headers if name != b"cache-control"]
+            headers.append((b"cache-control", cache_control))
+        return headers
@@ -0,0 +1,286 @@
+"""Response compression negotiated via Accept-Encoding: zstd, brotli or gzip.
+
+A pure ASGI middleware, so streamed responses (such as the backend's ``/todos/stream``) are
+compressed chunk by chunk and flushed after every chunk instead of being buffered. Responses
+below ``minimum_size``, with a content type that does not compress well (such as the app's hourly
+image), or already encoded are passed through unchanged.
+
+gzip uses the standard library; ``br`` and ``zstd`` need the ``brotli`` and ``zstandard``
+packages and are only offered when they can be imported.
+
+This module is copied verbatim into todo-backend and todo-app; a test checks that the copies match.
+"""
+
+import logging
+import zlib
+from collections.abc import Callable
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the installed extras
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the installed extras
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Content types worth compressing; images and other binary formats are already compressed
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class Encoder(Protocol):
+    """Incremental compressor for one response body."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk; output may be buffered until ``flush`` or ``finish``."""
+
+    def flush(self) -> bytes:
+        """Emit everything compressed so far, so a streamed chunk reaches the client now."""
+
+    def finish(self) -> bytes:
+        """End the stream and return the remaining output."""
+
+
+class GzipEncoder:
+    """gzip via zlib."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    """Brotli via the ``brotli`` package."""
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    """Zstandard via the ``zstandard`` package."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encoders() -> dict[str, type[Encoder]]:
+    """Content codings this process can produce, by ``Content-Encoding`` token."""
+    encoders: dict[str, type[Encoder]] = {"gzip": GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, preference: list[str]) -> str | None:
+    """Pick the coding the client accepts with the highest q-value; ties go to ``preference`` order.
+
+    Returns None for identity, including when nothing in ``preference`` is acceptable.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = None, 0.0
+    for coding in preference:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Compress response bodies with the best coding both sides support.
+
+    Args:
+        app: ASGI application to wrap
+        minimum_size: Bodies smaller than this many bytes are sent as is
+        encodings: Codings to offer, most preferred first; unavailable ones are skipped
+        levels: Compression level per coding; e.g. gzip 1-9, br 0-11, zstd 1-22
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, encodings: list[str], levels: dict[str, int]):
+        self.app = app
+        self.minimum_size = minimum_size
+        supported = available_encoders()
+        self.encoders = {coding: supported[coding] for coding in encodings if coding in supported}
+        self.preference = list(self.encoders)
+        self.levels = levels
+
+        missing = [coding for coding in encodings if coding not in supported]
+        if missing:
+            logger.warning(f"Response compression: {', '.join(missing)} not available, package not installed")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # HEAD responses carry the identity Content-Length and no body to compress
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.encoders:
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.preference)
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(
+            send, coding, lambda: self.encoders[coding](self.levels[coding]), self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Wraps ``send`` for one response and compresses its body when worthwhile.
+
+    A response with a ``Content-Length`` is buffered and compressed in one go, even when an inner
+    ``BaseHTTPMiddleware`` re-sends it in several messages; its size decides whether compressing
+    pays off. Without a length the body is a real stream and every chunk is compressed and
+    flushed as it arrives.
+    """
+
+    def __init__(self, send: Send, coding: str, make_encoder: Callable[[], Encoder], minimum_size: int):
+        self._send = send
+        self._coding = coding
+        self._make_encoder = make_encoder
+        self._minimum_size = minimum_size
+
+        self._start: Message | None = None
+        self._passthrough = False
+        self._buffer: list[bytes] | None = None
+        self._encoder: Encoder | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await self._on_start(message)
+        elif message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+        elif self._buffer is not None:
+            await self._on_buffered_body(message)
+        else:
+            await self._on_streamed_body(message)
+
+    async def _on_start(self, message: Message) -> None:
+        """Decide between pass-through, buffered and streamed compression from the headers."""
+        headers = Headers(raw=message["headers"])
+        if not self._should_compress(headers):
+            self._passthrough = True
+            await self._send(message)
+            return
+
+        # Even a body too small to compress varies by Accept-Encoding for caches
+        MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+        content_length = headers.get("content-length")
+        if content_length is not None and int(content_length) < self._minimum_size:
+            self._passthrough = True
+            await self._send(message)
+            return
+
+        # Hold the start until the compressed length (or the lack of one) is known
+        self._start = message
+        if content_length is not None:
+            self._buffer = []
+
+    async def _on_buffered_body(self, message: Message) -> None:
+        """Collect a body of known length and send it compressed once complete."""
+        self._buffer.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        encoder = self._make_encoder()
+        compressed = encoder.compress(b"".join(self._buffer)) + encoder.finish()
+        self._buffer = []
+        self._set_encoding_headers(len(compressed))
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _on_streamed_body(self, message: Message) -> None:
+        """Compress a body of unknown length chunk by chunk, flushing each chunk to the client."""
+        if self._encoder is None:
+            self._encoder = self._make_encoder()
+            self._set_encoding_headers(None)
+            await self._send(self._start)
+
+        body = message.get("body", b"")
+        if message.get("more_body", False):
+            chunk = self._encoder.compress(body) + self._encoder.flush()
+            if chunk:
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            await self._send(
+                {"type": "http.response.body", "body": self._encoder.compress(body) + self._encoder.finish()}
+            )
+
+    def _should_compress(self, headers: Headers) -> bool:
+        """Only compress compressible content that is not already encoded or marked no-transform."""
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _set_encoding_headers(self, content_length: int | None) -> None:
+        """Describe the compressed representation in the held response start."""
+        headers = MutableHeaders(raw=self._start["headers"])
+        headers["Content-Encoding"] = self._coding
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+
+        # A compressed body is a different byte sequence, so a strong validator must not be reused
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
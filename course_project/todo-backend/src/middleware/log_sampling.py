@@ -0,0 +1,81 @@
+"""Decides which requests ``APIMiddleware`` logs, and with what sample weight.
+
+- Errors (status >= 400) and slow requests are always logged.
+- Successful requests to excluded paths (the Kubernetes probes by default) are never logged.
+- Other successes are logged with probability ``rate``: the per-route rate if one is configured,
+  otherwise the default rate. When ``target_per_second`` is set and the successes that could be
+  logged arrive faster than that, every rate is scaled down for the next window to meet it.
+
+A logged record carries ``sample_weight = 1 / rate``, so dashboards that sum the weights instead
+of counting lines still see the real request counts. Sampling state is per process.
+"""
+
+import random
+import time
+
+# Length of the window over which throughput is measured for the adaptive rate
+ADAPTIVE_WINDOW_SECONDS = 1.0
+
+
+class RequestLogSampler:
+    """Per-request log decision with probe exclusion, per-route rates and an adaptive throughput cap.
+
+    Args:
+        sample_rate: Fraction of successful requests logged, 0 to 1
+        route_sample_rates: Rates overriding ``sample_rate`` per route template (e.g. ``/todos/{todo_id}``)
+        exclude_paths: Paths whose successful requests are never logged
+        slow_request_ms: Requests at least this slow are always logged
+        target_per_second: Most sampled success records per second before rates adapt; 0 disables
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        route_sample_rates: dict[str, float] | None = None,
+        exclude_paths: frozenset[str] | set[str] = frozenset(),
+        slow_request_ms: float = 1000.0,
+        target_per_second: float = 0.0,
+        clock=time.monotonic,
+        random_value=random.random,
+    ):
+        self.sample_rate = sample_rate
+        self.route_sample_rates = route_sample_rates or {}
+        self.exclude_paths = frozenset(exclude_paths)
+        self.slow_request_ms = slow_request_ms
+        self.target_per_second = target_per_second
+        self._clock = clock
+        self._random = random_value
+
+        self.adaptive_factor = 1.0
+        self._window_start = clock()
+        self._window_candidates = 0.0
+
+    def weight(self, path: str, route: str | None, status_code: int, duration_ms: float) -> float | None:
+        """Return the sample weight to log this request with, or None to skip it."""
+        if status_code >= 400 or duration_ms >= self.slow_request_ms:
+            return 1.0
+        if path in self.exclude_paths:
+            return None
+
+        rate = self.route_sample_rates.get(route, self.sample_rate) if route else self.sample_rate
+        if self.target_per_second > 0:
+            # Records this success would produce at the configured rate, before adapting
+            self._observe(rate)
+            rate *= self.adaptive_factor
+
+        if rate >= 1.0:
+            return 1.0
+        if rate <= 0.0 or self._random() >= rate:
+            return None
+        return 1.0 / rate
+
+    def _observe(self, expected_records: float) -> None:
+        """Count a candidate record; at the end of each window, rescale rates to the target throughput."""
+        now = self._clock()
+        elapsed = now - self._window_start
+        if elapsed >= ADAPTIVE_WINDOW_SECONDS:
+            per_second = self._window_candidates / elapsed
+            self.adaptive_factor = min(1.0, self.target_per_second / per_second) if per_second else 1.0
+            self._window_start = now
+            self._window_candidates = 0.0
+        self._window_candidates += expected_records
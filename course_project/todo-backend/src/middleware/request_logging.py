@@ -8,7 +8,7 @@ import json
 import logging
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from enum import Enum
 
 from fastapi import Request, Response
@@ -38,8 +38,69 @@ class LogEvent(Enum):
     SERVER_ERROR = "SERVER_ERROR"
 
 
+def classify_error(status_code: int) -> dict | None:
+    """Classify HTTP status codes for error monitoring.
+
+    Args:
+        status_code: HTTP status code
+
+    Returns:
+        Dictionary with error classification or None for success codes
+    """
+    if status_code < 400:
+        return None
+
+    # Define error classification mapping
+    error_classifications = {
+        422: (ErrorType.VALIDATION_ERROR, LogEvent.VALIDATION_ERROR),
+        404: (ErrorType.NOT_FOUND, LogEvent.NOT_FOUND_ERROR),
+    }
+
+    # Check for specific error codes first
+    if status_code in error_classifications:
+        error_type, log_event = error_classifications[status_code]
+        return {
+            "error": True,
+            "error_type": error_type.value,
+            "event": log_event.value,
+        }
+
+    # Fall back to range-based classification
+    if status_code >= 500:
+        return {
+            "error": True,
+            "error_type": ErrorType.SERVER_ERROR.value,
+            "event": LogEvent.SERVER_ERROR.value,
+        }
+    elif status_code >= 400:
+        return {
+            "error": True,
+            "error_type": ErrorType.CLIENT_ERROR.value,
+            "event": LogEvent.CLIENT_ERROR.value,
+        }
+
+    return None
+
+
+def client_ip(headers: Mapping[str, str], client_host: str | None) -> str:
+    """Extract the client IP address from proxy headers, falling back to the peer address."""
+    # Check for forwarded headers (common in production)
+    forwarded_for = headers.get("X-Forwarded-For")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+
+    real_ip = headers.get("X-Real-IP")
+    if real_ip:
+        return real_ip
+
+    return client_host or "unknown"
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests and responses with structured data."""
+    """Middleware to log all HTTP requests and responses with structured data.
+
+    The application uses ``APIMiddleware``, which does this in a single pure ASGI layer.
+    """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and log details."""
@@ -105,61 +166,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         return str(uuid.uuid4())
 
     def _classify_error(self, status_code: int) -> dict | None:
-        """Classify HTTP status codes for error monitoring.
-
-        Args:
-            status_code: HTTP status code
-
-        Returns:
-            Dictionary with error classification or None for success codes
-        """
-        if status_code < 400:
-            return None
-
-        # Define error classification mapping
-        error_classifications = {
-            422: (ErrorType.VALIDATION_ERROR, LogEvent.VALIDATION_ERROR),
-            404: (ErrorType.NOT_FOUND, LogEvent.NOT_FOUND_ERROR),
-        }
-
-        # Check for specific error codes first
-        if status_code in error_classifications:
-            error_type, log_event = error_classifications[status_code]
-            return {
-                "error": True,
-                "error_type": error_type.value,
-                "event": log_event.value,
-            }
-
-        # Fall back to range-based classification
-        if status_code >= 500:
-            return {
-                "error": True,
-                "error_type": ErrorType.SERVER_ERROR.value,
-                "event": LogEvent.SERVER_ERROR.value,
-            }
-        elif status_code >= 400:
-            return {
-                "error": True,
-                "error_type": ErrorType.CLIENT_ERROR.value,
-                "event": LogEvent.CLIENT_ERROR.value,
-            }
-
-        return None
+        """Classify HTTP status codes for error monitoring."""
+        return classify_error(status_code)
 
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request."""
-        # Check for forwarded headers (common in production)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-
-        # Fall back to client host
-        if request.client:
-            return request.client.host
-
-        return "unknown"
+        return client_ip(request.headers, request.client.host if request.client else None)
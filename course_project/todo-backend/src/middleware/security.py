@@ -8,9 +8,48 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
+# Strict CSP for API - no inline scripts, restrict sources
+DEFAULT_CSP_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'strict-dynamic'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data: https:; "
+    "font-src 'self'; "
+    "connect-src 'self'; "
+    "media-src 'none'; "
+    "object-src 'none'; "
+    "frame-src 'none'; "
+    "worker-src 'none'; "
+    "frame-ancestors 'none'; "
+    "form-action 'self'; "
+    "base-uri 'self'; "
+    "upgrade-insecure-requests"
+)
+
+
+def security_headers(csp_policy: str = DEFAULT_CSP_POLICY) -> dict[str, str]:
+    """Security headers set on every response, with the given Content Security Policy."""
+    return {
+        # Prevent MIME type sniffing
+        "X-Content-Type-Options": "nosniff",
+        # Prevent clickjacking
+        "X-Frame-Options": "DENY",
+        # Prevent XSS and other injection attacks
+        "Content-Security-Policy": csp_policy,
+        # Enable XSS filtering (legacy browsers)
+        "X-XSS-Protection": "1; mode=block",
+        # Control referrer information
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+        # Disable unnecessary browser features
+        "Permissions-Policy": "geolocation=(), microphone=(), camera=(), payment=(), usb=(), screen-wake-lock=()",
+    }
+
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers for XSS and other attack prevention."""
+    """Middleware to add security headers for XSS and other attack prevention.
+
+    The application uses ``APIMiddleware``, which does this in a single pure ASGI layer.
+    """
 
     def __init__(self, app, csp_policy: str | None = None):
         """Initialize security headers middleware.
@@ -24,66 +63,50 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
     def _get_default_csp_policy(self) -> str:
         """Get default Content Security Policy for API endpoints."""
-        # Strict CSP for API - no inline scripts, restrict sources
-        return (
-            "default-src 'self'; "
-            "script-src 'self' 'strict-dynamic'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "media-src 'none'; "
-            "object-src 'none'; "
-            "frame-src 'none'; "
-            "worker-src 'none'; "
-            "frame-ancestors 'none'; "
-            "form-action 'self'; "
-            "base-uri 'self'; "
-            "upgrade-insecure-requests"
-        )
+        return DEFAULT_CSP_POLICY
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Add security headers to all responses."""
         response = await call_next(request)
-
-        # X-Content-Type-Options: Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # X-Frame-Options: Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # Content-Security-Policy: Prevent XSS and other injection attacks
-        response.headers["Content-Security-Policy"] = self.csp_policy
-
-        # X-XSS-Protection: Enable XSS filtering (legacy browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Referrer-Policy: Control referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-        # Permissions-Policy: Disable unnecessary browser features
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=(), payment=(), usb=(), screen-wake-lock=()"
-        )
+        response.headers.update(security_headers(self.csp_policy))
 
         logger.debug(f"Added security headers to response for {request.url.path}")
         return response
 
 
 class XSSProtectionMiddleware(BaseHTTPMiddleware):
-    """Middleware for additional XSS protection measures."""
+    """Middleware for additional XSS protection measures and GET cache policy.
+
+    The application uses ``APIMiddleware``, which does this in a single pure ASGI layer.
+    """
+
+    def __init__(self, app, default_cache_control: str = "no-cache, no-store, must-revalidate"):
+        """Initialize XSS protection middleware.
+
+        Args:
+            app: FastAPI application instance
+            default_cache_control: Cache-Control for JSON GET responses of routes without their own policy
+        """
+        super().__init__(app)
+        self.default_cache_control = default_cache_control
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and response for XSS protection."""
         response = await call_next(request)
+        is_json = response.headers.get("content-type", "").startswith("application/json")
 
         # Ensure JSON responses have correct content type
-        if response.headers.get("content-type", "").startswith("application/json"):
+        if is_json:
             # Additional protection for JSON responses
             response.headers["X-Content-Type-Options"] = "nosniff"
 
-            # Prevent JSON hijacking
-            if request.method == "GET":
-                response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+        if request.method == "GET":
+            # Routes declare their policy with the cache_control() dependency; it also covers their 304s
+            route_policy = getattr(request.state, "cache_control", None)
+            if route_policy and response.status_code in (200, 304):
+                response.headers["Cache-Control"] = route_policy
+            elif is_json:
+                # Prevent JSON hijacking
+                response.headers["Cache-Control"] = self.default_cache_control
 
         return response
@@ -2,7 +2,8 @@
 
 import uuid
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
+from typing import NamedTuple
 
 from pydantic import BaseModel, Field
 
@@ -14,6 +15,22 @@ class TodoStatus(str, Enum):
     DONE = "done"
 
 
+class TodoSort(StrEnum):
+    """Sort orders for todo listings; a leading ``-`` means descending. Ties break on ID."""
+
+    CREATED_DESC = "-created_at"
+    CREATED_ASC = "created_at"
+    UPDATED_DESC = "-updated_at"
+    UPDATED_ASC = "updated_at"
+
+
+class TodoVersion(NamedTuple):
+    """Version of the whole todo collection, bumped by every write; used for ETag and Last-Modified."""
+
+    sequence: int
+    changed_at: datetime
+
+
 class TodoCreate(BaseModel):
     """Model for creating a new todo."""
 
@@ -27,6 +44,30 @@ class TodoUpdate(BaseModel):
     status: TodoStatus | None = Field(None, description="Todo status")
 
 
+class TodoBulkUpdate(BaseModel):
+    """Model for applying the same update to several todos."""
+
+    ids: list[str] = Field(..., min_length=1, description="IDs of the todos to update")
+    text: str | None = Field(None, min_length=1, max_length=140, description="Todo text content")
+    status: TodoStatus | None = Field(None, description="Todo status")
+
+
+class TodoBulkDeleteResult(BaseModel):
+    """Result of a bulk delete."""
+
+    deleted: int = Field(..., description="Number of todos deleted")
+    ids: list[str] = Field(..., description="IDs of the deleted todos")
+
+
+class TodoStats(BaseModel):
+    """Todo counts by status."""
+
+    total: int = Field(..., description="Number of todos")
+    done: int = Field(..., description="Number of done todos")
+    not_done: int = Field(..., description="Number of not-done todos")
+    exact: bool = Field(False, description="Counted by scanning the table rather than read from the stats row")
+
+
 class Todo(BaseModel):
     """Todo item model."""
 
@@ -36,6 +77,16 @@ class Todo(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
     updated_at: datetime | None = Field(None, description="Last update timestamp")
 
+    def event_payload(self) -> dict:
+        """Fields of the NATS event for this todo; the publisher adds ``action``."""
+        return {
+            "id": self.id,
+            "text": self.text,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else self.created_at.isoformat(),
+        }
+
     @classmethod
     def create_new(cls, text: str) -> "Todo":
         """Create a new todo with generated ID and timestamp."""
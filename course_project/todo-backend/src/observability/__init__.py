@@ -0,0 +1 @@
+"""Metrics and tracing shared by the HTTP, database and NATS layers."""
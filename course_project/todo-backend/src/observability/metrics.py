@@ -0,0 +1,176 @@
+"""In-process Prometheus metrics: counters, gauges and histograms with pre-bound label sets.
+
+A ``MetricFamily`` keeps one child per tuple of label values. ``labels()`` creates the child the
+first time a label set is used and returns the same object afterwards, so hot paths bind their
+children once (at import, when a method is decorated, or on a route's first request) and then
+only update plain attributes. Updates take no lock: they run on the event loop thread, and an
+update racing a scrape just shows up in the next scrape.
+
+Families register in ``registry``, which ``GET /metrics`` renders before the log queue metrics;
+gauges of live objects (pool occupancy, publish queue depth) are set just before each render.
+``src.observability.multiprocess`` combines the output of several workers.
+"""
+
+import bisect
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    """Monotonically increasing count for one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """Value that goes up and down for one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """Bucketed observations with their sum and count for one label set."""
+
+    __slots__ = ("buckets", "bucket_counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        """Return Prometheus-style cumulative ``(le, count)`` pairs, ending with ``+Inf``."""
+        pairs = []
+        running = 0
+        for bound, count in zip((*self.buckets, None), self.bucket_counts, strict=True):
+            running += count
+            pairs.append(("+Inf" if bound is None else str(bound), running))
+        return pairs
+
+
+def _escape(value: object) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class MetricFamily:
+    """A named metric with one child per set of label values.
+
+    Args:
+        name: Metric name
+        description: HELP text
+        metric_type: ``counter``, ``gauge`` or ``histogram``
+        labelnames: Names of the labels every child is bound to
+        buckets: Histogram bucket upper bounds
+    """
+
+    _CHILD_TYPES = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        metric_type: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        if metric_type not in self._CHILD_TYPES:
+            raise ValueError(f"Unknown metric type: {metric_type}")
+        self.name = name
+        self.description = description
+        self.metric_type = metric_type
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.children: dict[tuple, Counter | Gauge | Histogram] = {}
+
+    def labels(self, *values) -> Counter | Gauge | Histogram:
+        """Return the child for these label values, creating it on first use."""
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {values}")
+            child = (
+                Histogram(self.buckets) if self.metric_type == "histogram" else self._CHILD_TYPES[self.metric_type]()
+            )
+            self.children[values] = child
+        return child
+
+    def render(self) -> list[str]:
+        """Render the family as Prometheus text exposition lines."""
+        name = self.name
+        lines = [f"# HELP {name} {self.description}", f"# TYPE {name} {self.metric_type}"]
+        # Copied in one step, so a label set added on the event loop during a scrape cannot break iteration
+        for values, child in list(self.children.items()):
+            labels = ",".join(
+                f'{label}="{_escape(value)}"' for label, value in zip(self.labelnames, values, strict=True)
+            )
+            if not isinstance(child, Histogram):
+                lines.append(f"{name}{{{labels}}} {child.value}" if labels else f"{name} {child.value}")
+                continue
+            prefix = f"{labels}," if labels else ""
+            lines.extend(f'{name}_bucket{{{prefix}le="{le}"}} {count}' for le, count in child.cumulative_buckets())
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}_sum{suffix} {child.sum}")
+            lines.append(f"{name}_count{suffix} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metric families in registration order."""
+
+    def __init__(self):
+        self.families: dict[str, MetricFamily] = {}
+
+    def register(self, family: MetricFamily) -> MetricFamily:
+        if family.name in self.families:
+            raise ValueError(f"Metric {family.name} is already registered")
+        self.families[family.name] = family
+        return family
+
+    def counter(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> MetricFamily:
+        return self.register(MetricFamily(name, description, "counter", labelnames))
+
+    def gauge(self, name: str, description: str, labelnames: tuple[str, ...] = ()) -> MetricFamily:
+        return self.register(MetricFamily(name, description, "gauge", labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> MetricFamily:
+        return self.register(MetricFamily(name, description, "histogram", labelnames, buckets))
+
+    def render(self) -> list[str]:
+        """Render every family as Prometheus text exposition lines."""
+        return [line for family in list(self.families.values()) for line in family.render()]
+
+
+# Process-wide registry rendered by GET /metrics
+registry = MetricsRegistry()
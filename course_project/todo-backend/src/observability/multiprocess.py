@@ -0,0 +1,141 @@
+"""Metrics across several uvicorn workers.
+
+Each worker keeps its metrics in its own memory, and a scrape reaches only one worker. With
+``metrics_multiproc_dir`` set, every worker writes its rendered metrics to ``<dir>/<id>.prom``
+each ``metrics_flush_interval_seconds`` and once more at shutdown, and ``GET /metrics`` returns
+the sum of all files, with the serving worker's own metrics rendered fresh. Every series this
+service exports is additive across processes (counts, sums, bucket counts, pool sizes, queue
+depths), so the merge adds values series by series.
+
+The id is random and drawn once per process, so a new worker never overwrites the file of an
+exited one, even when it gets the same pid. A file not refreshed for ``STALE_INTERVALS`` flush
+intervals belongs to an exited worker: its gauges are left out, while its counters and
+histograms are kept, so totals do not go backwards when a worker is replaced.
+
+The directory must be empty when the server starts (e.g. a fresh ``emptyDir`` volume), or the
+counters of an earlier run are added to this one's.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".prom"
+
+# Flush intervals without a refresh after which a worker's snapshot counts as exited
+STALE_INTERVALS = 3
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def merge_expositions(expositions: list[tuple[str, bool]]) -> str:
+    """Sum Prometheus text expositions series by series.
+
+    Args:
+        expositions: ``(text, alive)`` per process; gauge series of processes that are not alive are skipped
+    """
+    headers: dict[str, dict[str, str]] = {}  # family -> HELP/TYPE line, first seen wins
+    samples: dict[str, dict[str, float]] = {}  # family -> series -> summed value
+    for text, alive in expositions:
+        family = metric_type = None
+        for line in text.splitlines():
+            if line.startswith("# "):
+                parts = line.split(" ", 3)
+                if len(parts) == 4 and parts[1] in ("HELP", "TYPE"):
+                    family = parts[2]
+                    headers.setdefault(family, {}).setdefault(parts[1], line)
+                    if parts[1] == "TYPE":
+                        metric_type = parts[3]
+                continue
+            if not line or family is None or (metric_type == "gauge" and not alive):
+                continue
+            series, _, value = line.rpartition(" ")
+            family_samples = samples.setdefault(family, {})
+            family_samples[series] = family_samples.get(series, 0.0) + float(value)
+
+    lines = []
+    for family, family_headers in headers.items():
+        lines.extend(family_headers.values())
+        lines.extend(f"{series} {_format_value(value)}" for series, value in samples.get(family, {}).items())
+    return "\n".join(lines) + "\n"
+
+
+class WorkerMetricsSnapshots:
+    """Writes this worker's metrics to the shared directory and merges every worker's file.
+
+    Args:
+        directory: Directory shared by all workers of the server
+        interval_seconds: Time between snapshots of this worker's metrics
+        render: Returns this worker's metrics in the Prometheus text format
+    """
+
+    def __init__(self, directory: str, interval_seconds: float, render: Callable[[], str]):
+        self.directory = Path(directory)
+        self.interval_seconds = interval_seconds
+        self.render = render
+        self._task: asyncio.Task | None = None
+        self._process: tuple[int, str] | None = None  # (pid, snapshot id) of the process that owns the file
+
+    @property
+    def path(self) -> Path:
+        # Looked up on each write, since workers may be forked after this object is created
+        pid = os.getpid()
+        if self._process is None or self._process[0] != pid:
+            self._process = (pid, uuid.uuid4().hex)
+        return self.directory / f"{self._process[1]}{SNAPSHOT_SUFFIX}"
+
+    def write(self, text: str) -> None:
+        """Replace this worker's snapshot atomically, so readers never see a partial file."""
+        path = self.path
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(text)
+        os.replace(tmp_path, path)
+
+    def merged(self, own_text: str) -> str:
+        """Return ``own_text`` summed with the latest snapshots of the other workers."""
+        own_path = self.path
+        stale_before = time.time() - STALE_INTERVALS * self.interval_seconds
+        expositions = [(own_text, True)]
+        for path in self.directory.glob(f"*{SNAPSHOT_SUFFIX}"):
+            if path == own_path:
+                continue
+            try:
+                expositions.append((path.read_text(), path.stat().st_mtime >= stale_before))
+            except FileNotFoundError:
+                continue
+        return merge_expositions(expositions)
+
+    def start(self) -> None:
+        """Write a first snapshot and keep refreshing it in the background."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.write(self.render())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="metrics-snapshots")
+
+    async def stop(self) -> None:
+        """Stop refreshing and write the final counts, which outlive this worker."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        await asyncio.to_thread(self.write, self.render())
+
+    async def _run(self) -> None:
+        """Render on the event loop, where the metrics are updated, and write from a thread."""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.write, self.render())
+            except Exception as e:
+                logger.warning(f"Writing metrics snapshot failed: {e}")
@@ -0,0 +1,368 @@
+"""Lightweight in-process tracing with OTLP JSON export, shared by todo-backend and the broadcaster.
+
+A ``Span`` times one unit of work: an HTTP request, a database operation, a NATS publish or
+the handling of a consumed event. The span that is current in the running task (a context
+variable) becomes the parent of spans started inside it, so one trace covers a request and
+everything it calls. Across processes the trace continues through a W3C ``traceparent``
+header: the backend sends it with each todo event in the NATS message headers, and the
+broadcaster starts its consumer span from it. Events published later (by the batched publisher
+or from the outbox) keep the header value under ``TRACE_CONTEXT_KEY`` until they are sent.
+
+Finished spans go to exporters; no collector is needed:
+
+- ``RingBufferSpanExporter`` keeps the most recent spans in memory for ``GET /traces``.
+- ``FileSpanExporter`` appends them to a file as JSON lines. Each line is an OTLP
+  ``ExportTraceServiceRequest``, which the OpenTelemetry Collector's ``otlpjsonfile``
+  receiver and other OTLP tools read as is. A writer thread encodes and writes the lines,
+  so the event loop never waits on the disk; when it falls behind, spans are dropped and counted.
+
+Until ``configure_tracing`` gives the tracer an exporter, spans are a shared no-op object.
+
+This module is copied verbatim into both services; a test checks that the copies match.
+"""
+
+import atexit
+import contextlib
+import logging
+import queue
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextvars import ContextVar, Token
+from enum import IntEnum
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# W3C trace context header, sent in HTTP and NATS message headers
+TRACEPARENT_HEADER = "traceparent"
+
+# Message key holding a queued event's traceparent until it is published; never sent in the body
+TRACE_CONTEXT_KEY = "_traceparent"
+
+# OTLP status codes
+STATUS_ERROR = 2
+
+# Most spans written as one OTLP line by the file exporter
+FILE_BATCH_SIZE = 512
+
+
+class SpanKind(IntEnum):
+    """OTLP span kinds."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str] | None:
+    """Return the ``(trace_id, span_id)`` of a ``traceparent`` header, or None if it is missing or invalid."""
+    if not value:
+        return None
+    parts = value.strip().lower().split("-")
+    if len(parts) < 4 or parts[0] == "ff" or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1], parts[2]
+    try:
+        if int(trace_id, 16) == 0 or int(span_id, 16) == 0:
+            return None
+    except ValueError:
+        return None
+    return trace_id, span_id
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    """Encode an attribute value as an OTLP ``AnyValue``."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "attributes",
+        "error",
+        "start_ns",
+        "end_ns",
+        "_perf_start",
+    )
+
+    def __init__(
+        self, name: str, kind: SpanKind, trace_id: str, parent_span_id: str | None, attributes: dict[str, Any]
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.attributes = attributes
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self._perf_start = time.perf_counter_ns()
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value that makes this span the parent of the receiver's span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        """Rename the span, e.g. once a request's route is known."""
+        self.name = name
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed."""
+        self.error = message
+
+    def end(self) -> None:
+        # Wall-clock start plus a monotonic duration, so clock adjustments cannot make spans negative
+        self.end_ns = self.start_ns + time.perf_counter_ns() - self._perf_start
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Encode the span as an OTLP JSON ``Span``."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+class _NoopSpan:
+    """Stands in for a span while tracing is off."""
+
+    __slots__ = ()
+
+    name = kind = trace_id = span_id = parent_span_id = traceparent = error = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Return the span current in this task, if any."""
+    return _current_span.get()
+
+
+def otlp_document(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """Wrap spans in an OTLP JSON ``ExportTraceServiceRequest``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeSpans": [{"scope": {"name": service_name}, "spans": [span.to_otlp() for span in spans]}],
+            }
+        ]
+    }
+
+
+class RingBufferSpanExporter:
+    """Keeps the most recent finished spans in memory."""
+
+    def __init__(self, size: int):
+        self.spans: deque[Span] = deque(maxlen=size)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def find(self, trace_id: str | None = None, request_id: str | None = None, limit: int = 100) -> list[Span]:
+        """Return the spans of one trace, of the traces of a request ID, or the most recent spans."""
+        spans = list(self.spans)
+        if request_id is not None:
+            trace_ids = {span.trace_id for span in spans if span.attributes.get("request_id") == request_id}
+            return [span for span in spans if span.trace_id in trace_ids]
+        if trace_id is not None:
+            return [span for span in spans if span.trace_id == trace_id]
+        return spans[-limit:] if limit > 0 else []
+
+
+class FileSpanExporter:
+    """Appends finished spans to a file as OTLP JSON lines from a writer thread.
+
+    Args:
+        path: File the lines are appended to
+        service_name: ``service.name`` resource attribute
+        queue_size: Most spans waiting to be written; further spans are dropped and counted
+    """
+
+    def __init__(self, path: str, service_name: str, queue_size: int = 10000):
+        self.path = path
+        self.service_name = service_name
+        self.queue: queue.Queue[Span | None] = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self._thread: threading.Thread | None = None
+
+    def export(self, span: Span) -> None:
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write the spans still queued and stop the writer thread."""
+        if self._thread is None:
+            return
+        self.queue.put(None)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Write whatever is queued as one line per batch until the stop sentinel arrives."""
+        with open(self.path, "ab") as file:
+            while True:
+                batch = []
+                span = self.queue.get()
+                while span is not None:
+                    batch.append(span)
+                    if len(batch) == FILE_BATCH_SIZE:
+                        break
+                    try:
+                        span = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    try:
+                        file.write(orjson.dumps(otlp_document(batch, self.service_name)) + b"\n")
+                        file.flush()
+                    except Exception as e:
+                        logger.warning(f"Writing {len(batch)} spans failed: {e}")
+                if span is None:
+                    return
+
+
+class Tracer:
+    """Starts spans and hands finished ones to the exporters; spans are no-ops without exporters."""
+
+    def __init__(self):
+        self.service_name = "unknown"
+        self.exporters: list[RingBufferSpanExporter | FileSpanExporter] = []
+        self.buffer: RingBufferSpanExporter | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+        traceparent: str | None = None,
+    ) -> Span | _NoopSpan:
+        """Start a span under the remote parent in ``traceparent``, else under the current span.
+
+        The span does not become current; use ``activate`` or the ``span`` context manager for that.
+        """
+        if not self.exporters:
+            return NOOP_SPAN
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            trace_id, parent_span_id = remote
+        elif (parent := _current_span.get()) is not None:
+            trace_id, parent_span_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_span_id = f"{random.getrandbits(128):032x}", None
+        return Span(name, kind, trace_id, parent_span_id, dict(attributes) if attributes else {})
+
+    @staticmethod
+    def activate(span: Span | _NoopSpan) -> Token | None:
+        """Make the span current in this task; pass the token to ``deactivate``."""
+        return _current_span.set(span) if isinstance(span, Span) else None
+
+    @staticmethod
+    def deactivate(token: Token | None) -> None:
+        if token is not None:
+            _current_span.reset(token)
+
+    def end_span(self, span: Span | _NoopSpan) -> None:
+        """Finish the span and export it."""
+        if not isinstance(span, Span):
+            return
+        span.end()
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+        traceparent: str | None = None,
+    ) -> Iterator[Span | _NoopSpan]:
+        """Run the block in a new current span; an exception marks the span failed and propagates."""
+        span = self.start_span(name, kind, attributes, traceparent)
+        token = self.activate(span)
+        try:
+            yield span
+        except Exception as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            self.deactivate(token)
+            self.end_span(span)
+
+
+# Process-wide tracer, given its exporters by configure_tracing
+tracer = Tracer()
+
+
+def configure_tracing(service_name: str, buffer_size: int, file_path: str = "") -> Tracer:
+    """Export spans to a ring buffer of ``buffer_size`` spans and, if a path is given, to a file.
+
+    With neither, tracing stays off. Idempotent: the first call configures the tracer.
+    """
+    if tracer.exporters:
+        return tracer
+    tracer.service_name = service_name
+    if buffer_size > 0:
+        tracer.buffer = RingBufferSpanExporter(buffer_size)
+        tracer.exporters.append(tracer.buffer)
+    if file_path:
+        file_exporter = FileSpanExporter(file_path, service_name)
+        file_exporter.start()
+        atexit.register(file_exporter.stop)
+        tracer.exporters.append(file_exporter)
+    return tracer
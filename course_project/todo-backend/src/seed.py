@@ -0,0 +1,30 @@
+"""One-off job that seeds the sample todos into an empty database.
+
+Seeding used to run on every startup; it is now opt-in so replicas become ready without it.
+Run it once per environment, e.g. as a Kubernetes Job or locally:
+
+    uv run python -m src.seed
+"""
+
+import asyncio
+import logging
+
+from src.database.connection import db_manager
+from src.services.todo_service import TodoService
+
+logger = logging.getLogger(__name__)
+
+
+async def seed() -> None:
+    """Create the schema if needed and add the sample todos when the table is empty."""
+    await db_manager.initialize()
+    try:
+        await TodoService().initialize_with_sample_data()
+        logger.info("Sample data seeded")
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(seed())
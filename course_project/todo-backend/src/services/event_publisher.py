@@ -0,0 +1,223 @@
+"""Batched, non-blocking NATS publishing through a bounded in-memory queue.
+
+``NATSService.publish_todo_event(s)`` hand their messages to a ``BatchedEventPublisher`` instead
+of encoding and publishing them inside the request. A background task encodes and publishes a
+batch as soon as ``batch_size`` messages are waiting or the oldest has waited ``max_delay_seconds``,
+and confirms each batch with a single ``flush()``.
+
+Delivery is best effort: a full queue sheds events according to the overflow policy, and a batch
+that fails to publish is dropped. The transactional outbox is the at-least-once alternative.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+from typing import Any
+
+from ..observability.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Queue gauges, set from the live publisher on each scrape
+NATS_PUBLISH_QUEUE_DEPTH = registry.gauge("todo_backend_nats_publish_queue_depth", "Events waiting to be published")
+NATS_PUBLISH_QUEUE_CAPACITY = registry.gauge(
+    "todo_backend_nats_publish_queue_capacity", "Most events the publish queue holds"
+)
+NATS_EVENTS_ENQUEUED = registry.counter("todo_backend_nats_events_enqueued_total", "Events queued for publishing")
+NATS_EVENTS_DROPPED = registry.counter(
+    "todo_backend_nats_events_dropped_total", "Queued events discarded to make room (drop-oldest)"
+)
+NATS_EVENTS_REJECTED = registry.counter(
+    "todo_backend_nats_events_rejected_total", "Events refused because the queue was full"
+)
+NATS_EVENTS_PUBLISHED = registry.counter(
+    "todo_backend_nats_events_published_total", "Events published and confirmed by a flush"
+)
+NATS_EVENTS_FAILED = registry.counter(
+    "todo_backend_nats_events_failed_total", "Events lost because their batch failed to publish"
+)
+
+
+class OverflowPolicy(StrEnum):
+    """What ``enqueue`` does when the queue is full."""
+
+    DROP_OLDEST = "drop-oldest"  # Discard the oldest queued event to make room
+    BLOCK = "block"  # Wait for room, up to the block timeout
+    ERROR = "error"  # Raise PublishQueueFullError
+
+
+class PublishQueueFullError(Exception):
+    """The publish queue is full and the overflow policy does not allow dropping old events."""
+
+
+class PublisherMetrics:
+    """Queue and delivery counters of the publisher, bound to their process-wide series.
+
+    The series outlive the publisher, so the counts carry on when NATS reconnects and a new
+    publisher is created. Batch latency is recorded by ``NATSService._send_batch`` as
+    ``todo_backend_nats_publish_duration_seconds{path="publisher"}``.
+    """
+
+    def __init__(self):
+        """Bind the counters."""
+        self.enqueued = NATS_EVENTS_ENQUEUED.labels()
+        self.dropped = NATS_EVENTS_DROPPED.labels()
+        self.rejected = NATS_EVENTS_REJECTED.labels()
+        self.published = NATS_EVENTS_PUBLISHED.labels()
+        self.failed = NATS_EVENTS_FAILED.labels()
+
+    def observe_batch(self, size: int, ok: bool) -> None:
+        """Record one batch publish and whether NATS confirmed it."""
+        (self.published if ok else self.failed).inc(size)
+
+
+class BatchedEventPublisher:
+    """Bounded queue of event messages drained to NATS in batches by a background task.
+
+    Args:
+        send_batch: Publishes a list of messages in order and flushes once; raises on failure
+        max_queue_size: Most messages held while waiting to be published
+        batch_size: Publish as soon as this many messages are waiting
+        max_delay_seconds: Publish a partial batch once its oldest message has waited this long
+        overflow: Behaviour of ``enqueue`` when the queue is full
+        block_timeout_seconds: Longest ``enqueue`` waits for room under the ``block`` policy
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[dict[str, Any]]], Awaitable[None]],
+        max_queue_size: int,
+        batch_size: int,
+        max_delay_seconds: float,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout_seconds: float = 1.0,
+    ):
+        self.send_batch = send_batch
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.max_delay_seconds = max_delay_seconds
+        self.overflow = OverflowPolicy(overflow)
+        self.block_timeout_seconds = block_timeout_seconds
+        self.metrics = PublisherMetrics()
+
+        self._queue: deque[dict[str, Any]] = deque()
+        self._not_empty = asyncio.Event()
+        self._batch_ready = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def depth(self) -> int:
+        """Messages currently waiting to be published."""
+        return len(self._queue)
+
+    async def enqueue(self, message: dict[str, Any]) -> None:
+        """Queue a message for publishing; only waits under the ``block`` policy with a full queue.
+
+        Raises PublishQueueFullError under the ``error`` policy, or when ``block`` times out.
+        """
+        if len(self._queue) >= self.max_queue_size:
+            if self.overflow is OverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+                self.metrics.dropped.inc()
+            elif self.overflow is OverflowPolicy.BLOCK:
+                await self._wait_for_room()
+            else:
+                self.metrics.rejected.inc()
+                raise PublishQueueFullError(f"Publish queue full ({self.max_queue_size} events)")
+
+        self._queue.append(message)
+        self.metrics.enqueued.inc()
+        self._not_empty.set()
+        if len(self._queue) >= self.batch_size:
+            self._batch_ready.set()
+        if len(self._queue) >= self.max_queue_size:
+            self._has_room.clear()
+
+    async def _wait_for_room(self) -> None:
+        """Wait until the background task frees room in the queue, up to ``block_timeout_seconds``."""
+        try:
+            async with asyncio.timeout(self.block_timeout_seconds):
+                while len(self._queue) >= self.max_queue_size:
+                    self._has_room.clear()
+                    await self._has_room.wait()
+        except TimeoutError:
+            self.metrics.rejected.inc()
+            raise PublishQueueFullError(
+                f"Publish queue still full after {self.block_timeout_seconds}s ({self.max_queue_size} events)"
+            ) from None
+
+    def start(self) -> None:
+        """Start the background publishing loop."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="nats-event-publisher")
+
+    async def stop(self, drain_timeout_seconds: float = 5.0) -> None:
+        """Stop the loop, then publish whatever is still queued within ``drain_timeout_seconds``.
+
+        The loop finishes the batch it is sending before it exits; only a batch still unconfirmed
+        when the timeout expires is cancelled, and it is counted as failed.
+        """
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(drain_timeout_seconds):
+                if self._task is not None:
+                    self._stopping = True
+                    self._not_empty.set()
+                    self._batch_ready.set()
+                    await self._task
+                while self._queue:
+                    await self._publish_next_batch()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._queue:
+            logger.warning(f"Discarding {len(self._queue)} unpublished events on shutdown")
+            self.metrics.failed.inc(len(self._queue))
+            self._queue.clear()
+        self._not_empty.clear()
+        self._batch_ready.clear()
+        self._has_room.set()
+
+    async def _run(self) -> None:
+        """Publish a batch whenever one is full or its oldest message is ``max_delay_seconds`` old."""
+        while True:
+            await self._not_empty.wait()
+            if len(self._queue) < self.batch_size:
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self.max_delay_seconds):
+                        await self._batch_ready.wait()
+            if self._stopping:
+                return  # stop() drains the rest of the queue
+            await self._publish_next_batch()
+
+    async def _publish_next_batch(self) -> None:
+        """Take up to ``batch_size`` messages off the queue and publish them; failures drop the batch."""
+        batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+        if not self._queue:
+            self._not_empty.clear()
+        if len(self._queue) < self.batch_size:
+            self._batch_ready.clear()
+        self._has_room.set()
+        if not batch:
+            return
+
+        try:
+            await self.send_batch(batch)
+        except asyncio.CancelledError:
+            logger.warning(f"Publishing a batch of {len(batch)} events was cancelled on shutdown")
+            self.metrics.observe_batch(len(batch), ok=False)
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to publish batch of {len(batch)} events: {e}")
+            self.metrics.observe_batch(len(batch), ok=False)
+        else:
+            self.metrics.observe_batch(len(batch), ok=True)
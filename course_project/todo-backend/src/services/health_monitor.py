@@ -0,0 +1,155 @@
+"""Background health monitor for the database and NATS.
+
+A single task checks both dependencies every ``health_check_interval_seconds`` and stores the
+latest result with a timestamp. Probe endpoints read ``health_monitor.snapshot()`` instead of
+checking inline, so probes cost O(1) and never hold pool connections that real traffic needs,
+however often Kubernetes calls them and however slow the database is.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from ..config.settings import settings
+from ..database.operations import TodoDatabase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ComponentHealth:
+    """Latest check result for one dependency."""
+
+    healthy: bool = False
+    checked_at: datetime | None = None
+    latency_ms: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """Serialize for probe responses; ``error`` is only the exception type, never its message."""
+        return {
+            "healthy": self.healthy,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "latency_ms": self.latency_ms,
+            "error": self.error,
+        }
+
+
+class HealthMonitor:
+    """Periodically checks the database and NATS and caches the results for probes."""
+
+    def __init__(self, interval_seconds: float, timeout_seconds: float, stale_after_seconds: float):
+        """Initialize with no results yet; probes report not-ready until the first check completes."""
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.stale_after_seconds = stale_after_seconds
+
+        self.database = ComponentHealth()
+        self.nats = ComponentHealth()
+        self.todos_count: int | None = None
+        self.nats_service = None  # Set by the lifespan once NATS is connected
+
+        self._last_check_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        """True before the first check and when the monitor has not completed one recently."""
+        if self._last_check_at is None:
+            return True
+        return time.monotonic() - self._last_check_at > self.stale_after_seconds
+
+    @property
+    def is_ready(self) -> bool:
+        """Ready to serve traffic: the database was reachable at the last, recent check.
+
+        NATS is reported but not required; the service degrades gracefully without it.
+        """
+        return self.database.healthy and not self.is_stale
+
+    def snapshot(self) -> dict:
+        """Return the cached status of every dependency."""
+        return {
+            "ready": self.is_ready,
+            "stale": self.is_stale,
+            "database": self.database.to_dict(),
+            "nats": self.nats.to_dict(),
+            "todos_count": self.todos_count,
+        }
+
+    async def check_once(self) -> None:
+        """Check all dependencies concurrently and store the results."""
+        await asyncio.gather(self._check_database(), self._check_nats())
+        self._last_check_at = time.monotonic()
+
+    async def _check_database(self) -> None:
+        """Run one ``SELECT 1`` and refresh the todo count, bounded by ``timeout_seconds``."""
+        from ..database.connection import db_manager
+
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                healthy = await db_manager.health_check(max_retries=1)
+                if healthy:
+                    self.todos_count = await TodoDatabase().count_todos()
+            self._record(self.database, healthy, start, None if healthy else "Unavailable")
+        except Exception as e:
+            logger.warning(f"Database health check failed: {e}")
+            self._record(self.database, False, start, type(e).__name__)
+
+    async def _check_nats(self) -> None:
+        """Round-trip a PING to the NATS server, bounded by ``timeout_seconds``."""
+        start = time.perf_counter()
+        nats_service = self.nats_service
+        if not nats_service or not nats_service.nc or not nats_service.nc.is_connected:
+            self._record(self.nats, False, start, "NotConnected")
+            return
+
+        try:
+            await nats_service.nc.flush(timeout=self.timeout_seconds)
+            self._record(self.nats, True, start, None)
+        except Exception as e:
+            logger.warning(f"NATS health check failed: {e}")
+            self._record(self.nats, False, start, type(e).__name__)
+
+    @staticmethod
+    def _record(component: ComponentHealth, healthy: bool, start: float, error: str | None) -> None:
+        """Store one check result."""
+        component.healthy = healthy
+        component.checked_at = datetime.now(UTC)
+        component.latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        component.error = error
+
+    def start(self) -> None:
+        """Start the background check loop; the first check runs immediately."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+    async def stop(self) -> None:
+        """Stop the background check loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Check on a fixed schedule until cancelled."""
+        while True:
+            try:
+                await self.check_once()
+            except Exception as e:
+                logger.warning(f"Health monitor check failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+
+# Global health monitor instance, started by the application lifespan
+health_monitor = HealthMonitor(
+    interval_seconds=settings.health_check_interval_seconds,
+    timeout_seconds=settings.health_check_timeout_seconds,
+    stale_after_seconds=settings.health_stale_after_seconds,
+)
@@ -1,23 +1,94 @@
 """NATS service for publishing todo events, because we like it the best."""
 
-import json
+import asyncio
 import logging
+import time
+from collections.abc import Callable
 from typing import Any
 
 import nats
+from nats.js import JetStreamContext
+from nats.js.api import StorageType, StreamConfig
+from nats.js.errors import BadRequestError
 
 from ..config.settings import settings
+from ..events.schema import EventEncoding, decode_event, encode_event
+from ..observability.metrics import registry
+from ..observability.tracing import TRACE_CONTEXT_KEY, TRACEPARENT_HEADER, SpanKind, tracer
+from .event_publisher import BatchedEventPublisher, OverflowPolicy
 
 logger = logging.getLogger(__name__)
 
+NATS_PUBLISH_SECONDS = registry.histogram(
+    "todo_backend_nats_publish_duration_seconds",
+    "Time to publish a set of todo events and have NATS confirm them, by publish path",
+    ("path",),
+)
+NATS_PUBLISHED = registry.counter(
+    "todo_backend_nats_publish_messages_total", "Todo events handed to NATS, by publish path", ("path",)
+)
+NATS_PUBLISH_FAILURES = registry.counter(
+    "todo_backend_nats_publish_failures_total", "Todo events NATS did not confirm, by publish path", ("path",)
+)
+
+# Publish paths: inside the request (direct mode), the batched publisher's task, the outbox relay
+_PUBLISH_METRICS = {
+    path: (NATS_PUBLISH_SECONDS.labels(path), NATS_PUBLISHED.labels(path), NATS_PUBLISH_FAILURES.labels(path))
+    for path in ("direct", "publisher", "outbox")
+}
+
+
+def _record_publish(path: str, start: float, sent: int, confirmed: int) -> None:
+    """Record one publish of ``sent`` events, of which ``confirmed`` are known to have arrived."""
+    seconds, published, failures = _PUBLISH_METRICS[path]
+    seconds.observe(time.perf_counter() - start)
+    published.inc(sent)
+    if confirmed < sent:
+        failures.inc(sent - confirmed)
+
+
+def event_message_id(message: dict[str, Any]) -> str:
+    """JetStream ``Nats-Msg-Id`` for an event: todo ID, action and ``updated_at``.
+
+    A republished event (e.g. an outbox batch retried after a lost confirmation) carries the
+    same ID and is dropped by the stream's duplicate window. The action is part of the ID
+    because a delete carries the same ``updated_at`` as the change before it.
+    """
+    return f"{message['id']}:{message['action']}:{message['updated_at']}"
+
 
 class NATSService:
-    """Service for publishing messages to NATS."""
+    """Service for publishing messages to NATS.
+
+    In the ``batched`` publish mode (the default) ``publish_todo_event(s)`` only queue their
+    messages on a ``BatchedEventPublisher``; encoding, publishing and flushing happen in its
+    background task. In ``direct`` mode they publish inside the caller.
+
+    With ``nats_jetstream_enabled`` events are published to a JetStream stream on the event
+    subject, so consumers can replay them from any stream sequence. Publishes are
+    asynchronous and confirmed by their PubAcks, gathered per batch, instead of by a flush.
+    Plain subscribers, such as every replica's cache invalidation, still receive each event.
+
+    Event bodies are encoded per ``nats_event_encoding`` with the envelope headers of
+    ``src.events.schema``, which the broadcaster decodes with its copy of the same module.
+
+    Every publish that goes to NATS records its latency and unconfirmed events per path
+    (``direct``, ``publisher``, ``outbox``) on ``/metrics``; queueing on the publisher does not.
+
+    ``publish_todo_event(s)`` run in a ``PRODUCER`` span, and each of their messages carries it
+    in a ``traceparent`` header so the broadcaster continues the trace. Queued messages keep the
+    header value under ``TRACE_CONTEXT_KEY`` until the publisher sends them; outbox events store
+    the span of the write that queued them there, so the relay's publish continues its trace.
+    """
 
     def __init__(self):
         """Initialize NATS service."""
         self.nc: nats.aio.client.Client | None = None
         self.is_connected = False
+        self.subscription = None
+        self.publisher: BatchedEventPublisher | None = None
+        self.js: JetStreamContext | None = None
+        self.encoding = EventEncoding(settings.nats_event_encoding)
 
     async def connect(self) -> bool:
         """Connect to NATS server."""
@@ -29,6 +100,20 @@ class NATSService:
             )
             self.is_connected = True
             logger.info(f"Successfully connected to NATS at {settings.effective_nats_url}")
+
+            if settings.nats_jetstream_enabled:
+                await self._setup_jetstream()
+
+            if settings.nats_publish_mode == "batched":
+                self.publisher = BatchedEventPublisher(
+                    self._send_batch,
+                    max_queue_size=settings.nats_publish_queue_size,
+                    batch_size=settings.nats_publish_batch_size,
+                    max_delay_seconds=settings.nats_publish_max_delay_seconds,
+                    overflow=OverflowPolicy(settings.nats_publish_overflow),
+                    block_timeout_seconds=settings.nats_publish_block_timeout_seconds,
+                )
+                self.publisher.start()
             return True
         except Exception as e:
             logger.warning(f"Failed to connect to NATS: {e}")
@@ -38,6 +123,9 @@ class NATSService:
     async def disconnect(self) -> None:
         """Disconnect from NATS server."""
         try:
+            if self.publisher:
+                # Publish what is still queued while the connection is open
+                await self.publisher.stop()
             if self.nc and self.is_connected:
                 await self.nc.close()
                 logger.info("Disconnected from NATS")
@@ -45,24 +133,205 @@ class NATSService:
             logger.warning(f"Error during NATS disconnect: {e}")
         finally:
             self.nc = None
+            self.subscription = None
+            self.publisher = None
+            self.js = None
             self.is_connected = False
 
+    async def subscribe_todo_events(self, handler: Callable[[dict[str, Any]], None]) -> bool:
+        """Subscribe to todo events from all replicas and pass each decoded event to ``handler``.
+
+        No queue group is used: every replica must see every event to keep its read cache coherent.
+        """
+        if not self.is_connected or not self.nc:
+            logger.warning("NATS not connected, skipping todo event subscription")
+            return False
+
+        async def _on_message(msg) -> None:
+            try:
+                handler(decode_event(msg.data, msg.headers))
+            except Exception as e:
+                logger.warning(f"Failed to handle todo event: {e}")
+
+        try:
+            self.subscription = await self.nc.subscribe(settings.nats_topic, cb=_on_message)
+            logger.info(f"Subscribed to {settings.nats_topic} for cache invalidation")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to subscribe to todo events: {e}")
+            return False
+
+    async def _setup_jetstream(self) -> None:
+        """Create or update the todo event stream; without JetStream on the server, stay on core NATS."""
+        config = StreamConfig(
+            name=settings.nats_stream_name,
+            subjects=[settings.nats_topic],
+            storage=StorageType.FILE,
+            max_age=settings.nats_stream_max_age_seconds,
+            duplicate_window=settings.nats_stream_duplicate_window_seconds,
+        )
+        js = self.nc.jetstream()
+        try:
+            try:
+                await js.add_stream(config)
+            except BadRequestError:
+                # The stream exists with different limits; apply the configured ones
+                await js.update_stream(config)
+        except Exception as e:
+            logger.warning(f"JetStream unavailable, publishing todo events on core NATS: {e}")
+            return
+
+        self.js = js
+        logger.info(f"Publishing todo events to JetStream stream {settings.nats_stream_name}")
+
     async def publish_todo_event(self, todo_data: dict[str, Any], action: str) -> bool:
         """Publish a todo event to NATS."""
         if not self.is_connected or not self.nc:
             logger.warning("NATS not connected, skipping message publish")
             return False
 
+        start = time.perf_counter()
+        with tracer.span("NATSService.publish_todo_event", SpanKind.PRODUCER, self._span_attributes(action)) as span:
+            try:
+                # Create message payload
+                message = {**todo_data, "action": action, TRACE_CONTEXT_KEY: span.traceparent}
+                if self.publisher:
+                    await self.publisher.enqueue(message)
+                    logger.debug(f"Queued {action} event for todo {todo_data.get('id')}")
+                    return True
+
+                # Publish to NATS topic; JetStream publishes wait for the stream's acknowledgement
+                ack = await self._publish_message(message)
+                if ack is not None:
+                    await asyncio.wait_for(ack, settings.nats_publish_flush_timeout_seconds)
+                _record_publish("direct", start, 1, 1)
+                logger.info(f"Published {action} event for todo {todo_data.get('id')}")
+                return True
+
+            except Exception as e:
+                if not self.publisher:
+                    _record_publish("direct", start, 1, 0)
+                span.set_error(f"{type(e).__name__}: {e}")
+                logger.warning(f"Failed to publish NATS message: {e}")
+                return False
+
+    async def publish_todo_events(self, todo_data_list: list[dict[str, Any]], action: str) -> int:
+        """Publish a batch of todo events to NATS. Returns the number of events published.
+
+        Messages are written to the client's outgoing buffer back to back, so the batch goes out
+        in as few socket writes as the client can manage instead of one awaited publish per todo.
+        """
+        if not todo_data_list:
+            return 0
+
+        if not self.is_connected or not self.nc:
+            logger.warning(f"NATS not connected, skipping batch of {len(todo_data_list)} messages")
+            return 0
+
+        start = time.perf_counter()
+        published = 0
+        acks = []
+        attributes = {**self._span_attributes(action), "messaging.batch.message_count": len(todo_data_list)}
+        with tracer.span("NATSService.publish_todo_events", SpanKind.PRODUCER, attributes) as span:
+            try:
+                for todo_data in todo_data_list:
+                    message = {**todo_data, "action": action, TRACE_CONTEXT_KEY: span.traceparent}
+                    if self.publisher:
+                        await self.publisher.enqueue(message)
+                    else:
+                        acks.append(await self._publish_message(message))
+                    published += 1
+                if self.js and acks:
+                    published = await self._confirm(acks, settings.nats_publish_flush_timeout_seconds)
+                logger.info(f"{'Queued' if self.publisher else 'Published'} {published} {action} events")
+            except Exception as e:
+                span.set_error(f"{type(e).__name__}: {e}")
+                logger.warning(f"Failed to publish NATS batch after {published} messages: {e}")
+
+        if not self.publisher:
+            _record_publish("direct", start, len(todo_data_list), published)
+        return published
+
+    @staticmethod
+    def _span_attributes(action: str) -> dict[str, Any]:
+        return {"messaging.system": "nats", "messaging.destination.name": settings.nats_topic, "todo.action": action}
+
+    async def _send_batch(self, messages: list[dict[str, Any]]) -> None:
+        """Publish queued messages in order and confirm them as one batch; used by the publisher."""
+        if not self.nc:
+            raise ConnectionError("NATS connection closed")
+        start = time.perf_counter()
+        confirmed = 0
         try:
-            # Create message payload
-            message = {**todo_data, "action": action}
-            message_bytes = json.dumps(message).encode()
+            acks = [await self._publish_message(message) for message in messages]
+            confirmed = await self._confirm(acks, settings.nats_publish_flush_timeout_seconds)
+        finally:
+            _record_publish("publisher", start, len(messages), confirmed)
+        if confirmed < len(messages):
+            raise ConnectionError(f"NATS confirmed {confirmed} of {len(messages)} events")
 
-            # Publish to NATS topic
-            await self.nc.publish(settings.nats_topic, message_bytes)
-            logger.info(f"Published {action} event for todo {todo_data.get('id')}")
-            return True
+    async def publish_event_batch(self, messages: list[dict[str, Any]], timeout: float) -> int:
+        """Publish complete event messages in order and wait until the server has received them.
+
+        Returns how many messages, from the start of the list, are confirmed: on core NATS 0 if
+        the confirming flush fails, since none of them can be known to have arrived; on
+        JetStream, those acknowledged before the first one that was not. Used by the outbox
+        relay, which only deletes confirmed events.
+        """
+        if not messages or not self.is_connected or not self.nc:
+            return 0
 
+        start = time.perf_counter()
+        acks = []
+        try:
+            for message in messages:
+                acks.append(await self._publish_message(message))
         except Exception as e:
-            logger.warning(f"Failed to publish NATS message: {e}")
-            return False
+            logger.warning(f"Failed to publish outbox batch after {len(acks)} messages: {e}")
+
+        confirmed = 0
+        if acks:
+            try:
+                confirmed = await self._confirm(acks, timeout)
+            except Exception as e:
+                logger.warning(f"NATS did not confirm {len(acks)} outbox messages: {e}")
+            else:
+                if confirmed < len(acks):
+                    logger.warning(f"JetStream acknowledged {confirmed} of {len(acks)} outbox messages")
+        _record_publish("outbox", start, len(messages), confirmed)
+        return confirmed
+
+    async def _publish_message(self, message: dict[str, Any]) -> asyncio.Future | None:
+        """Publish one event message; on JetStream, returns the future of its PubAck."""
+        traceparent = message.pop(TRACE_CONTEXT_KEY, None)
+        payload, headers = encode_event(message, self.encoding)
+        if traceparent:
+            headers[TRACEPARENT_HEADER] = traceparent
+        if self.js:
+            headers["Nats-Msg-Id"] = event_message_id(message)
+            return await self.js.publish_async(settings.nats_topic, payload, headers=headers)
+        await self.nc.publish(settings.nats_topic, payload, headers=headers)
+        return None
+
+    async def _confirm(self, acks: list[asyncio.Future | None], timeout: float) -> int:
+        """Wait until NATS has the published messages; returns how many, from the start, are confirmed.
+
+        Core NATS confirms receipt of everything at once by answering a flush PING, and raises if
+        it does not. JetStream acknowledges each message once the stream has stored it.
+        """
+        if not acks:
+            return 0
+        if self.js is None:
+            # The server answers the PING only after processing every message written before it
+            await self.nc.flush(timeout=timeout)
+            return len(acks)
+
+        done, pending = await asyncio.wait(acks, timeout=timeout)
+        for ack in pending:
+            ack.cancel()
+        confirmed = 0
+        for ack in acks:
+            if ack not in done or ack.exception() is not None:
+                break
+            confirmed += 1
+        return confirmed
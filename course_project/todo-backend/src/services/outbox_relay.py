@@ -0,0 +1,93 @@
+"""Background relay that publishes queued todo events from the outbox table to NATS.
+
+Writes queue their events in ``todo_outbox`` in the same transaction as the todo change (see
+``TodoOutboxDB``), so requests never wait for NATS and a crash between commit and publish loses
+nothing. The relay drains the table in batches, oldest first: right after a local write signals
+it via ``notify()``, and every ``interval_seconds`` to pick up events written by other replicas or
+left behind while NATS was unreachable.
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+
+from ..config.settings import settings
+from ..database.operations import TodoDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Publishes outbox events to NATS in batches and deletes them once confirmed."""
+
+    def __init__(
+        self, batch_size: int, interval_seconds: float, publish_timeout_seconds: float, claim_seconds: float = 30.0
+    ):
+        """Initialize an idle relay; it publishes nothing until started with a NATS service."""
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.publish_timeout_seconds = publish_timeout_seconds
+        self.claim_seconds = claim_seconds
+
+        self.nats_service = None  # Set by the lifespan once NATS is connected
+        self.published_total = 0
+
+        self._db = TodoDatabase()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """Signal that new events were committed, so the relay drains now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def drain_once(self) -> int:
+        """Publish one batch; returns the number of events published and removed from the outbox."""
+        nats_service = self.nats_service
+        if not nats_service or not nats_service.is_connected:
+            return 0
+
+        publish = functools.partial(nats_service.publish_event_batch, timeout=self.publish_timeout_seconds)
+        published = await self._db.relay_outbox(publish, self.batch_size, self.claim_seconds)
+        if published:
+            self.published_total += published
+            logger.info(f"Relayed {published} todo events from the outbox")
+        return published
+
+    def start(self) -> None:
+        """Start the background relay loop; pending events are published immediately."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Stop the background relay loop; unpublished events stay queued for the next start."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Drain until the outbox is empty, then sleep until notified or the poll interval elapses."""
+        while True:
+            # Cleared before draining, so a notify() during the drain triggers another pass
+            self._wakeup.clear()
+            try:
+                while await self.drain_once() == self.batch_size:
+                    pass
+            except Exception as e:
+                logger.warning(f"Outbox relay failed: {e}")
+
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.interval_seconds):
+                    await self._wakeup.wait()
+
+
+# Global outbox relay instance, started by the application lifespan
+outbox_relay = OutboxRelay(
+    batch_size=settings.outbox_batch_size,
+    interval_seconds=settings.outbox_poll_interval_seconds,
+    publish_timeout_seconds=settings.outbox_publish_timeout_seconds,
+    claim_seconds=settings.outbox_claim_seconds,
+)
@@ -0,0 +1,170 @@
+"""In-process read cache for todos, kept coherent across replicas via NATS todo events.
+
+The cache holds the full todo list in one slot (as ``Todo`` objects and, for the JSON read path,
+as pre-encoded bytes), the collection version used for ETags in another, and individual todos in
+a size-bounded LRU, all with a TTL. Local writes invalidate it directly; writes on other replicas
+arrive as ``todos.events`` messages and invalidate it through ``TodoService.handle_todo_event``.
+
+A generation counter guards against a read that started before a write storing its now
+stale result after the write invalidated the cache: readers take ``generation()`` before
+querying the database and the store is skipped if the generation moved in the meantime.
+"""
+
+import time
+from collections import OrderedDict
+
+from ..config.settings import settings
+from ..models.todo import Todo, TodoVersion
+
+
+class TodoCache:
+    """TTL + LRU cache for the todo list and individual todos."""
+
+    def __init__(self, ttl_seconds: float, max_items: int, enabled: bool = True):
+        """Initialize an empty cache."""
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self.enabled = enabled
+
+        self._items: OrderedDict[str, tuple[float, Todo]] = OrderedDict()
+        self._list: tuple[float, list[Todo]] | None = None
+        self._list_json: tuple[float, bytes, TodoVersion | None] | None = None
+        self._version: tuple[float, TodoVersion] | None = None
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def generation(self) -> int:
+        """Return the current generation; pass it back to ``set_*`` after reading the database."""
+        return self._generation
+
+    def get_list(self) -> list[Todo] | None:
+        """Return a copy of the cached todo list, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        if self._list and self._list[0] > time.monotonic():
+            self.hits += 1
+            return list(self._list[1])
+
+        self._list = None
+        self.misses += 1
+        return None
+
+    def set_list(self, todos: list[Todo], generation: int) -> None:
+        """Cache the full todo list unless the cache was invalidated since ``generation``."""
+        if self.enabled and generation == self._generation:
+            self._list = (time.monotonic() + self.ttl_seconds, list(todos))
+
+    def get_list_json(self) -> bytes | None:
+        """Return the cached JSON-encoded todo list, or None on a miss."""
+        entry = self.get_list_json_versioned()
+        return entry[0] if entry else None
+
+    def get_list_json_versioned(self) -> tuple[bytes, TodoVersion | None] | None:
+        """Return the cached JSON-encoded todo list and the collection version it was read at."""
+        if not self.enabled:
+            return None
+
+        if self._list_json and self._list_json[0] > time.monotonic():
+            self.hits += 1
+            return self._list_json[1], self._list_json[2]
+
+        self._list_json = None
+        self.misses += 1
+        return None
+
+    def set_list_json(self, body: bytes, generation: int, version: TodoVersion | None = None) -> None:
+        """Cache the JSON-encoded todo list unless the cache was invalidated since ``generation``."""
+        if self.enabled and generation == self._generation:
+            self._list_json = (time.monotonic() + self.ttl_seconds, body, version)
+
+    def get_version(self) -> TodoVersion | None:
+        """Return the cached collection version, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        if self._version and self._version[0] > time.monotonic():
+            self.hits += 1
+            return self._version[1]
+
+        self._version = None
+        self.misses += 1
+        return None
+
+    def set_version(self, version: TodoVersion, generation: int) -> None:
+        """Cache the collection version unless the cache was invalidated since ``generation``."""
+        if self.enabled and generation == self._generation:
+            self._version = (time.monotonic() + self.ttl_seconds, version)
+
+    def get_item(self, todo_id: str) -> Todo | None:
+        """Return a cached todo, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        entry = self._items.get(todo_id)
+        if entry and entry[0] > time.monotonic():
+            self._items.move_to_end(todo_id)
+            self.hits += 1
+            return entry[1]
+
+        if entry:
+            del self._items[todo_id]
+        self.misses += 1
+        return None
+
+    def set_item(self, todo: Todo, generation: int) -> None:
+        """Cache a single todo unless the cache was invalidated since ``generation``."""
+        if not self.enabled or generation != self._generation:
+            return
+
+        self._items[todo.id] = (time.monotonic() + self.ttl_seconds, todo)
+        self._items.move_to_end(todo.id)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def invalidate(self, todo_id: str | None = None) -> None:
+        """Drop the list and the given todo; with no ID, drop every cached todo."""
+        self._generation += 1
+        self.invalidations += 1
+        self._list = None
+        self._list_json = None
+        self._version = None
+        if todo_id is None:
+            self._items.clear()
+        else:
+            self._items.pop(str(todo_id), None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size for sizing the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "items": len(self._items),
+            "max_items": self.max_items,
+            "list_cached": self._list is not None,
+            "list_json_cached": self._list_json is not None,
+            "version_cached": self._version is not None,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# Global cache instance shared by all TodoService instances in this process
+todo_cache = TodoCache(
+    ttl_seconds=settings.todo_cache_ttl_seconds,
+    max_items=settings.todo_cache_max_items,
+    enabled=settings.todo_cache_enabled,
+)
@@ -1,51 +1,138 @@
 """Todo service for managing todo items with database backend."""
 
+import logging
+from collections.abc import AsyncIterator
+
+from ..config.settings import settings
 from ..database.operations import TodoDatabase
-from ..models.todo import Todo, TodoCreate, TodoStatus
+from ..models.todo import Todo, TodoCreate, TodoSort, TodoStats, TodoStatus, TodoVersion
+from .outbox_relay import outbox_relay
+from .todo_cache import TodoCache, todo_cache
+
+logger = logging.getLogger(__name__)
 
 
 class TodoService:
-    """Database-backed todo service."""
+    """Database-backed todo service.
+
+    With the outbox enabled (the default), every write queues its NATS events in the same
+    transaction and the ``OutboxRelay`` publishes them; the ``nats_service`` argument of the
+    write methods is then unused. Without it, events are published inline after the commit.
+    """
 
-    def __init__(self):
-        """Initialize the database backend."""
+    def __init__(self, cache: TodoCache | None = None, use_outbox: bool | None = None):
+        """Initialize the database backend and read cache."""
         self._db = TodoDatabase()
+        self._cache = cache or todo_cache
+        self._use_outbox = settings.outbox_enabled if use_outbox is None else use_outbox
         # Remove nats_service from constructor - injected per request
 
+    @property
+    def cache(self) -> TodoCache:
+        """Read cache in front of get_all_todos/get_todo_by_id."""
+        return self._cache
+
     async def get_all_todos(self) -> list[Todo]:
-        """Get all todos."""
-        return await self._db.get_all_todos()
+        """Get all todos, served from the read cache when fresh."""
+        cached = self._cache.get_list()
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation()
+        todos = await self._db.get_all_todos()
+        self._cache.set_list(todos, generation)
+        return todos
+
+    async def get_all_todos_json(
+        self, status: TodoStatus | None = None, q: str | None = None, sort: TodoSort = TodoSort.CREATED_DESC
+    ) -> tuple[bytes, TodoVersion | None]:
+        """Get todos as a JSON array and the collection version it was read at.
+
+        The unfiltered default listing is served from the read cache when fresh.
+        """
+        if status is not None or q or sort is not TodoSort.CREATED_DESC:
+            return await self._db.get_all_todos_json(status=status, q=q, sort=sort)
+
+        cached = self._cache.get_list_json_versioned()
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation()
+        body, version = await self._db.get_all_todos_json()
+        self._cache.set_list_json(body, generation, version)
+        return body, version
+
+    async def get_todos_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        status: TodoStatus | None = None,
+        q: str | None = None,
+        sort: TodoSort = TodoSort.CREATED_DESC,
+    ) -> tuple[list[Todo], str | None]:
+        """Get one page of todos and the cursor for the next page."""
+        return await self._db.get_todos_page(limit, cursor, status=status, q=q, sort=sort)
+
+    async def get_todos_page_json(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        status: TodoStatus | None = None,
+        q: str | None = None,
+        sort: TodoSort = TodoSort.CREATED_DESC,
+    ) -> tuple[bytes, str | None, TodoVersion | None]:
+        """Get one page of todos as a JSON array, the cursor for the next page and the collection version."""
+        return await self._db.get_todos_page_json(limit, cursor, status=status, q=q, sort=sort)
+
+    async def get_todos_version(self) -> TodoVersion | None:
+        """Get the collection version for conditional requests, served from the read cache when fresh."""
+        cached = self._cache.get_version()
+        if cached is not None:
+            return cached
+
+        generation = self._cache.generation()
+        version = await self._db.get_todos_version()
+        if version is not None:
+            self._cache.set_version(version, generation)
+        return version
+
+    def stream_all_todos(self, batch_size: int = 500) -> AsyncIterator[Todo]:
+        """Stream all todos without loading the full result set into memory."""
+        return self._db.stream_todos(batch_size)
 
     async def get_todo_by_id(self, todo_id: str) -> Todo | None:
-        """Get a todo by ID."""
-        return await self._db.get_todo(todo_id)
+        """Get a todo by ID, served from the read cache when fresh."""
+        cached = self._cache.get_item(todo_id)
+        if cached is not None:
+            return cached
 
-    async def create_todo(self, todo_data: TodoCreate, nats_service=None) -> Todo:
-        """Create a new todo."""
-        import logging
+        generation = self._cache.generation()
+        todo = await self._db.get_todo(todo_id)
+        if todo:
+            self._cache.set_item(todo, generation)
+        return todo
 
-        logger = logging.getLogger(__name__)
+    def handle_todo_event(self, event: dict) -> None:
+        """Invalidate cached reads for a todo event received from NATS (any replica)."""
+        self._cache.invalidate(event.get("id"))
 
+    async def create_todo(self, todo_data: TodoCreate, nats_service=None) -> Todo:
+        """Create a new todo."""
         logger.info(f"Creating todo: {todo_data.text}")
 
         # Create todo in database first
-        todo = await self._db.create_todo(todo_data.text)
+        todo = await self._db.create_todo(todo_data.text, outbox=self._use_outbox)
+        self._cache.invalidate(todo.id)
         logger.info(f"Todo created in database with ID: {todo.id}")
 
         # Publish NATS event if service is available
-        if nats_service:
+        if self._use_outbox:
+            outbox_relay.notify()
+        elif nats_service:
             logger.info(f"NATS service available: {type(nats_service)}")
             try:
-                todo_data_dict = {
-                    "id": todo.id,
-                    "text": todo.text,
-                    "status": todo.status,
-                    "created_at": todo.created_at.isoformat(),
-                    "updated_at": todo.updated_at.isoformat() if todo.updated_at else todo.created_at.isoformat(),
-                }
-
                 await nats_service.publish_todo_event(
-                    todo_data=todo_data_dict,
+                    todo_data=self._event_payload(todo),
                     action="created",
                 )
                 logger.info(f"✅ Published NATS event for todo creation: {todo.id}")
@@ -56,32 +143,34 @@ class TodoService:
 
         return todo
 
+    async def create_todos(self, todos_data: list[TodoCreate], nats_service=None) -> list[Todo]:
+        """Create several todos in one database round trip and publish their events as a batch."""
+        logger.info(f"Creating batch of {len(todos_data)} todos")
+
+        todos = await self._db.create_todos([todo_data.text for todo_data in todos_data], outbox=self._use_outbox)
+        self._cache.invalidate()
+        logger.info(f"Batch of {len(todos)} todos created in database")
+
+        await self._publish_batch(todos, "created", nats_service)
+        return todos
+
     async def update_todo(
         self, todo_id: str, text: str | None = None, status: TodoStatus | None = None, nats_service=None
     ) -> Todo | None:
         """Update an existing todo."""
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         logger.info(f"Updating todo: {todo_id}")
 
         # Update todo in database first
-        todo = await self._db.update_todo(todo_id, text, status)
+        todo = await self._db.update_todo(todo_id, text, status, outbox=self._use_outbox)
+        self._cache.invalidate(todo_id)
 
-        if todo and nats_service:
+        if todo and self._use_outbox:
+            outbox_relay.notify()
+        elif todo and nats_service:
             logger.info(f"NATS service available for update: {type(nats_service)}")
             try:
-                todo_data_dict = {
-                    "id": todo.id,
-                    "text": todo.text,
-                    "status": todo.status,
-                    "created_at": todo.created_at.isoformat(),
-                    "updated_at": todo.updated_at.isoformat() if todo.updated_at else todo.created_at.isoformat(),
-                }
-
                 await nats_service.publish_todo_event(
-                    todo_data=todo_data_dict,
+                    todo_data=self._event_payload(todo),
                     action="updated",
                 )
                 logger.info(f"✅ Published NATS event for todo update: {todo.id}")
@@ -92,22 +181,92 @@ class TodoService:
 
         return todo
 
-    async def delete_todo(self, todo_id: str) -> bool:
-        """Delete a todo by ID."""
-        return await self._db.delete_todo(todo_id)
+    async def delete_todo(self, todo_id: str, nats_service=None) -> bool:
+        """Delete a todo by ID and publish a deleted event so other replicas drop it from cache."""
+        todo = await self._db.delete_todo(todo_id, outbox=self._use_outbox)
+        self._cache.invalidate(todo_id)
+
+        if todo and self._use_outbox:
+            outbox_relay.notify()
+        elif todo and nats_service:
+            try:
+                await nats_service.publish_todo_event(
+                    todo_data=self._event_payload(todo),
+                    action="deleted",
+                )
+                logger.info(f"✅ Published NATS event for todo deletion: {todo.id}")
+            except Exception as e:
+                logger.error(f"❌ Failed to publish NATS event: {e}")
+
+        return todo is not None
+
+    async def update_todos(
+        self, todo_ids: list[str], text: str | None = None, status: TodoStatus | None = None, nats_service=None
+    ) -> list[Todo]:
+        """Apply the same update to several todos and publish one event per updated todo."""
+        todos = await self._db.update_todos(todo_ids, text, status, outbox=self._use_outbox)
+        self._cache.invalidate()
+        logger.info(f"Bulk update affected {len(todos)} of {len(todo_ids)} requested todos")
+
+        await self._publish_batch(todos, "updated", nats_service)
+        return todos
+
+    async def delete_todos(
+        self, todo_ids: list[str] | None = None, status: TodoStatus | None = None, nats_service=None
+    ) -> list[Todo]:
+        """Delete todos by ID list and/or status and publish one event per deleted todo."""
+        todos = await self._db.delete_todos(todo_ids, status, outbox=self._use_outbox)
+        self._cache.invalidate()
+        logger.info(f"Bulk delete removed {len(todos)} todos")
+
+        await self._publish_batch(todos, "deleted", nats_service)
+        return todos
+
+    async def get_todo_count(self, exact: bool = False) -> int:
+        """Get total number of todos (O(1) from the stats row unless ``exact``)."""
+        return await self._db.count_todos(exact)
+
+    async def get_todo_stats(self, exact: bool = False) -> TodoStats:
+        """Get total, done and not-done counts (O(1) from the stats row unless ``exact``)."""
+        return TodoStats(**await self._db.get_todo_stats(exact), exact=exact)
+
+    async def _publish_batch(self, todos: list[Todo], action: str, nats_service=None) -> None:
+        """Publish one NATS event per todo as a single batch, never failing the caller.
+
+        With the outbox the events are already queued, so the relay is only woken up.
+        """
+        if not todos:
+            return
+        if self._use_outbox:
+            outbox_relay.notify()
+            return
+        if not nats_service:
+            logger.info(f"No NATS service provided, skipping {len(todos)} {action} events")
+            return
+
+        try:
+            await nats_service.publish_todo_events(
+                todo_data_list=[self._event_payload(todo) for todo in todos],
+                action=action,
+            )
+            logger.info(f"✅ Published {len(todos)} NATS {action} events")
+        except Exception as e:
+            logger.error(f"❌ Failed to publish NATS batch: {e}")
 
-    async def get_todo_count(self) -> int:
-        """Get total number of todos."""
-        return await self._db.count_todos()
+    @staticmethod
+    def _event_payload(todo: Todo) -> dict:
+        """Build the NATS event payload for a todo."""
+        return todo.event_payload()
 
     async def initialize_with_sample_data(self) -> None:
         """Initialize database with sample todos if empty."""
         count = await self.get_todo_count()
         if count == 0:
-            # Create sample todos (without NATS during initialization)
-            todo1 = await self.create_todo(TodoCreate(text="Learn Kubernetes service discovery"), nats_service=None)
-            await self.create_todo(TodoCreate(text="Implement REST API endpoints"), nats_service=None)
-            await self.create_todo(TodoCreate(text="Test inter-service communication"), nats_service=None)
+            # Create sample todos (without NATS during initialization, so nothing goes to the outbox either)
+            seeder = TodoService(self._cache, use_outbox=False)
+            todo1 = await seeder.create_todo(TodoCreate(text="Learn Kubernetes service discovery"), nats_service=None)
+            await seeder.create_todo(TodoCreate(text="Implement REST API endpoints"), nats_service=None)
+            await seeder.create_todo(TodoCreate(text="Test inter-service communication"), nats_service=None)
 
             # Mark first todo as done for demo
-            await self.update_todo(todo1.id, status=TodoStatus.DONE, nats_service=None)
+            await seeder.update_todo(todo1.id, status=TodoStatus.DONE, nats_service=None)
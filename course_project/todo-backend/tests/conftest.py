@@ -188,6 +188,11 @@ async def test_db_manager(test_db_engine):
     src.database.connection.db_manager = test_manager
     src.database.operations.db_manager = test_manager
 
+    # Cached reads from a previous test's database must not leak into this one
+    from src.services.todo_cache import todo_cache
+
+    todo_cache.clear()
+
     # Create fresh tables for this test (simplified approach)
     async with test_db_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -251,6 +256,56 @@ async def async_test_client(test_db_manager):
         yield client
 
 
+@pytest.fixture
+def nats_server(tmp_path):
+    """Run a throwaway nats-server with JetStream and yield its URL.
+
+    Uses ``NATS_SERVER_BIN`` or ``nats-server`` on PATH (the ``nats-server-bin`` dev dependency
+    provides one); tests using it are skipped when neither exists.
+    """
+    import shutil
+    import socket
+
+    binary = os.getenv("NATS_SERVER_BIN") or shutil.which("nats-server")
+    if not binary:
+        pytest.skip("nats-server binary not found")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [binary, "-a", "127.0.0.1", "-p", str(port), "-js", "-sd", str(tmp_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("nats-server failed to start") from None
+                time.sleep(0.05)
+        yield f"nats://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@pytest.fixture
+def inline_nats_events():
+    """Publish todo events inline after commit, as with ``OUTBOX_ENABLED=false``, instead of via the outbox."""
+    from unittest.mock import patch
+
+    from src.config.settings import settings
+
+    with patch.object(settings, "outbox_enabled", False):
+        yield
+
+
 @pytest.fixture
 def sample_todo_data():
     """Sample todo data matching backend's Todo model format.
@@ -0,0 +1,82 @@
+"""Integration tests for ETag / Last-Modified and 304 responses on GET /todos and GET /todos/{id}."""
+
+from httpx import AsyncClient
+
+
+class TestCollectionConditionalGet:
+    """Test that the collection tag follows the change sequence in the stats row."""
+
+    async def test_unchanged_collection_is_not_modified(self, test_client: AsyncClient):
+        """Test that replaying the ETag or Last-Modified gets an empty 304."""
+        await test_client.post("/todos", json={"text": "Cached in the browser"})
+
+        response = await test_client.get("/todos")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, no-cache"
+        etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+        response = await test_client.get("/todos", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = await test_client.get("/todos", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+    async def test_every_kind_of_write_changes_the_tag(self, test_client: AsyncClient):
+        """Test that create, update, bulk update and delete each produce a new collection tag."""
+        todo = (await test_client.post("/todos", json={"text": "Versioned"})).json()
+        writes = [
+            lambda: test_client.post("/todos/batch", json=[{"text": "A"}, {"text": "B"}]),
+            lambda: test_client.put(f"/todos/{todo['id']}", json={"text": "Same count, new text"}),
+            lambda: test_client.patch("/todos", json={"ids": [todo["id"]], "status": "done"}),
+            lambda: test_client.delete(f"/todos/{todo['id']}"),
+        ]
+
+        etag = (await test_client.get("/todos")).headers["etag"]
+        for write in writes:
+            await write()
+            response = await test_client.get("/todos", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["etag"] != etag
+            etag = response.headers["etag"]
+
+    async def test_pages_and_filters_are_tagged(self, test_client: AsyncClient):
+        """Test that paged and filtered listings carry the collection tag and honour it."""
+        await test_client.post("/todos/batch", json=[{"text": f"Page {i}"} for i in range(3)])
+
+        response = await test_client.get("/todos", params={"limit": 2, "status": "not-done"})
+        etag = response.headers["etag"]
+        assert "link" in response.headers
+
+        response = await test_client.get(
+            "/todos", params={"limit": 2, "status": "not-done"}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+
+class TestItemConditionalGet:
+    """Test that an item tag follows the todo's updated_at."""
+
+    async def test_item_is_not_modified_until_updated(self, test_client: AsyncClient):
+        """Test 304 for an unchanged todo and a new tag after updating it."""
+        todo = (await test_client.post("/todos", json={"text": "Single item"})).json()
+
+        response = await test_client.get(f"/todos/{todo['id']}")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await test_client.get(f"/todos/{todo['id']}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        await test_client.put(f"/todos/{todo['id']}", json={"status": "done"})
+        response = await test_client.get(f"/todos/{todo['id']}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["status"] == "done"
+        assert response.headers["etag"] != etag
+
+    async def test_other_json_gets_keep_no_store(self, test_client: AsyncClient):
+        """Test that routes without a declared policy still get the default no-store policy."""
+        response = await test_client.get("/todos/stats")
+        assert response.headers["cache-control"] == "no-cache, no-store, must-revalidate"
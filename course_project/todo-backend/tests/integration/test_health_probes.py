@@ -1,11 +1,13 @@
 """Integration tests for health probe endpoints."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from src.main import create_app
+from src.services.health_monitor import HealthMonitor
 
 
 @pytest.fixture
@@ -23,12 +25,25 @@ def mock_db_manager():
 
 
 @pytest.fixture
-def mock_todo_service():
-    """Mock todo service for testing."""
-    with patch("src.api.routes.health.get_todo_service") as mock:
+def mock_todo_count():
+    """Mock the todo count the health monitor reads after a successful database check."""
+    with patch("src.services.health_monitor.TodoDatabase") as mock:
         yield mock
 
 
+@pytest.fixture
+def monitor():
+    """Fresh health monitor behind the probe endpoints; tests run its checks explicitly."""
+    health_monitor = HealthMonitor(interval_seconds=5, timeout_seconds=1, stale_after_seconds=15)
+    with patch("src.api.routes.health.health_monitor", health_monitor):
+        yield health_monitor
+
+
+def run_check(health_monitor: HealthMonitor) -> None:
+    """Run one monitor check, as the background task would."""
+    asyncio.run(health_monitor.check_once())
+
+
 class TestHealthzEndpoint:
     """Test lightweight /healthz endpoint."""
 
@@ -66,17 +81,13 @@ class TestHealthzEndpoint:
 
 
 class TestHealthEndpoint:
-    """Test comprehensive /health endpoint."""
+    """Test comprehensive /health endpoint, served from the health monitor's cached status."""
 
-    def test_health_database_available(self, client, mock_db_manager, mock_todo_service):
-        """Test /health returns 200 when database is available."""
-        # Mock successful database connection
+    def test_health_database_available(self, client, mock_db_manager, mock_todo_count, monitor):
+        """Test /health returns 200 when the last database check passed."""
         mock_db_manager.health_check = AsyncMock(return_value=True)
-
-        # Mock todo service
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_todo_count = AsyncMock(return_value=5)
-        mock_todo_service.return_value = mock_service_instance
+        mock_todo_count.return_value.count_todos = AsyncMock(return_value=5)
+        run_check(monitor)
 
         response = client.get("/health")
 
@@ -87,11 +98,24 @@ class TestHealthEndpoint:
         assert data["database"] == "connected"
         assert data["todos_count"] == 5
         assert "timestamp" in data
+        assert data["checked_at"] is not None
 
-    def test_health_database_unavailable(self, client, mock_db_manager):
-        """Test /health returns 503 when database is unavailable."""
-        # Mock failed database connection
+    def test_health_probe_does_not_touch_database(self, client, mock_db_manager, mock_todo_count, monitor):
+        """Test probes read the cached status instead of checking the database themselves."""
+        mock_db_manager.health_check = AsyncMock(return_value=True)
+        mock_todo_count.return_value.count_todos = AsyncMock(return_value=0)
+        run_check(monitor)
+        mock_db_manager.health_check.reset_mock()
+
+        for _ in range(5):
+            assert client.get("/health").status_code == 200
+
+        mock_db_manager.health_check.assert_not_called()
+
+    def test_health_database_unavailable(self, client, mock_db_manager, monitor):
+        """Test /health returns 503 when the last database check failed."""
         mock_db_manager.health_check = AsyncMock(return_value=False)
+        run_check(monitor)
 
         response = client.get("/health")
 
@@ -103,10 +127,10 @@ class TestHealthEndpoint:
         assert "debug_info" in data
         assert "HTTPException" in data["debug_info"]["error_type"]
 
-    def test_health_database_error(self, client, mock_db_manager):
-        """Test /health returns 503 when database check raises exception."""
-        # Mock database exception
+    def test_health_database_error(self, client, mock_db_manager, monitor):
+        """Test /health returns 503 when the database check raised."""
         mock_db_manager.health_check = AsyncMock(side_effect=Exception("DB Connection failed"))
+        run_check(monitor)
 
         response = client.get("/health")
 
@@ -117,22 +141,32 @@ class TestHealthEndpoint:
         assert "debug_info" in data
         assert "HTTPException" in data["debug_info"]["error_type"]
 
-    def test_health_todo_service_error(self, client, mock_db_manager, mock_todo_service):
-        """Test /health handles todo service errors gracefully."""
-        # Mock successful database but failing todo service
+    def test_health_todo_count_error(self, client, mock_db_manager, mock_todo_count, monitor):
+        """Test a failing count marks the database unhealthy."""
         mock_db_manager.health_check = AsyncMock(return_value=True)
-        mock_service_instance = AsyncMock()
-        mock_service_instance.get_todo_count = AsyncMock(side_effect=Exception("Service error"))
-        mock_todo_service.return_value = mock_service_instance
+        mock_todo_count.return_value.count_todos = AsyncMock(side_effect=Exception("Service error"))
+        run_check(monitor)
+
+        response = client.get("/health")
+
+        assert response.status_code == 503
+
+    def test_health_not_ready_before_first_check(self, client, monitor):
+        """Test /health returns 503 until the monitor has completed a check."""
+        response = client.get("/health")
+
+        assert response.status_code == 503
+
+    def test_health_not_ready_when_status_is_stale(self, client, mock_db_manager, mock_todo_count, monitor):
+        """Test /health returns 503 when the last successful check is too old."""
+        mock_db_manager.health_check = AsyncMock(return_value=True)
+        mock_todo_count.return_value.count_todos = AsyncMock(return_value=1)
+        run_check(monitor)
+        monitor._last_check_at -= monitor.stale_after_seconds + 1
 
         response = client.get("/health")
 
         assert response.status_code == 503
-        data = response.json()
-        assert "detail" in data
-        # Verify the error was processed correctly
-        assert "debug_info" in data
-        assert "HTTPException" in data["debug_info"]["error_type"]
 
 
 class TestDatabaseResilience:
@@ -178,11 +212,12 @@ class TestDatabaseResilience:
 class TestEndpointSecurity:
     """Test health endpoints follow security guidelines."""
 
-    def test_health_no_sensitive_info_in_error(self, client, mock_db_manager):
+    def test_health_no_sensitive_info_in_error(self, client, mock_db_manager, monitor):
         """Test error responses don't expose sensitive information."""
         mock_db_manager.health_check = AsyncMock(
             side_effect=Exception("Connection to db-server-internal-host:5432 failed")
         )
+        run_check(monitor)
 
         response = client.get("/health")
 
@@ -195,6 +230,7 @@ class TestEndpointSecurity:
 
         # Verify error is sanitized
         assert data["detail"] == "Internal server error"
+        assert "db-server-internal-host" not in response.text
 
     def test_healthz_no_error_leakage(self, client):
         """Test /healthz never leaks error information."""
@@ -0,0 +1,133 @@
+"""Integration tests for JetStream publishing against a local nats-server (see the ``nats_server`` fixture)."""
+
+from unittest.mock import patch
+
+import nats
+import pytest
+from nats.js.api import ConsumerConfig, DeliverPolicy
+
+from src.config.settings import settings
+from src.events.schema import EventEncoding, decode_event
+from src.observability.tracing import TRACE_CONTEXT_KEY, TRACEPARENT_HEADER
+from src.services.nats_service import NATSService, event_message_id
+
+
+def _event(todo_id: str, action: str = "created", updated_at: str = "2025-01-01T00:00:00+00:00") -> dict:
+    return {"id": todo_id, "text": f"Todo {todo_id}", "status": "not-done", "updated_at": updated_at, "action": action}
+
+
+@pytest.fixture
+async def jetstream_service(nats_server):
+    """A connected NATSService publishing directly to JetStream on the local server."""
+    with (
+        patch.object(settings, "nats_url", nats_server),
+        patch.object(settings, "nats_jetstream_enabled", True),
+        patch.object(settings, "nats_publish_mode", "direct"),
+    ):
+        service = NATSService()
+        assert await service.connect()
+        yield service
+        await service.disconnect()
+
+
+async def _stream_messages(nats_server: str, start_sequence: int = 1) -> list[dict]:
+    """Replay the todo stream from ``start_sequence`` with an ephemeral consumer."""
+    nc = await nats.connect(nats_server)
+    try:
+        js = nc.jetstream()
+        info = await js.stream_info(settings.nats_stream_name)
+        if info.state.last_seq < start_sequence:
+            return []
+        subscription = await js.subscribe(
+            settings.nats_topic,
+            deliver_policy=DeliverPolicy.BY_START_SEQUENCE,
+            config=ConsumerConfig(opt_start_seq=start_sequence),
+        )
+        count = info.state.last_seq - start_sequence + 1
+        messages = [await subscription.next_msg(timeout=2) for _ in range(count)]
+        await subscription.unsubscribe()
+        return [decode_event(msg.data, msg.headers) for msg in messages]
+    finally:
+        await nc.close()
+
+
+class TestJetStreamPublishing:
+    """Test the stream, PubAck-confirmed batches, deduplication and replay."""
+
+    async def test_connect_creates_the_stream(self, jetstream_service, nats_server):
+        """Test that the stream captures the todo event subject."""
+        info = await jetstream_service.js.stream_info(settings.nats_stream_name)
+
+        assert info.config.subjects == [settings.nats_topic]
+        assert info.config.duplicate_window == settings.nats_stream_duplicate_window_seconds
+
+    async def test_outbox_batch_is_confirmed_by_acks(self, jetstream_service, nats_server):
+        """Test that a relayed batch is acknowledged message by message and stored in order."""
+        messages = [_event("1"), _event("2"), _event("1", "updated", "2025-01-01T00:00:01+00:00")]
+
+        assert await jetstream_service.publish_event_batch(messages, timeout=5) == 3
+        assert await _stream_messages(nats_server) == messages
+
+    async def test_republished_event_is_deduplicated(self, jetstream_service, nats_server):
+        """Test that an event published twice (e.g. an outbox retry) is stored once."""
+        event = _event("7")
+
+        assert await jetstream_service.publish_event_batch([event], timeout=5) == 1
+        assert await jetstream_service.publish_event_batch([event, _event("8")], timeout=5) == 2
+
+        assert [message["id"] for message in await _stream_messages(nats_server)] == ["7", "8"]
+
+    async def test_delete_is_not_mistaken_for_a_duplicate(self, jetstream_service, nats_server):
+        """Test that a delete with the same updated_at as the preceding update is kept."""
+        updated, deleted = _event("3", "updated"), _event("3", "deleted")
+        assert event_message_id(updated) != event_message_id(deleted)
+
+        assert await jetstream_service.publish_event_batch([updated, deleted], timeout=5) == 2
+        assert [message["action"] for message in await _stream_messages(nats_server)] == ["updated", "deleted"]
+
+    async def test_consumer_replays_from_a_sequence(self, jetstream_service, nats_server):
+        """Test that events published while no consumer ran can be replayed from a sequence number."""
+        for i in range(5):
+            assert await jetstream_service.publish_todo_event(_event(str(i)), "created")
+
+        replayed = await _stream_messages(nats_server, start_sequence=3)
+        assert [message["id"] for message in replayed] == ["2", "3", "4"]
+
+    async def test_batched_mode_confirms_with_acks(self, nats_server):
+        """Test that the background publisher's batches go to the stream as well."""
+        with (
+            patch.object(settings, "nats_url", nats_server),
+            patch.object(settings, "nats_jetstream_enabled", True),
+            patch.object(settings, "nats_publish_mode", "batched"),
+        ):
+            service = NATSService()
+            assert await service.connect()
+            assert await service.publish_todo_events([_event("1"), _event("2")], "created") == 2
+            await service.disconnect()
+
+        assert service.js is None
+        assert [message["id"] for message in await _stream_messages(nats_server)] == ["1", "2"]
+
+    async def test_msgpack_events_carry_their_envelope(self, jetstream_service, nats_server):
+        """Test that msgpack bodies are stored with the headers consumers decode them by."""
+        jetstream_service.encoding = EventEncoding.MSGPACK
+        event = _event("9")
+
+        assert await jetstream_service.publish_event_batch([event], timeout=5) == 1
+        assert await _stream_messages(nats_server) == [event]
+
+        message = await jetstream_service.js.get_msg(settings.nats_stream_name, seq=1)
+        assert message.headers["Content-Type"] == "application/msgpack"
+        assert message.headers["Todo-Event-Version"] == "1"
+        assert message.headers["Nats-Msg-Id"] == event_message_id(event)
+
+    async def test_outbox_event_carries_the_write_trace(self, jetstream_service, nats_server):
+        """Test that an outbox event's stored traceparent is sent as the header the broadcaster reads."""
+        event = _event("5")
+        traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        assert await jetstream_service.publish_event_batch([{**event, TRACE_CONTEXT_KEY: traceparent}], timeout=5) == 1
+        assert await _stream_messages(nats_server) == [event]
+
+        message = await jetstream_service.js.get_msg(settings.nats_stream_name, seq=1)
+        assert message.headers[TRACEPARENT_HEADER] == traceparent
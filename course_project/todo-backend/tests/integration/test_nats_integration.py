@@ -2,11 +2,13 @@
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from httpx import AsyncClient
 
 
+@pytest.mark.usefixtures("inline_nats_events")
 class TestNATSIntegration:
-    """Test NATS integration with todo operations."""
+    """Test NATS integration with todo operations when events are published inline (outbox disabled)."""
 
     async def test_create_todo_publishes_nats_message(self, test_client: AsyncClient):
         """Test that creating a todo publishes a NATS message."""
@@ -0,0 +1,113 @@
+"""Integration tests for the transactional outbox and its relay to NATS."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+from httpx import AsyncClient
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database.models import OUTBOX_RELAY_LOCK_ID, TodoOutboxDB
+from src.services.outbox_relay import OutboxRelay
+
+
+def _relay(publish_event_batch: AsyncMock) -> OutboxRelay:
+    relay = OutboxRelay(batch_size=100, interval_seconds=10, publish_timeout_seconds=1)
+    relay.nats_service = MagicMock(is_connected=True, publish_event_batch=publish_event_batch)
+    return relay
+
+
+def _confirm_all() -> AsyncMock:
+    return AsyncMock(side_effect=lambda messages, timeout: len(messages))
+
+
+async def _outbox_size(test_db_manager) -> int:
+    async with test_db_manager.get_session() as s:
+        return await s.scalar(select(func.count(TodoOutboxDB.id)))
+
+
+class TestOutbox:
+    """Test that writes queue events in the same transaction and the relay delivers them in order."""
+
+    async def test_writes_queue_events_without_publishing_inline(self, test_client: AsyncClient, test_db_manager):
+        """Test that a create queues its event and the request does not touch NATS."""
+        nats_service = test_client._test_app.state.nats_service
+
+        response = await test_client.post("/todos", json={"text": "Queued"})
+        assert response.status_code == 201
+
+        nats_service.publish_todo_event.assert_not_called()
+        async with test_db_manager.get_session() as s:
+            rows = (await s.execute(select(TodoOutboxDB.todo_id, TodoOutboxDB.payload))).all()
+        assert len(rows) == 1
+        assert str(rows[0].todo_id) == response.json()["id"]
+        assert rows[0].payload["action"] == "created"
+        assert rows[0].payload["text"] == "Queued"
+
+    async def test_relay_publishes_in_commit_order_and_deletes(self, test_client: AsyncClient, test_db_manager):
+        """Test that events for one todo are published in the order the changes were made."""
+        todo = (await test_client.post("/todos", json={"text": "First"})).json()
+        await test_client.put(f"/todos/{todo['id']}", json={"status": "done"})
+        await test_client.patch("/todos", json={"ids": [todo["id"]], "text": "Second"})
+        await test_client.delete(f"/todos/{todo['id']}")
+
+        publish = _confirm_all()
+        assert await _relay(publish).drain_once() == 4
+
+        messages = publish.call_args.args[0]
+        assert [message["action"] for message in messages] == ["created", "updated", "updated", "deleted"]
+        assert [message["text"] for message in messages] == ["First", "First", "Second", "Second"]
+        assert await _outbox_size(test_db_manager) == 0
+
+    async def test_unconfirmed_events_stay_queued(self, test_client: AsyncClient, test_db_manager):
+        """Test that events NATS did not confirm are kept and published on the next round."""
+        await test_client.post("/todos/batch", json=[{"text": "One"}, {"text": "Two"}, {"text": "Three"}])
+
+        relay = _relay(AsyncMock(return_value=1))
+        assert await relay.drain_once() == 1
+        assert await _outbox_size(test_db_manager) == 2
+
+        relay.nats_service.publish_event_batch = _confirm_all()
+        assert await relay.drain_once() == 2
+        assert [message["text"] for message in relay.nats_service.publish_event_batch.call_args.args[0]] == [
+            "Two",
+            "Three",
+        ]
+
+    async def test_relay_skips_while_another_replica_holds_the_lock(self, test_client: AsyncClient, test_db_manager):
+        """Test that only one relay publishes at a time."""
+        await test_client.post("/todos", json={"text": "Locked"})
+
+        other_replica = create_async_engine(os.environ["DATABASE_URL"])
+        try:
+            async with other_replica.begin() as conn:
+                await conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": OUTBOX_RELAY_LOCK_ID})
+
+                publish = _confirm_all()
+                assert await _relay(publish).drain_once() == 0
+                publish.assert_not_called()
+        finally:
+            await other_replica.dispose()
+
+        assert await _relay(_confirm_all()).drain_once() == 1
+
+    async def test_publish_holds_no_lock_and_other_relays_wait_for_the_claim(
+        self, test_client: AsyncClient, test_db_manager
+    ):
+        """Test that NATS is called outside the claim transaction, and a second relay skips the claimed events."""
+        await test_client.post("/todos", json={"text": "Claimed"})
+        other_relay_publish = _confirm_all()
+        observed = {}
+
+        async def publish(messages, timeout):
+            async with test_db_manager.get_session() as s:
+                observed["lock_free"] = await s.scalar(select(func.pg_try_advisory_xact_lock(OUTBOX_RELAY_LOCK_ID)))
+                await s.rollback()
+            observed["other_relay"] = await _relay(other_relay_publish).drain_once()
+            return len(messages)
+
+        assert await _relay(AsyncMock(side_effect=publish)).drain_once() == 1
+
+        assert observed == {"lock_free": True, "other_relay": 0}
+        other_relay_publish.assert_not_called()
+        assert await _outbox_size(test_db_manager) == 0
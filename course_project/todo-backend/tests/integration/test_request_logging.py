@@ -40,8 +40,7 @@ class TestRequestLoggingMiddleware:
 
         log_contents = log_capture.getvalue()
 
-        # Should contain request and response logs
-        assert "REQUEST" in log_contents
+        # Should contain the combined request/response record
         assert "RESPONSE" in log_contents
 
         # Should contain method and path
@@ -93,7 +92,7 @@ class TestRequestLoggingMiddleware:
         assert any(error_type in log_contents for error_type in ["NOT_FOUND", "404"])
 
         # All errors should be marked as errors
-        assert log_contents.count('"error": true') >= 2
+        assert log_contents.count('"error":true') >= 2
 
     async def test_request_logging_includes_response_time(self, test_client: AsyncClient, log_capture):
         """Test that request logs include response time for performance monitoring."""
@@ -107,7 +106,7 @@ class TestRequestLoggingMiddleware:
 
     async def test_request_logging_json_structured(self, test_client: AsyncClient, log_capture):
         """Test that logs are in JSON format for Grafana parsing."""
-        response = await test_client.get("/be-health")
+        response = await test_client.get("/todos")
         assert response.status_code == 200
 
         log_contents = log_capture.getvalue()
@@ -126,6 +125,21 @@ class TestRequestLoggingMiddleware:
 
         assert json_found, f"No JSON-structured logs found in: {log_contents}"
 
+    async def test_probe_requests_not_logged(self, test_client: AsyncClient, log_capture):
+        """Test that successful health probes are excluded from request logs by default."""
+        response = await test_client.get("/healthz")
+        assert response.status_code == 200
+
+        assert "/healthz" not in log_capture.getvalue()
+
+    async def test_logged_records_carry_sample_weight(self, test_client: AsyncClient, log_capture):
+        """Test that each record states how many requests it stands for."""
+        response = await test_client.get("/todos")
+        assert response.status_code == 200
+
+        (record,) = [json.loads(line) for line in log_capture.getvalue().splitlines() if line.strip()]
+        assert record["sample_weight"] == 1.0
+
     async def test_request_logging_contains_required_fields(self, test_client: AsyncClient, log_capture):
         """Test that request logs contain all required fields for monitoring."""
         response = await test_client.get("/todos")
@@ -191,8 +205,8 @@ class TestRequestCorrelation:
         log_contents = log_capture.getvalue()
         assert existing_id in log_contents
 
-    async def test_correlation_id_links_request_and_response_logs(self, test_client: AsyncClient, log_capture):
-        """Test that request and response logs share the same correlation ID."""
+    async def test_correlation_id_in_combined_log_record(self, test_client: AsyncClient, log_capture):
+        """Test that each request is logged once, with its correlation ID and response details."""
         response = await test_client.post("/todos", json={"text": "Test correlation"})
 
         correlation_id = response.headers["X-Request-ID"]
@@ -204,20 +218,16 @@ class TestRequestCorrelation:
         for line in log_lines:
             try:
                 parsed = json.loads(line)
-                if "event" in parsed:
+                if parsed.get("request_id") == correlation_id:
                     log_entries.append(parsed)
             except json.JSONDecodeError:
                 continue
 
-        # Find request and response logs
-        request_logs = [log for log in log_entries if log.get("event") == "REQUEST"]
-        response_logs = [log for log in log_entries if log.get("event") == "RESPONSE"]
-
-        # Both should have the same correlation ID
-        assert len(request_logs) >= 1
-        assert len(response_logs) >= 1
-        assert request_logs[0]["request_id"] == correlation_id
-        assert response_logs[0]["request_id"] == correlation_id
+        # One record carries both the request and the response fields
+        assert len(log_entries) == 1
+        assert log_entries[0]["event"] == "RESPONSE"
+        assert log_entries[0]["method"] == "POST"
+        assert log_entries[0]["status_code"] == 201
 
     async def test_correlation_id_in_error_logs(self, test_client: AsyncClient, log_capture):
         """Test that error logs include correlation ID."""
@@ -0,0 +1,29 @@
+"""Integration tests for the schema-version marker that lets startup skip create_all."""
+
+from sqlalchemy import event
+
+from src.database.models import schema_version
+
+
+class TestSchemaVersionMarker:
+    """Test that schema setup runs once per schema version."""
+
+    async def test_second_startup_only_reads_the_marker(self, test_db_manager):
+        """Test the first run stores the marker and the next run issues no DDL."""
+        await test_db_manager._create_tables()
+        assert await test_db_manager._stored_schema_version() == schema_version()
+
+        statements = []
+
+        def listener(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        sync_engine = test_db_manager.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", listener)
+        try:
+            await test_db_manager._create_tables()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("SELECT")
@@ -0,0 +1,169 @@
+"""Integration tests for set-based bulk todo endpoints."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestBatchCreate:
+    """Test POST /todos/batch."""
+
+    async def test_batch_create_returns_todos_in_request_order(self, test_client: AsyncClient):
+        """Test that all todos are created and returned in the order they were sent."""
+        texts = [f"Imported todo {i}" for i in range(5)]
+
+        response = await test_client.post("/todos/batch", json=[{"text": text} for text in texts])
+
+        assert response.status_code == 201
+        created = response.json()
+        assert [todo["text"] for todo in created] == texts
+        assert all(todo["status"] == "not-done" for todo in created)
+        assert len({todo["id"] for todo in created}) == len(texts)
+
+        list_response = await test_client.get("/todos")
+        assert len(list_response.json()) == len(texts)
+
+    async def test_batch_create_is_all_or_nothing_on_validation(self, test_client: AsyncClient):
+        """Test that one invalid item rejects the whole batch before touching the database."""
+        response = await test_client.post("/todos/batch", json=[{"text": "Valid"}, {"text": ""}])
+
+        assert response.status_code == 422
+        assert (await test_client.get("/todos")).json() == []
+
+    async def test_empty_batch_rejected(self, test_client: AsyncClient):
+        """Test that an empty batch fails validation."""
+        response = await test_client.post("/todos/batch", json=[])
+
+        assert response.status_code == 422
+
+    @pytest.mark.usefixtures("inline_nats_events")
+    async def test_batch_create_publishes_events_as_batch(self, test_client: AsyncClient):
+        """Test that one batched publish carries a created event per todo."""
+        mock_nats_service = AsyncMock()
+        mock_nats_service.is_connected = True
+        test_client._test_app.state.nats_service = mock_nats_service
+
+        with patch("src.api.dependencies._todo_service_instance", None):
+            response = await test_client.post("/todos/batch", json=[{"text": "First"}, {"text": "Second"}])
+            assert response.status_code == 201
+
+        mock_nats_service.publish_todo_events.assert_called_once()
+        call_kwargs = mock_nats_service.publish_todo_events.call_args[1]
+        assert call_kwargs["action"] == "created"
+        assert [event["id"] for event in call_kwargs["todo_data_list"]] == [todo["id"] for todo in response.json()]
+        mock_nats_service.publish_todo_event.assert_not_called()
+
+
+class TestBulkUpdate:
+    """Test PATCH /todos."""
+
+    async def test_bulk_status_update(self, test_client: AsyncClient):
+        """Test that listed todos are marked done and the rest are untouched."""
+        created = (await test_client.post("/todos/batch", json=[{"text": f"Todo {i}"} for i in range(3)])).json()
+        target_ids = [created[0]["id"], created[2]["id"]]
+
+        response = await test_client.patch("/todos", json={"ids": target_ids, "status": "done"})
+
+        assert response.status_code == 200
+        updated = response.json()
+        assert sorted(todo["id"] for todo in updated) == sorted(target_ids)
+        assert all(todo["status"] == "done" for todo in updated)
+
+        untouched = (await test_client.get(f"/todos/{created[1]['id']}")).json()
+        assert untouched["status"] == "not-done"
+
+    async def test_bulk_update_ignores_unknown_ids(self, test_client: AsyncClient):
+        """Test that unknown, malformed or out-of-range IDs are skipped rather than failing the request."""
+        created = (await test_client.post("/todos", json={"text": "Only todo"})).json()
+
+        response = await test_client.patch(
+            "/todos", json={"ids": [created["id"], "999999", "not-a-number", "99999999999"], "text": "Renamed"}
+        )
+
+        assert response.status_code == 200
+        assert [todo["text"] for todo in response.json()] == ["Renamed"]
+
+    async def test_bulk_update_requires_a_change(self, test_client: AsyncClient):
+        """Test that an update with neither text nor status is rejected."""
+        response = await test_client.patch("/todos", json={"ids": ["1"]})
+
+        assert response.status_code == 422
+
+    @pytest.mark.usefixtures("inline_nats_events")
+    async def test_bulk_update_publishes_one_event_per_row(self, test_client: AsyncClient):
+        """Test that each updated todo produces an updated event."""
+        created = (await test_client.post("/todos/batch", json=[{"text": "A"}, {"text": "B"}])).json()
+        mock_nats_service = AsyncMock()
+        mock_nats_service.is_connected = True
+        test_client._test_app.state.nats_service = mock_nats_service
+
+        with patch("src.api.dependencies._todo_service_instance", None):
+            await test_client.patch("/todos", json={"ids": [todo["id"] for todo in created], "status": "done"})
+
+        call_kwargs = mock_nats_service.publish_todo_events.call_args[1]
+        assert call_kwargs["action"] == "updated"
+        assert len(call_kwargs["todo_data_list"]) == 2
+
+
+class TestBulkDelete:
+    """Test DELETE /todos."""
+
+    async def test_bulk_delete_by_ids(self, test_client: AsyncClient):
+        """Test deleting an explicit list of todos."""
+        created = (await test_client.post("/todos/batch", json=[{"text": f"Todo {i}"} for i in range(3)])).json()
+        target_ids = [created[0]["id"], created[1]["id"]]
+
+        response = await test_client.delete("/todos", params={"ids": target_ids})
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["deleted"] == 2
+        assert sorted(result["ids"]) == sorted(target_ids)
+        assert [todo["id"] for todo in (await test_client.get("/todos")).json()] == [created[2]["id"]]
+
+    async def test_bulk_delete_skips_out_of_range_ids(self, test_client: AsyncClient):
+        """Test that an ID beyond the integer id column matches nothing instead of failing the request."""
+        created = (await test_client.post("/todos", json={"text": "Kept"})).json()
+
+        response = await test_client.delete("/todos", params={"ids": ["99999999999"]})
+
+        assert response.status_code == 200
+        assert response.json()["deleted"] == 0
+        assert [todo["id"] for todo in (await test_client.get("/todos")).json()] == [created["id"]]
+
+    async def test_clear_completed(self, test_client: AsyncClient):
+        """Test deleting by status removes only completed todos."""
+        created = (await test_client.post("/todos/batch", json=[{"text": f"Todo {i}"} for i in range(3)])).json()
+        await test_client.patch("/todos", json={"ids": [created[0]["id"]], "status": "done"})
+
+        response = await test_client.delete("/todos", params={"status": "done"})
+
+        assert response.json() == {"deleted": 1, "ids": [created[0]["id"]]}
+        remaining = (await test_client.get("/todos")).json()
+        assert len(remaining) == 2
+        assert all(todo["status"] == "not-done" for todo in remaining)
+
+    async def test_bulk_delete_requires_a_filter(self, test_client: AsyncClient):
+        """Test that DELETE /todos without filters never empties the table."""
+        await test_client.post("/todos", json={"text": "Survivor"})
+
+        response = await test_client.delete("/todos")
+
+        assert response.status_code == 400
+        assert len((await test_client.get("/todos")).json()) == 1
+
+    @pytest.mark.usefixtures("inline_nats_events")
+    async def test_bulk_delete_publishes_deleted_events(self, test_client: AsyncClient):
+        """Test that each deleted todo produces a deleted event."""
+        created = (await test_client.post("/todos/batch", json=[{"text": "A"}, {"text": "B"}])).json()
+        mock_nats_service = AsyncMock()
+        mock_nats_service.is_connected = True
+        test_client._test_app.state.nats_service = mock_nats_service
+
+        with patch("src.api.dependencies._todo_service_instance", None):
+            await test_client.delete("/todos", params={"ids": [todo["id"] for todo in created]})
+
+        call_kwargs = mock_nats_service.publish_todo_events.call_args[1]
+        assert call_kwargs["action"] == "deleted"
+        assert sorted(event["id"] for event in call_kwargs["todo_data_list"]) == sorted(t["id"] for t in created)
@@ -226,6 +226,12 @@ class TestTodoEndpointsLimited:
         error = response.json()
         assert "detail" in error
 
+    async def test_get_out_of_range_todo_returns_404(self, test_client: AsyncClient):
+        """Test GET /todos/{id} with an ID outside the id column's range returns 404."""
+        response = await test_client.get("/todos/99999999999")
+
+        assert response.status_code == 404
+
     async def test_update_todo_returns_updated_todo(self, test_client: AsyncClient):
         """Test PUT /todos/{id} updates and returns todo."""
         # Create todo first
@@ -250,6 +256,12 @@ class TestTodoEndpointsLimited:
 
         assert response.status_code == 404
 
+    async def test_update_out_of_range_todo_returns_404(self, test_client: AsyncClient):
+        """Test PUT /todos/{id} with an ID outside the id column's range returns 404."""
+        response = await test_client.put("/todos/99999999999", json={"text": "Updated text"})
+
+        assert response.status_code == 404
+
     async def test_delete_todo_returns_success(self, test_client: AsyncClient):
         """Test DELETE /todos/{id} removes todo."""
         # Create todo first
@@ -272,6 +284,12 @@ class TestTodoEndpointsLimited:
 
         assert response.status_code == 404
 
+    async def test_delete_out_of_range_todo_returns_404(self, test_client: AsyncClient):
+        """Test DELETE /todos/{id} with an ID outside the id column's range returns 404."""
+        response = await test_client.delete("/todos/-99999999999")
+
+        assert response.status_code == 404
+
     async def test_todos_endpoint_integration_workflow(self, test_client: AsyncClient):
         """Test complete CRUD workflow through API.
 
@@ -0,0 +1,71 @@
+"""Integration tests for status, text search and sort parameters on GET /todos."""
+
+from httpx import AsyncClient
+
+
+class TestTodoFiltering:
+    """Test server-side filtering and sorting of the todo list."""
+
+    async def _seed(self, client: AsyncClient) -> dict[str, str]:
+        texts = ["Buy milk", "Walk the dog", "Buy 100% cotton socks", "Read a book"]
+        created = (await client.post("/todos/batch", json=[{"text": text} for text in texts])).json()
+        ids = {todo["text"]: todo["id"] for todo in created}
+        await client.put(f"/todos/{ids['Walk the dog']}", json={"status": "done"})
+        return ids
+
+    async def test_status_filter(self, test_client: AsyncClient):
+        """Test that ?status= returns only todos with that status."""
+        await self._seed(test_client)
+
+        done = (await test_client.get("/todos", params={"status": "done"})).json()
+        not_done = (await test_client.get("/todos", params={"status": "not-done"})).json()
+
+        assert [todo["text"] for todo in done] == ["Walk the dog"]
+        assert len(not_done) == 3
+        assert all(todo["status"] == "not-done" for todo in not_done)
+
+    async def test_text_search_is_case_insensitive_and_literal(self, test_client: AsyncClient):
+        """Test that ?q= matches substrings case-insensitively and treats % literally."""
+        await self._seed(test_client)
+
+        buys = (await test_client.get("/todos", params={"q": "BUY"})).json()
+        percent = (await test_client.get("/todos", params={"q": "100%"})).json()
+        wildcard = (await test_client.get("/todos", params={"q": "%"})).json()
+
+        assert sorted(todo["text"] for todo in buys) == ["Buy 100% cotton socks", "Buy milk"]
+        assert [todo["text"] for todo in percent] == ["Buy 100% cotton socks"]
+        assert [todo["text"] for todo in wildcard] == ["Buy 100% cotton socks"]
+
+    async def test_sort_orders(self, test_client: AsyncClient):
+        """Test that sort=created_at reverses the default order and -updated_at surfaces recent edits."""
+        ids = await self._seed(test_client)
+
+        newest = [todo["id"] for todo in (await test_client.get("/todos")).json()]
+        oldest = [todo["id"] for todo in (await test_client.get("/todos", params={"sort": "created_at"})).json()]
+        updated = (await test_client.get("/todos", params={"sort": "-updated_at"})).json()
+
+        assert oldest == list(reversed(newest))
+        assert updated[0]["id"] == ids["Walk the dog"]
+
+    async def test_filtered_pages_keep_filters_in_next_link(self, test_client: AsyncClient):
+        """Test that paging a filtered, sorted list visits exactly the matching todos."""
+        await self._seed(test_client)
+
+        seen = []
+        params = {"status": "not-done", "sort": "created_at", "limit": 2}
+        while True:
+            response = await test_client.get("/todos", params=params)
+            seen.extend(todo["text"] for todo in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            assert "status=not-done" in response.headers["Link"]
+            params = {**params, "cursor": cursor}
+
+        assert seen == ["Buy milk", "Buy 100% cotton socks", "Read a book"]
+
+    async def test_invalid_sort_is_rejected(self, test_client: AsyncClient):
+        """Test that an unknown sort value fails validation."""
+        response = await test_client.get("/todos", params={"sort": "text"})
+
+        assert response.status_code == 422
@@ -0,0 +1,88 @@
+"""Integration tests for keyset pagination on GET /todos."""
+
+from httpx import AsyncClient
+
+
+class TestTodoPagination:
+    """Test cursor-based pagination of the todo list."""
+
+    async def _create_todos(self, client: AsyncClient, count: int) -> list[str]:
+        ids = []
+        for i in range(count):
+            response = await client.post("/todos", json={"text": f"Paged todo {i}"})
+            assert response.status_code == 201
+            ids.append(response.json()["id"])
+        return ids
+
+    async def test_pages_cover_all_todos_in_order(self, test_client: AsyncClient):
+        """Test that following next cursors visits every todo exactly once, newest first."""
+        await self._create_todos(test_client, 5)
+        full_list = (await test_client.get("/todos")).json()
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await test_client.get("/todos", params=params)
+            assert response.status_code == 200
+
+            page = response.json()
+            assert len(page) <= 2
+            seen.extend(todo["id"] for todo in page)
+
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            assert 'rel="next"' in response.headers["Link"]
+
+        assert seen == [todo["id"] for todo in full_list]
+
+    async def test_last_page_has_no_next_link(self, test_client: AsyncClient):
+        """Test that a page holding the remaining todos does not advertise another page."""
+        await self._create_todos(test_client, 2)
+
+        response = await test_client.get("/todos", params={"limit": 10})
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert "Link" not in response.headers
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_unpaged_request_returns_full_list(self, test_client: AsyncClient):
+        """Test that omitting limit keeps the original full-list contract."""
+        await self._create_todos(test_client, 3)
+
+        response = await test_client.get("/todos")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert "X-Next-Cursor" not in response.headers
+
+    async def test_invalid_cursor_returns_400(self, test_client: AsyncClient):
+        """Test that a tampered cursor is rejected rather than causing a server error."""
+        response = await test_client.get("/todos", params={"limit": 2, "cursor": "garbage"})
+
+        assert response.status_code == 400
+
+    async def test_limit_bounds_are_validated(self, test_client: AsyncClient):
+        """Test that out-of-range page sizes are rejected by validation."""
+        for limit in (0, 100000):
+            response = await test_client.get("/todos", params={"limit": limit})
+            assert response.status_code == 422
+
+    async def test_json_read_path_matches_orm_path(self, test_client: AsyncClient):
+        """Test that the rows-to-JSON list body equals the ORM + Pydantic rendering of the same todos."""
+        from pydantic import TypeAdapter
+
+        from src.database.operations import TodoDatabase
+        from src.models.todo import Todo
+
+        await self._create_todos(test_client, 3)
+
+        response = await test_client.get("/todos")
+        orm_todos = await TodoDatabase().get_all_todos()
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == TypeAdapter(list[Todo]).dump_json(orm_todos)
@@ -0,0 +1,50 @@
+"""Integration tests for the trigger-maintained todo counts behind /todos/stats and the health probes."""
+
+from httpx import AsyncClient
+
+
+class TestTodoStats:
+    """Test that the stats row tracks every kind of write."""
+
+    async def _stats(self, client: AsyncClient, exact: bool = False) -> dict:
+        response = await client.get("/todos/stats", params={"exact": str(exact).lower()})
+        assert response.status_code == 200
+        return response.json()
+
+    async def test_empty_database(self, test_client: AsyncClient):
+        """Test that a fresh database reports zero counts."""
+        stats = await self._stats(test_client)
+        assert (stats["total"], stats["done"], stats["not_done"]) == (0, 0, 0)
+        assert stats["exact"] is False
+
+    async def test_counts_follow_single_and_bulk_writes(self, test_client: AsyncClient):
+        """Test that inserts, status changes and deletes keep the stats row equal to an exact count."""
+        created = (await test_client.post("/todos/batch", json=[{"text": f"Stat {i}"} for i in range(4)])).json()
+        single = (await test_client.post("/todos", json={"text": "Single"})).json()
+        await test_client.put(f"/todos/{single['id']}", json={"status": "done"})
+        await test_client.patch("/todos", json={"ids": [created[0]["id"], created[1]["id"]], "status": "done"})
+        await test_client.put(f"/todos/{created[1]['id']}", json={"text": "Text only"})
+        await test_client.delete(f"/todos/{created[2]['id']}")
+
+        stats = await self._stats(test_client)
+        assert (stats["total"], stats["done"], stats["not_done"]) == (4, 3, 1)
+
+        await test_client.delete("/todos", params={"status": "done"})
+
+        stats = await self._stats(test_client)
+        exact = await self._stats(test_client, exact=True)
+        assert (stats["total"], stats["done"], stats["not_done"]) == (1, 0, 1)
+        assert {key: exact[key] for key in ("total", "done", "not_done")} == {
+            key: stats[key] for key in ("total", "done", "not_done")
+        }
+        assert exact["exact"] is True
+
+    async def test_health_count_uses_stats(self, test_client: AsyncClient):
+        """Test that /be-health reports the maintained count after a health monitor check."""
+        from src.services.health_monitor import health_monitor
+
+        await test_client.post("/todos/batch", json=[{"text": "One"}, {"text": "Two"}])
+        await health_monitor.check_once()
+
+        response = await test_client.get("/be-health")
+        assert response.json()["todos_count"] == 2
@@ -0,0 +1,46 @@
+"""Integration tests for the streaming todo list endpoint."""
+
+import json
+
+from httpx import AsyncClient
+
+
+class TestTodoStreaming:
+    """Test GET /todos/stream in NDJSON and chunked JSON array formats."""
+
+    async def test_ndjson_stream_matches_list_endpoint(self, test_client: AsyncClient):
+        """Test that NDJSON output carries the same todos, in the same order, as GET /todos."""
+        for i in range(3):
+            await test_client.post("/todos", json={"text": f"Streamed todo {i}"})
+
+        response = await test_client.get("/todos/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        streamed = [json.loads(line) for line in response.text.splitlines()]
+        assert streamed == (await test_client.get("/todos")).json()
+
+    async def test_json_array_stream_is_valid_json(self, test_client: AsyncClient):
+        """Test that the chunked array format parses as a regular JSON list."""
+        for i in range(2):
+            await test_client.post("/todos", json={"text": f"Array todo {i}"})
+
+        response = await test_client.get("/todos/stream", params={"format": "json"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        assert response.json() == (await test_client.get("/todos")).json()
+
+    async def test_stream_of_empty_table(self, test_client: AsyncClient):
+        """Test that both formats handle an empty table."""
+        ndjson_response = await test_client.get("/todos/stream")
+        array_response = await test_client.get("/todos/stream", params={"format": "json"})
+
+        assert ndjson_response.text == ""
+        assert array_response.json() == []
+
+    async def test_unknown_format_rejected(self, test_client: AsyncClient):
+        """Test that unsupported formats fail validation."""
+        response = await test_client.get("/todos/stream", params={"format": "xml"})
+
+        assert response.status_code == 422
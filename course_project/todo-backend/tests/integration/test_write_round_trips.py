@@ -0,0 +1,82 @@
+"""Round-trip budget tests for the TodoDatabase write path.
+
+Each write should cost one SQL statement on one pooled connection. These tests count
+statements and pool checkouts on the test engine so regressions (an extra refresh or a
+follow-up SELECT on a second session) fail loudly.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from src.database.operations import TodoDatabase
+from src.models.todo import TodoStatus
+
+
+@pytest.fixture
+def db_counters(test_db_manager):
+    """Count SQL statements and pool checkouts issued through the test engine."""
+    counters = {"statements": 0, "checkouts": 0}
+    sync_engine = test_db_manager.engine.sync_engine
+
+    def on_execute(*_args):
+        counters["statements"] += 1
+
+    def on_checkout(*_args):
+        counters["checkouts"] += 1
+
+    event.listen(sync_engine, "before_cursor_execute", on_execute)
+    event.listen(sync_engine.pool, "checkout", on_checkout)
+    yield counters
+    event.remove(sync_engine, "before_cursor_execute", on_execute)
+    event.remove(sync_engine.pool, "checkout", on_checkout)
+
+
+def _reset(counters: dict) -> None:
+    counters["statements"] = 0
+    counters["checkouts"] = 0
+
+
+class TestWriteRoundTrips:
+    """Each write operation runs one statement on one session."""
+
+    async def test_create_is_single_statement(self, db_counters):
+        """Test that create returns server defaults without a refresh SELECT."""
+        db = TodoDatabase()
+        _reset(db_counters)
+
+        todo = await db.create_todo("Round trip create")
+
+        assert todo.id is not None
+        assert todo.updated_at is not None
+        assert db_counters == {"statements": 1, "checkouts": 1}
+
+    async def test_update_is_single_statement(self, db_counters):
+        """Test that update returns the new row without a second session."""
+        db = TodoDatabase()
+        todo = await db.create_todo("Round trip update")
+        _reset(db_counters)
+
+        updated = await db.update_todo(todo.id, text="Updated", status=TodoStatus.DONE)
+
+        assert updated.text == "Updated"
+        assert updated.status == TodoStatus.DONE
+        assert db_counters == {"statements": 1, "checkouts": 1}
+
+    async def test_update_missing_todo_is_single_statement(self, db_counters):
+        """Test that a missed update is detected from RETURNING alone."""
+        db = TodoDatabase()
+        _reset(db_counters)
+
+        assert await db.update_todo("424242", text="Nobody home") is None
+        assert db_counters == {"statements": 1, "checkouts": 1}
+
+    async def test_delete_is_single_statement(self, db_counters):
+        """Test that delete returns the removed row from RETURNING."""
+        db = TodoDatabase()
+        todo = await db.create_todo("Round trip delete")
+        _reset(db_counters)
+
+        deleted = await db.delete_todo(todo.id)
+
+        assert deleted.id == todo.id
+        assert db_counters == {"statements": 1, "checkouts": 1}
@@ -0,0 +1,187 @@
+"""Unit tests for the pure ASGI security, cache policy and request logging middleware."""
+
+import json
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+from src.api.conditional import cache_control
+from src.middleware.api_middleware import HTTP_REQUEST_SECONDS, HTTP_RESPONSES, APIMiddleware
+from src.middleware.log_sampling import RequestLogSampler
+
+DEFAULT_POLICY = "no-cache, no-store, must-revalidate"
+
+
+def _app(sampler: RequestLogSampler | None = None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/be-health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/json")
+    async def json_body():
+        return {"ok": True}
+
+    @app.get("/cached", dependencies=[Depends(cache_control("private, no-cache"))])
+    async def cached_body():
+        return {"ok": True}
+
+    @app.get("/text")
+    async def text_body():
+        return Response("plain", media_type="text/plain", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    @app.post("/json")
+    async def post_json():
+        return {"ok": True}
+
+    app.add_middleware(APIMiddleware, default_cache_control=DEFAULT_POLICY, sampler=sampler)
+    return app
+
+
+async def _request(method: str, path: str, sampler: RequestLogSampler | None = None, **kwargs):
+    async with AsyncClient(transport=ASGITransport(app=_app(sampler)), base_url="http://test") as client:
+        return await client.request(method, path, **kwargs)
+
+
+@pytest.fixture
+def request_logs(caplog):
+    """Parsed JSON records of the request logger."""
+    caplog.set_level(logging.INFO, logger="request_logger")
+    return lambda: [json.loads(record.getMessage()) for record in caplog.records if record.name == "request_logger"]
+
+
+class TestResponseHeaders:
+    """Test the headers added to the response start message."""
+
+    async def test_security_headers_replace_route_values(self):
+        """Test that every response gets the security headers, overriding what a route set."""
+        response = await _request("GET", "/text")
+
+        assert response.headers["x-frame-options"] == "DENY"
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert "default-src 'self'" in response.headers["content-security-policy"]
+        assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+
+    async def test_json_get_defaults_to_no_store(self):
+        """Test that JSON GETs without a route policy are not cacheable, and other responses are left alone."""
+        assert (await _request("GET", "/json")).headers["cache-control"] == DEFAULT_POLICY
+        assert "cache-control" not in (await _request("GET", "/text")).headers
+        assert "cache-control" not in (await _request("POST", "/json")).headers
+
+    async def test_route_policy_wins(self):
+        """Test that a route's cache_control() dependency sets its own policy."""
+        response = await _request("GET", "/cached")
+
+        assert response.headers.get_list("cache-control") == ["private, no-cache"]
+
+    async def test_request_id_is_generated_or_echoed(self):
+        """Test that X-Request-ID is preserved from the request or generated."""
+        echoed = await _request("GET", "/json", headers={"X-Request-ID": "abc-123"})
+
+        assert echoed.headers["x-request-id"] == "abc-123"
+        assert len((await _request("GET", "/json")).headers["x-request-id"]) == 36
+
+
+class TestStreaming:
+    """Test that bodies pass through without buffering."""
+
+    async def test_chunks_are_forwarded_as_they_are_sent(self):
+        """Test that each body chunk reaches the server before the app produces the next one."""
+        sent = []
+
+        async def streaming_app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+            for chunk in (b"one", b"two"):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                assert sent[-1]["body"] == chunk
+            await send({"type": "http.response.body", "body": b""})
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/stream", "headers": [], "query_string": b""}
+        await APIMiddleware(streaming_app)(scope, receive, send)
+
+        assert [message.get("body") for message in sent[1:]] == [b"one", b"two", b""]
+        assert (b"x-frame-options", b"DENY") in sent[0]["headers"]
+
+
+class TestRequestLogging:
+    """Test the structured request records."""
+
+    async def test_one_record_per_request(self, request_logs):
+        """Test that the request and its response are logged as a single JSON record."""
+        await _request("GET", "/json?limit=5", headers={"X-Request-ID": "req-1", "X-Forwarded-For": "10.0.0.1, proxy"})
+
+        (record,) = request_logs()
+        assert record["event"] == "RESPONSE"
+        assert record["request_id"] == "req-1"
+        assert (record["method"], record["path"], record["query_params"]) == ("GET", "/json", "limit=5")
+        assert record["client_ip"] == "10.0.0.1"
+        assert record["status_code"] == 200
+        assert record["response_time_ms"] >= 0
+        assert record["sample_weight"] == 1.0
+
+    async def test_errors_are_classified(self, request_logs):
+        """Test that a 404 is logged as NOT_FOUND_ERROR."""
+        await _request("GET", "/missing")
+
+        response_record = request_logs()[-1]
+        assert response_record["event"] == "NOT_FOUND_ERROR"
+        assert response_record["error_type"] == "NOT_FOUND"
+
+    async def test_app_exception_is_logged_as_server_error(self, request_logs):
+        """Test that an exception before the response started is logged as a 500 and re-raised."""
+
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
+
+        scope = {"type": "http", "method": "GET", "path": "/fail", "headers": [], "query_string": b""}
+        with pytest.raises(RuntimeError):
+            await APIMiddleware(failing_app)(scope, None, None)
+
+        response_record = request_logs()[-1]
+        assert (response_record["status_code"], response_record["event"]) == (500, "SERVER_ERROR")
+
+    async def test_sampler_skips_probes_and_weights_sampled_records(self, request_logs):
+        """Test that the sampler's decision and weight, keyed by route template, reach the log."""
+        sampler = RequestLogSampler(
+            sample_rate=0.0,
+            route_sample_rates={"/json": 0.25},
+            exclude_paths={"/be-health"},
+            random_value=lambda: 0.1,
+        )
+
+        await _request("GET", "/be-health", sampler=sampler)
+        await _request("GET", "/text", sampler=sampler)
+        await _request("GET", "/json", sampler=sampler)
+        await _request("GET", "/missing", sampler=sampler)
+
+        assert [(record["path"], record["sample_weight"]) for record in request_logs()] == [
+            ("/json", 4.0),
+            ("/missing", 1.0),
+        ]
+
+
+class TestRequestMetrics:
+    """Test the per-route request metrics."""
+
+    async def test_latency_and_responses_by_route_template(self):
+        """Test that matched requests are labelled by route and unknown paths share one label."""
+        latency = HTTP_REQUEST_SECONDS.labels("GET", "/json")
+        missing = HTTP_RESPONSES.labels("GET", "<unmatched>", 404)
+        before = (latency.count, missing.value)
+
+        await _request("GET", "/json")
+        await _request("GET", "/missing-one")
+        await _request("GET", "/missing-two")
+
+        assert (latency.count, missing.value) == (before[0] + 1, before[1] + 2)
+        assert ("GET", "/missing-one") not in HTTP_REQUEST_SECONDS.children
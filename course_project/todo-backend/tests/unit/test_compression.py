@@ -0,0 +1,155 @@
+"""Unit tests for Accept-Encoding negotiation and the compression middleware."""
+
+import zlib
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from src.api.conditional import collection_etag, is_not_modified, not_modified_response, set_validators
+from src.middleware.compression import CompressionMiddleware, available_encoders, negotiate_encoding
+from src.models.todo import TodoVersion
+
+BODY = b'{"todos":' + b'"compress me",' * 200 + b"0}"
+PREFERENCE = ["zstd", "br", "gzip"]
+
+VERSION = TodoVersion(7, datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC))
+
+TODO_APP_COMPRESSION = Path(__file__).parents[3] / "todo-app" / "src" / "middleware" / "compression.py"
+
+
+def _app(minimum_size: int = 100) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_body():
+        return Response(BODY, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/todos")
+    async def versioned_body(request: Request):
+        etag = collection_etag(VERSION)
+        if is_not_modified(request, etag, VERSION.changed_at):
+            return not_modified_response(etag, VERSION.changed_at)
+        response = Response(BODY, media_type="application/json")
+        set_validators(response, etag, VERSION.changed_at)
+        return response
+
+    @app.get("/small")
+    async def small_body():
+        return Response(b"{}", media_type="application/json")
+
+    @app.get("/image")
+    async def image_body():
+        return Response(b"\xff" * 5000, media_type="image/jpeg")
+
+    @app.get("/stream")
+    async def stream_body():
+        async def lines():
+            for i in range(3):
+                yield b'{"line":%d}\n' % i
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=minimum_size,
+        encodings=["gzip"],
+        levels={"gzip": 6, "br": 4, "zstd": 3},
+    )
+    return app
+
+
+async def _get(path: str, accept_encoding: str) -> httpx.Response:
+    transport = ASGITransport(app=_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+class TestNegotiateEncoding:
+    """Test Accept-Encoding parsing with q-values and server preference."""
+
+    def test_server_preference_breaks_ties(self):
+        """Test that equally weighted codings resolve in the configured order."""
+        assert negotiate_encoding("gzip, br, zstd", PREFERENCE) == "zstd"
+        assert negotiate_encoding("gzip, br", PREFERENCE) == "br"
+
+    def test_client_q_values_win(self):
+        """Test that a higher q-value beats server preference and q=0 refuses a coding."""
+        assert negotiate_encoding("gzip;q=1.0, br;q=0.5", PREFERENCE) == "gzip"
+        assert negotiate_encoding("gzip;q=0", PREFERENCE) is None
+
+    def test_wildcard_and_identity(self):
+        """Test that * accepts any coding and identity-only or missing headers get none."""
+        assert negotiate_encoding("*", PREFERENCE) == "zstd"
+        assert negotiate_encoding("identity", PREFERENCE) is None
+        assert negotiate_encoding("", PREFERENCE) is None
+
+    def test_gzip_is_always_available(self):
+        """Test that gzip needs no optional package."""
+        assert "gzip" in available_encoders()
+
+
+class TestCompressionMiddleware:
+    """Test which responses are compressed and how."""
+
+    async def test_large_json_is_compressed(self):
+        """Test gzip encoding, exact Content-Length, Vary and a weakened ETag."""
+        response = await _get("/json", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(BODY)
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.content == BODY
+
+    async def test_not_modified_repeats_the_compressed_tag(self):
+        """Test that the 304 for a compressed 200 carries the same ETag as that 200."""
+        transport = ASGITransport(app=_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            full = await client.get("/todos", headers={"Accept-Encoding": "gzip"})
+            headers = {"Accept-Encoding": "gzip", "If-None-Match": full.headers["etag"]}
+            revalidated = await client.get("/todos", headers=headers)
+
+        assert full.headers["content-encoding"] == "gzip"
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == full.headers["etag"]
+
+    async def test_identity_when_not_accepted(self):
+        """Test that clients without Accept-Encoding get the original response."""
+        response = await _get("/json", "identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"] == '"v1"'
+        assert response.content == BODY
+
+    async def test_small_and_binary_bodies_pass_through(self):
+        """Test the minimum size threshold and that images are never recompressed."""
+        small = await _get("/small", "gzip")
+        image = await _get("/image", "gzip")
+
+        assert "content-encoding" not in small.headers
+        assert small.headers["vary"] == "Accept-Encoding"
+        assert "content-encoding" not in image.headers
+        assert image.headers["content-length"] == "5000"
+
+    async def test_streamed_body_is_compressed_chunk_by_chunk(self):
+        """Test that a streamed response is compressed without a Content-Length and decodes intact."""
+        transport = ASGITransport(app=_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            async with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert zlib.decompress(raw, zlib.MAX_WBITS | 16) == b'{"line":0}\n{"line":1}\n{"line":2}\n'
+
+    @pytest.mark.skipif(not TODO_APP_COMPRESSION.exists(), reason="todo-app sources not available")
+    def test_todo_app_copy_is_identical(self):
+        """Test that both services share the exact same compression module."""
+        own = Path(__file__).parents[2] / "src" / "middleware" / "compression.py"
+
+        assert TODO_APP_COMPRESSION.read_text() == own.read_text()
@@ -0,0 +1,78 @@
+"""Unit tests for ETag / Last-Modified validators and conditional request evaluation."""
+
+from datetime import UTC, datetime
+
+from starlette.requests import Request
+
+from src.api.conditional import (
+    collection_etag,
+    is_not_modified,
+    not_modified_response,
+    todo_etag,
+)
+from src.models.todo import Todo, TodoVersion
+
+CHANGED_AT = datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=UTC)
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/todos", "headers": raw})
+
+
+class TestValidators:
+    """Test that tags follow versions exactly."""
+
+    def test_collection_etag_changes_with_sequence_and_time(self):
+        """Test that a new sequence or a restarted sequence at a new time yields a new tag."""
+        etag = collection_etag(TodoVersion(7, CHANGED_AT))
+
+        assert etag.startswith('W/"') and etag.endswith('"')
+        assert etag == collection_etag(TodoVersion(7, CHANGED_AT))
+        assert etag != collection_etag(TodoVersion(8, CHANGED_AT))
+        assert etag != collection_etag(TodoVersion(7, CHANGED_AT.replace(microsecond=0)))
+
+    def test_todo_etag_follows_updated_at(self):
+        """Test that an item tag changes when the todo is updated and differs between todos."""
+        todo = Todo(id="1", text="Tagged", created_at=CHANGED_AT, updated_at=CHANGED_AT)
+        updated = todo.model_copy(update={"updated_at": CHANGED_AT.replace(second=6)})
+
+        assert todo_etag(todo) != todo_etag(updated)
+        assert todo_etag(todo) != todo_etag(todo.model_copy(update={"id": "2"}))
+
+
+class TestIsNotModified:
+    """Test RFC 9110 precondition evaluation for GET."""
+
+    ETAG = '"todos-7-1"'
+
+    def test_no_conditional_headers(self):
+        """Test that an unconditional request is always answered in full."""
+        assert not is_not_modified(_request(), self.ETAG, CHANGED_AT)
+
+    def test_if_none_match_uses_weak_comparison_over_a_list(self):
+        """Test matching against a tag list, a weak tag and the wildcard."""
+        assert is_not_modified(_request(if_none_match=self.ETAG), self.ETAG, CHANGED_AT)
+        assert is_not_modified(_request(if_none_match=f'"other", W/{self.ETAG}'), self.ETAG, CHANGED_AT)
+        assert is_not_modified(_request(if_none_match="*"), self.ETAG, CHANGED_AT)
+        assert not is_not_modified(_request(if_none_match='"todos-6-1"'), self.ETAG, CHANGED_AT)
+
+    def test_if_modified_since_at_second_resolution(self):
+        """Test that the date check ignores sub-second precision and rejects older dates."""
+        assert is_not_modified(_request(if_modified_since="Fri, 02 Jan 2026 03:04:05 GMT"), self.ETAG, CHANGED_AT)
+        assert not is_not_modified(_request(if_modified_since="Fri, 02 Jan 2026 03:04:04 GMT"), self.ETAG, CHANGED_AT)
+        assert not is_not_modified(_request(if_modified_since="not a date"), self.ETAG, CHANGED_AT)
+
+    def test_if_none_match_takes_precedence(self):
+        """Test that a stale tag wins over a current date."""
+        request = _request(if_none_match='"todos-6-1"', if_modified_since="Fri, 02 Jan 2026 03:04:05 GMT")
+        assert not is_not_modified(request, self.ETAG, CHANGED_AT)
+
+    def test_not_modified_response_carries_validators(self):
+        """Test that a 304 has no body and repeats ETag and Last-Modified."""
+        response = not_modified_response(self.ETAG, CHANGED_AT)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == self.ETAG
+        assert response.headers["last-modified"] == "Fri, 02 Jan 2026 03:04:05 GMT"
@@ -0,0 +1,247 @@
+"""Unit tests for the batched NATS event publisher."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api.routes.metrics import _update_publisher_gauges
+from src.observability.metrics import registry
+from src.services.event_publisher import (
+    BatchedEventPublisher,
+    OverflowPolicy,
+    PublisherMetrics,
+    PublishQueueFullError,
+)
+from src.services.nats_service import NATSService
+
+
+def _publisher(
+    send_batch: AsyncMock | None = None,
+    max_queue_size: int = 100,
+    batch_size: int = 3,
+    max_delay_seconds: float = 10.0,
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+) -> BatchedEventPublisher:
+    return BatchedEventPublisher(
+        send_batch or AsyncMock(),
+        max_queue_size=max_queue_size,
+        batch_size=batch_size,
+        max_delay_seconds=max_delay_seconds,
+        overflow=overflow,
+        block_timeout_seconds=0.05,
+    )
+
+
+def _counts() -> dict[str, float]:
+    metrics = PublisherMetrics()
+    return {name: counter.value for name, counter in vars(metrics).items()}
+
+
+@pytest.fixture
+def counts():
+    """Increase of each publisher counter since the test started; the counters are process-wide."""
+    start = _counts()
+    return lambda: {name: value - start[name] for name, value in _counts().items()}
+
+
+async def _wait_for(condition, timeout: float = 1.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+class TestBatching:
+    """Test the size and time triggers."""
+
+    async def test_full_batch_is_published_without_waiting_for_the_delay(self, counts):
+        """Test that reaching batch_size publishes immediately as one batch."""
+        publisher = _publisher()
+        publisher.start()
+        try:
+            for i in range(3):
+                await publisher.enqueue({"id": str(i)})
+            await _wait_for(lambda: counts()["published"] == 3)
+        finally:
+            await publisher.stop()
+
+        publisher.send_batch.assert_awaited_once_with([{"id": "0"}, {"id": "1"}, {"id": "2"}])
+
+    async def test_partial_batch_is_published_after_the_delay(self, counts):
+        """Test that a lone event goes out once it has waited max_delay_seconds."""
+        publisher = _publisher(max_delay_seconds=0.02)
+        publisher.start()
+        try:
+            await publisher.enqueue({"id": "1"})
+            assert counts()["published"] == 0
+            await _wait_for(lambda: counts()["published"] == 1)
+        finally:
+            await publisher.stop()
+
+        publisher.send_batch.assert_awaited_once_with([{"id": "1"}])
+        assert publisher.depth == 0
+
+    async def test_failed_batch_is_counted_and_the_loop_continues(self, counts):
+        """Test that a broker error drops only that batch."""
+        publisher = _publisher(AsyncMock(side_effect=[ConnectionError("down"), None]), batch_size=1)
+        publisher.start()
+        try:
+            await publisher.enqueue({"id": "1"})
+            await publisher.enqueue({"id": "2"})
+            await _wait_for(lambda: counts()["failed"] + counts()["published"] == 2)
+        finally:
+            await publisher.stop()
+
+        assert (counts()["failed"], counts()["published"]) == (1, 1)
+
+    async def test_stop_publishes_what_is_still_queued(self):
+        """Test that shutdown drains the queue instead of discarding it."""
+        publisher = _publisher()
+        await publisher.enqueue({"id": "1"})
+
+        await publisher.stop()
+
+        publisher.send_batch.assert_awaited_once_with([{"id": "1"}])
+
+    async def test_stop_waits_for_the_batch_in_flight(self, counts):
+        """Test that stopping while a batch is being sent lets it finish, then drains the queue."""
+        sending, release = asyncio.Event(), asyncio.Event()
+
+        async def send_batch(batch):
+            sending.set()
+            await release.wait()
+
+        publisher = _publisher(AsyncMock(side_effect=send_batch), batch_size=1)
+        publisher.start()
+        await publisher.enqueue({"id": "1"})
+        await sending.wait()
+        await publisher.enqueue({"id": "2"})
+
+        stop = asyncio.create_task(publisher.stop())
+        await asyncio.sleep(0.01)
+        assert not stop.done()
+        release.set()
+        await stop
+
+        assert [call.args[0] for call in publisher.send_batch.await_args_list] == [[{"id": "1"}], [{"id": "2"}]]
+        assert (counts()["published"], counts()["failed"]) == (2, 0)
+
+    async def test_batch_in_flight_past_the_drain_timeout_is_counted_as_failed(self, counts):
+        """Test that a batch still unconfirmed when the drain timeout expires is not lost silently."""
+        sending = asyncio.Event()
+
+        async def send_batch(batch):
+            sending.set()
+            await asyncio.Event().wait()
+
+        publisher = _publisher(AsyncMock(side_effect=send_batch), batch_size=2)
+        publisher.start()
+        await publisher.enqueue({"id": "1"})
+        await publisher.enqueue({"id": "2"})
+        await sending.wait()
+        await publisher.enqueue({"id": "3"})
+
+        await publisher.stop(drain_timeout_seconds=0.02)
+
+        assert (counts()["published"], counts()["failed"]) == (0, 3)
+        assert publisher.depth == 0
+
+
+class TestOverflow:
+    """Test the overflow policies of a full queue."""
+
+    async def test_drop_oldest_makes_room(self, counts):
+        """Test that the oldest event is discarded and counted."""
+        publisher = _publisher(max_queue_size=2)
+        for i in range(3):
+            await publisher.enqueue({"id": str(i)})
+
+        assert publisher.depth == 2
+        assert counts()["dropped"] == 1
+        assert list(publisher._queue) == [{"id": "1"}, {"id": "2"}]
+
+    async def test_error_policy_rejects_new_events(self, counts):
+        """Test that the error policy raises and keeps the queued events."""
+        publisher = _publisher(max_queue_size=1, overflow=OverflowPolicy.ERROR)
+        await publisher.enqueue({"id": "1"})
+
+        with pytest.raises(PublishQueueFullError):
+            await publisher.enqueue({"id": "2"})
+        assert counts()["rejected"] == 1
+        assert list(publisher._queue) == [{"id": "1"}]
+
+    async def test_block_policy_waits_for_room(self, counts):
+        """Test that a blocked enqueue completes once the background task frees room."""
+        publisher = _publisher(max_queue_size=1, batch_size=1, overflow=OverflowPolicy.BLOCK)
+        publisher.block_timeout_seconds = 1.0
+        await publisher.enqueue({"id": "1"})
+
+        publisher.start()
+        try:
+            await publisher.enqueue({"id": "2"})
+            await _wait_for(lambda: counts()["published"] == 2)
+        finally:
+            await publisher.stop()
+
+        assert counts()["rejected"] == 0
+
+    async def test_block_policy_times_out(self, counts):
+        """Test that blocking is bounded by the block timeout."""
+        publisher = _publisher(max_queue_size=1, overflow=OverflowPolicy.BLOCK)
+        await publisher.enqueue({"id": "1"})
+
+        with pytest.raises(PublishQueueFullError):
+            await publisher.enqueue({"id": "2"})
+        assert counts()["rejected"] == 1
+
+
+class TestNATSServiceBatchedMode:
+    """Test that NATSService queues instead of publishing inside the caller."""
+
+    async def test_publish_queues_and_batch_is_flushed_once(self):
+        """Test that events reach NATS from the background task with one flush per batch."""
+        nats_service = NATSService()
+        nats_service.nc = MagicMock(publish=AsyncMock(), flush=AsyncMock())
+        nats_service.is_connected = True
+        nats_service.publisher = _publisher(nats_service._send_batch, batch_size=2)
+
+        assert await nats_service.publish_todo_event({"id": "1"}, "created")
+        assert await nats_service.publish_todo_events([{"id": "2"}], "updated") == 1
+        nats_service.nc.publish.assert_not_called()
+
+        await nats_service.publisher.stop()
+
+        payloads = [call.args[1] for call in nats_service.nc.publish.call_args_list]
+        assert payloads == [b'{"id":"1","action":"created"}', b'{"id":"2","action":"updated"}']
+        nats_service.nc.flush.assert_awaited_once()
+
+    async def test_connect_starts_publisher_in_batched_mode(self):
+        """Test that connecting creates the publisher and disconnecting stops it."""
+        nats_service = NATSService()
+        with patch("src.services.nats_service.nats.connect", AsyncMock(return_value=MagicMock(close=AsyncMock()))):
+            assert await nats_service.connect()
+
+        assert isinstance(nats_service.publisher, BatchedEventPublisher)
+        await nats_service.disconnect()
+        assert nats_service.publisher is None
+
+
+class TestPublisherMetrics:
+    """Test the Prometheus rendering of publisher metrics."""
+
+    def test_publisher_series(self, counts):
+        """Test that the queue gauges are set from the live publisher and the counters are rendered."""
+        publisher = _publisher(max_queue_size=50)
+        publisher._queue.append({"id": "1"})
+        publisher.metrics.observe_batch(3, ok=True)
+
+        _update_publisher_gauges(publisher)
+        lines = registry.render()
+
+        assert "todo_backend_nats_publish_queue_depth 1" in lines
+        assert "todo_backend_nats_publish_queue_capacity 50" in lines
+        assert "# TYPE todo_backend_nats_events_published_total counter" in lines
+        assert counts()["published"] == 3
+
+        _update_publisher_gauges(None)
+        assert "todo_backend_nats_publish_queue_depth 0" in registry.render()
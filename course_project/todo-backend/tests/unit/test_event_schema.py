@@ -0,0 +1,100 @@
+"""Unit tests for the todo event envelope shared with the broadcaster."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.events.schema import (
+    EventEncoding,
+    InvalidEventError,
+    UnsupportedEventError,
+    decode_event,
+    encode_event,
+)
+from src.services.nats_service import NATSService
+
+EVENT = {"id": "1", "text": "Ünïcode todo", "status": "done", "updated_at": "2025-01-01T00:00:00", "action": "updated"}
+
+BROADCASTER_SCHEMA = Path(__file__).parents[3] / "broadcaster" / "src" / "events" / "schema.py"
+
+
+class TestEnvelope:
+    """Test encoding, decoding and version checks."""
+
+    @pytest.mark.parametrize("encoding", list(EventEncoding))
+    def test_round_trip(self, encoding):
+        """Test that every encoding decodes back to the same event."""
+        body, headers = encode_event(EVENT, encoding)
+
+        assert headers == {"Todo-Event-Version": "1", "Content-Type": encoding.content_type}
+        assert decode_event(body, headers) == EVENT
+
+    def test_msgpack_is_smaller_than_json(self):
+        """Test that the binary encoding saves bytes on the wire."""
+        json_body, _ = encode_event(EVENT, EventEncoding.JSON)
+        msgpack_body, _ = encode_event(EVENT, EventEncoding.MSGPACK)
+
+        assert len(msgpack_body) < len(json_body)
+
+    def test_headerless_message_is_legacy_json(self):
+        """Test that events published before the envelope existed still decode."""
+        assert decode_event(b'{"id": "1", "action": "created"}', None) == {"id": "1", "action": "created"}
+
+    @pytest.mark.parametrize(
+        "headers",
+        [{"Todo-Event-Version": "2"}, {"Todo-Event-Version": "v1"}, {"Content-Type": "application/xml"}],
+    )
+    def test_unknown_version_or_content_type_is_unsupported(self, headers):
+        """Test that a consumer refuses what it does not know instead of guessing."""
+        with pytest.raises(UnsupportedEventError):
+            decode_event(b"{}", headers)
+
+    @pytest.mark.parametrize("encoding", list(EventEncoding))
+    def test_malformed_body_is_invalid(self, encoding):
+        """Test that garbage in the declared encoding raises InvalidEventError."""
+        with pytest.raises(InvalidEventError):
+            decode_event(b"\xc1not an event", {"Content-Type": encoding.content_type})
+
+    def test_non_map_body_is_invalid(self):
+        """Test that a well-formed body that is not an object is rejected."""
+        with pytest.raises(InvalidEventError):
+            decode_event(b"[1, 2]")
+
+    @pytest.mark.skipif(not BROADCASTER_SCHEMA.exists(), reason="broadcaster sources not available")
+    def test_broadcaster_copy_is_identical(self):
+        """Test that producer and consumer share the exact same schema module."""
+        own = Path(__file__).parents[2] / "src" / "events" / "schema.py"
+
+        assert BROADCASTER_SCHEMA.read_text() == own.read_text()
+
+
+class TestNATSServiceEncoding:
+    """Test that NATSService publishes with the envelope and decodes what it subscribes to."""
+
+    async def test_publish_uses_configured_encoding(self):
+        """Test that the body and headers follow the service's encoding."""
+        nats_service = NATSService()
+        nats_service.encoding = EventEncoding.MSGPACK
+        nats_service.nc = MagicMock(publish=AsyncMock(), flush=AsyncMock())
+        nats_service.is_connected = True
+
+        assert await nats_service.publish_event_batch([EVENT], timeout=0.5) == 1
+
+        call = nats_service.nc.publish.call_args
+        assert call.kwargs["headers"]["Content-Type"] == "application/msgpack"
+        assert decode_event(call.args[1], call.kwargs["headers"]) == EVENT
+
+    async def test_subscriber_decodes_by_headers(self):
+        """Test that cache invalidation receives decoded events whatever their encoding."""
+        nats_service = NATSService()
+        nats_service.nc = MagicMock(subscribe=AsyncMock())
+        nats_service.is_connected = True
+        handler = MagicMock()
+        assert await nats_service.subscribe_todo_events(handler)
+        on_message = nats_service.nc.subscribe.call_args.kwargs["cb"]
+
+        body, headers = encode_event(EVENT, EventEncoding.MSGPACK)
+        await on_message(MagicMock(data=body, headers=headers))
+
+        handler.assert_called_once_with(EVENT)
@@ -0,0 +1,99 @@
+"""Unit tests for the background health monitor."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.health_monitor import HealthMonitor
+
+
+def _monitor() -> HealthMonitor:
+    return HealthMonitor(interval_seconds=0.01, timeout_seconds=0.05, stale_after_seconds=15)
+
+
+def _nats_service(flush: AsyncMock) -> MagicMock:
+    nats_service = MagicMock()
+    nats_service.nc.is_connected = True
+    nats_service.nc.flush = flush
+    return nats_service
+
+
+class TestHealthMonitor:
+    """Test dependency checks, caching and staleness."""
+
+    async def test_not_ready_before_first_check(self):
+        """Test that a new monitor is stale and not ready."""
+        monitor = _monitor()
+
+        assert monitor.is_stale
+        assert not monitor.is_ready
+        assert monitor.snapshot()["database"]["checked_at"] is None
+
+    async def test_successful_checks_are_cached(self):
+        """Test that a passing check stores health, count and timestamps."""
+        monitor = _monitor()
+        monitor.nats_service = _nats_service(AsyncMock())
+
+        with (
+            patch("src.database.connection.db_manager") as db_manager,
+            patch("src.services.health_monitor.TodoDatabase") as todo_database,
+        ):
+            db_manager.health_check = AsyncMock(return_value=True)
+            todo_database.return_value.count_todos = AsyncMock(return_value=7)
+            await monitor.check_once()
+
+        snapshot = monitor.snapshot()
+        assert snapshot["ready"] is True
+        assert snapshot["todos_count"] == 7
+        assert snapshot["database"]["healthy"] is True
+        assert snapshot["nats"]["healthy"] is True
+        assert snapshot["database"]["latency_ms"] is not None
+
+    async def test_slow_database_check_times_out(self):
+        """Test that a hung database check is bounded by the timeout and marks the database unhealthy."""
+        monitor = _monitor()
+
+        async def hang(max_retries: int = 1) -> bool:
+            await asyncio.sleep(10)
+            return True
+
+        with patch("src.database.connection.db_manager") as db_manager:
+            db_manager.health_check = hang
+            await monitor.check_once()
+
+        assert monitor.database.healthy is False
+        assert monitor.database.error == "TimeoutError"
+        assert not monitor.is_ready
+
+    async def test_nats_is_reported_but_not_required(self):
+        """Test that NATS failures are recorded without affecting readiness."""
+        monitor = _monitor()
+        monitor.nats_service = _nats_service(AsyncMock(side_effect=ConnectionError("gone")))
+
+        with (
+            patch("src.database.connection.db_manager") as db_manager,
+            patch("src.services.health_monitor.TodoDatabase") as todo_database,
+        ):
+            db_manager.health_check = AsyncMock(return_value=True)
+            todo_database.return_value.count_todos = AsyncMock(return_value=0)
+            await monitor.check_once()
+
+        assert monitor.nats.healthy is False
+        assert monitor.nats.error == "ConnectionError"
+        assert monitor.is_ready
+
+    async def test_background_loop_checks_until_stopped(self):
+        """Test that start() runs checks on the interval and stop() ends the task."""
+        monitor = _monitor()
+
+        with (
+            patch("src.database.connection.db_manager") as db_manager,
+            patch("src.services.health_monitor.TodoDatabase") as todo_database,
+        ):
+            db_manager.health_check = AsyncMock(return_value=True)
+            todo_database.return_value.count_todos = AsyncMock(return_value=0)
+            monitor.start()
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        assert db_manager.health_check.await_count >= 2
+        assert monitor.is_ready
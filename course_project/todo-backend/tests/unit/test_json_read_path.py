@@ -0,0 +1,37 @@
+"""Unit tests for the ORM-free JSON read path encoding."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+
+from src.database.operations import TodoDatabase
+from src.models.todo import Todo
+
+
+class TestRowsToJson:
+    """Test that encoded rows match what the response_model path renders."""
+
+    def test_matches_pydantic_serialization(self):
+        """Test byte-for-byte equality with serializing the equivalent Todo models."""
+        created = datetime(2025, 7, 28, 10, 0, 0, 123456, tzinfo=UTC)
+        updated = datetime(2025, 7, 29, 8, 30, tzinfo=UTC)
+        rows = [
+            (2, 'Quote " and ünïcode ✓', True, created, updated),
+            (1, "Plain", False, created, created),
+        ]
+        database = TodoDatabase()
+        todos = [
+            database._db_to_pydantic(
+                SimpleNamespace(
+                    id=todo_id, text=text, completed=completed, created_at=created_at, updated_at=updated_at
+                )
+            )
+            for todo_id, text, completed, created_at, updated_at in rows
+        ]
+
+        assert TodoDatabase._rows_to_json(rows) == TypeAdapter(list[Todo]).dump_json(todos)
+
+    def test_empty_result_is_empty_array(self):
+        """Test that no rows encode to an empty JSON array."""
+        assert TodoDatabase._rows_to_json([]) == b"[]"
@@ -0,0 +1,94 @@
+"""Unit tests for request log sampling."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.config.settings import Settings
+from src.middleware.log_sampling import RequestLogSampler
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRequestLogSampler:
+    """Test which requests are logged and with what weight."""
+
+    def test_errors_and_slow_requests_are_always_logged(self):
+        """Test that failures and slow successes bypass sampling and exclusion."""
+        sampler = RequestLogSampler(sample_rate=0.0, exclude_paths={"/healthz"}, slow_request_ms=500)
+
+        assert sampler.weight("/todos", "/todos", 500, 1.0) == 1.0
+        assert sampler.weight("/healthz", None, 503, 1.0) == 1.0
+        assert sampler.weight("/todos", "/todos", 200, 500.0) == 1.0
+        assert sampler.weight("/todos", "/todos", 200, 499.0) is None
+
+    def test_excluded_paths_are_skipped(self):
+        """Test that successful probe requests are never logged."""
+        sampler = RequestLogSampler(exclude_paths={"/healthz", "/be-health"})
+
+        assert sampler.weight("/healthz", None, 200, 1.0) is None
+        assert sampler.weight("/be-health", "/be-health", 200, 1.0) is None
+        assert sampler.weight("/todos", "/todos", 200, 1.0) == 1.0
+
+    @pytest.mark.parametrize(("draw", "expected"), [(0.09, 10.0), (0.1, None)])
+    def test_successes_are_sampled_with_inverse_weight(self, draw, expected):
+        """Test that a sampled record is weighted by 1 / rate."""
+        sampler = RequestLogSampler(sample_rate=0.1, random_value=lambda: draw)
+
+        assert sampler.weight("/todos", "/todos", 200, 1.0) == expected
+
+    def test_route_rate_overrides_default(self):
+        """Test that rates are looked up by route template, falling back to the default."""
+        sampler = RequestLogSampler(
+            sample_rate=1.0, route_sample_rates={"/todos/{todo_id}": 0.5}, random_value=lambda: 0.4
+        )
+
+        assert sampler.weight("/todos/7", "/todos/{todo_id}", 200, 1.0) == 2.0
+        assert sampler.weight("/todos", "/todos", 200, 1.0) == 1.0
+        assert sampler.weight("/unknown", None, 200, 1.0) == 1.0
+
+    def test_rate_adapts_to_target_throughput(self):
+        """Test that rates shrink while candidates exceed the target and recover when load drops."""
+        clock = FakeClock()
+        sampler = RequestLogSampler(target_per_second=10, clock=clock, random_value=lambda: 0.0)
+
+        for _ in range(100):
+            assert sampler.weight("/todos", "/todos", 200, 1.0) == 1.0
+
+        clock.now = 1.0
+        assert sampler.weight("/todos", "/todos", 200, 1.0) == pytest.approx(10.0)
+        assert sampler.adaptive_factor == pytest.approx(0.1)
+
+        clock.now = 3.0
+        assert sampler.weight("/todos", "/todos", 200, 1.0) == 1.0
+        assert sampler.adaptive_factor == 1.0
+
+
+class TestSamplingSettings:
+    """Test parsing of the sampling settings."""
+
+    def test_route_rates_and_excluded_paths(self):
+        """Test the comma-separated settings formats."""
+        settings = Settings(
+            request_log_route_sample_rates="/todos=0.1, /todos/{todo_id}=2",
+            request_log_exclude_paths="/healthz, /be-health,",
+        )
+
+        assert settings.request_log_route_sample_rates_map == {"/todos": 0.1, "/todos/{todo_id}": 1.0}
+        assert settings.request_log_exclude_paths_set == frozenset({"/healthz", "/be-health"})
+
+    @pytest.mark.parametrize("rates", ["/todos=", "/todos=half", "/todos=0.1,/todos/{todo_id}", "=0.5"])
+    def test_malformed_route_rate_names_the_setting_and_entry(self, rates):
+        """Test that a typo fails settings validation with the setting and the bad entry."""
+        with pytest.raises(ValidationError) as error:
+            Settings(request_log_route_sample_rates=rates)
+
+        assert "REQUEST_LOG_ROUTE_SAMPLE_RATES" in str(error.value)
+        assert repr(rates.split(",")[-1]) in str(error.value)
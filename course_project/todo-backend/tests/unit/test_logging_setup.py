@@ -0,0 +1,76 @@
+"""Unit tests for the queued, non-blocking logging pipeline."""
+
+import json
+import logging
+import threading
+
+from src.api.routes.metrics import _log_pipeline_lines
+from src.config.logging_setup import JSONMessage, LogPipeline
+
+
+class _RecordingHandler(logging.Handler):
+    """Collects formatted messages and the thread that formatted them."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list[tuple[str, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append((self.format(record), threading.current_thread().name))
+
+
+def _logger(pipeline: LogPipeline) -> logging.Logger:
+    logger = logging.getLogger(f"test_logging_setup.{id(pipeline)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers = [pipeline.handler]
+    return logger
+
+
+class TestLogPipeline:
+    """Test that records are written by the listener thread and dropped when the queue is full."""
+
+    def test_records_are_formatted_off_the_calling_thread(self):
+        """Test that a JSONMessage is encoded by the listener, not by the thread that logged it."""
+        handler = _RecordingHandler()
+        pipeline = LogPipeline(queue_size=10, handlers=[handler])
+        pipeline.start()
+        try:
+            _logger(pipeline).info(JSONMessage({"path": "/todos", "status_code": 200}))
+        finally:
+            pipeline.stop()
+
+        ((message, thread_name),) = handler.messages
+        assert json.loads(message) == {"path": "/todos", "status_code": 200}
+        assert thread_name != threading.current_thread().name
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        """Test that records beyond the queue size are counted as dropped, and the rest are kept."""
+        handler = _RecordingHandler()
+        pipeline = LogPipeline(queue_size=2, handlers=[handler])
+        logger = _logger(pipeline)
+
+        for i in range(5):
+            logger.info("record %d", i)
+        assert (pipeline.depth, pipeline.dropped) == (2, 3)
+
+        pipeline.start()
+        pipeline.stop()
+        assert [message for message, _ in handler.messages] == ["record 0", "record 1"]
+
+    def test_stop_without_start_is_harmless(self):
+        """Test that shutting down a pipeline that never started does not raise."""
+        LogPipeline(queue_size=1, handlers=[]).stop()
+
+    def test_metrics_lines(self):
+        """Test the Prometheus rendering of queue depth and drops."""
+        pipeline = LogPipeline(queue_size=1, handlers=[])
+        logger = _logger(pipeline)
+        logger.info("kept")
+        logger.info("dropped")
+
+        lines = _log_pipeline_lines(pipeline)
+
+        assert "todo_backend_log_queue_depth 1" in lines
+        assert "todo_backend_log_queue_capacity 1" in lines
+        assert "todo_backend_log_records_dropped_total 1" in lines
@@ -0,0 +1,188 @@
+"""Unit tests for the metrics registry, TodoDatabase instrumentation and multi-worker merging."""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.routes.metrics import router as metrics_router
+from src.database.operation_metrics import DB_OPERATION_ERRORS, DB_OPERATION_SECONDS, instrumented
+from src.observability.metrics import MetricsRegistry, registry
+from src.observability.multiprocess import WorkerMetricsSnapshots, merge_expositions
+
+
+class TestMetricFamilies:
+    """Test label binding and Prometheus rendering."""
+
+    def test_labels_returns_the_same_child(self):
+        """Test that a label set is bound once and reused."""
+        family = MetricsRegistry().counter("test_total", "Test", ("route",))
+
+        assert family.labels("/todos") is family.labels("/todos")
+        with pytest.raises(ValueError):
+            family.labels("/todos", "GET")
+
+    def test_render_counter_gauge_and_histogram(self):
+        """Test the exposition lines of each metric type."""
+        registry = MetricsRegistry()
+        registry.counter("test_requests_total", "Requests", ("route",)).labels('/a"b').inc(2)
+        registry.gauge("test_in_flight", "In flight").labels().inc()
+        histogram = registry.histogram("test_seconds", "Latency", ("op",), buckets=(0.1, 1.0))
+        histogram.labels("read").observe(0.05)
+        histogram.labels("read").observe(2.0)
+
+        assert registry.render() == [
+            "# HELP test_requests_total Requests",
+            "# TYPE test_requests_total counter",
+            'test_requests_total{route="/a\\"b"} 2',
+            "# HELP test_in_flight In flight",
+            "# TYPE test_in_flight gauge",
+            "test_in_flight 1",
+            "# HELP test_seconds Latency",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{op="read",le="0.1"} 1',
+            'test_seconds_bucket{op="read",le="1.0"} 1',
+            'test_seconds_bucket{op="read",le="+Inf"} 2',
+            'test_seconds_sum{op="read"} 2.05',
+            'test_seconds_count{op="read"} 2',
+        ]
+
+    def test_duplicate_names_are_rejected(self):
+        """Test that a name can only be registered once."""
+        registry = MetricsRegistry()
+        registry.gauge("test_value", "Value")
+
+        with pytest.raises(ValueError):
+            registry.counter("test_value", "Value")
+
+
+class TestInstrumented:
+    """Test the TodoDatabase operation decorator."""
+
+    async def test_coroutine_latency_and_errors(self):
+        """Test that calls are timed under the method name and exceptions are counted."""
+
+        @instrumented
+        async def test_operation(fail: bool) -> str:
+            if fail:
+                raise RuntimeError("boom")
+            return "ok"
+
+        assert await test_operation(False) == "ok"
+        with pytest.raises(RuntimeError):
+            await test_operation(True)
+
+        assert DB_OPERATION_SECONDS.labels("test_operation").count == 2
+        assert DB_OPERATION_ERRORS.labels("test_operation").value == 1
+
+    async def test_async_generator_is_timed_until_closed(self):
+        """Test that a stream is timed once and closed when the caller stops early."""
+        closed = []
+
+        @instrumented
+        async def test_stream():
+            try:
+                for i in range(10):
+                    yield i
+            finally:
+                closed.append(True)
+
+        stream = test_stream()
+        assert await anext(stream) == 0
+        await stream.aclose()
+
+        assert closed == [True]
+        assert DB_OPERATION_SECONDS.labels("test_stream").count == 1
+        assert DB_OPERATION_ERRORS.labels("test_stream").value == 0
+
+
+class TestMultiprocess:
+    """Test summing the metrics of several workers."""
+
+    WORKER = "\n".join(
+        [
+            "# HELP test_total Requests",
+            "# TYPE test_total counter",
+            'test_total{route="/todos"} 3',
+            "# HELP test_in_flight In flight",
+            "# TYPE test_in_flight gauge",
+            "test_in_flight 2",
+            "# HELP test_seconds Latency",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{le="+Inf"} 3',
+            "test_seconds_sum 0.25",
+        ]
+    )
+
+    def test_merge_sums_series_and_skips_gauges_of_exited_workers(self):
+        """Test that counters and histograms add up, and only live workers' gauges count."""
+        merged = merge_expositions([(self.WORKER, True), (self.WORKER, True), (self.WORKER, False)])
+
+        assert merged.splitlines() == [
+            "# HELP test_total Requests",
+            "# TYPE test_total counter",
+            'test_total{route="/todos"} 9',
+            "# HELP test_in_flight In flight",
+            "# TYPE test_in_flight gauge",
+            "test_in_flight 4",
+            "# HELP test_seconds Latency",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{le="+Inf"} 9',
+            "test_seconds_sum 0.75",
+        ]
+
+    def test_snapshots_merge_other_workers_files(self, tmp_path):
+        """Test that a worker serves its fresh metrics plus the other workers' snapshots."""
+        snapshots = WorkerMetricsSnapshots(str(tmp_path), 1.0, lambda: "")
+        snapshots.write("stale own snapshot 100\n")
+        (tmp_path / "other-worker.prom").write_text("# TYPE test_total counter\ntest_total 2\n")
+
+        merged = snapshots.merged("# TYPE test_total counter\ntest_total 5\n")
+
+        assert merged == "# TYPE test_total counter\ntest_total 7\n"
+
+    def test_snapshot_id_is_unique_per_process(self, tmp_path):
+        """Test that a worker reusing an exited worker's pid gets a file of its own."""
+        exited = WorkerMetricsSnapshots(str(tmp_path), 1.0, lambda: "")
+        replacement = WorkerMetricsSnapshots(str(tmp_path), 1.0, lambda: "")
+
+        assert exited.path == exited.path
+        assert exited.path != replacement.path
+        assert str(os.getpid()) not in exited.path.name
+
+    def test_gauges_of_stale_snapshots_are_dropped(self, tmp_path):
+        """Test that an exited worker's counters are kept and its gauges are not."""
+        snapshots = WorkerMetricsSnapshots(str(tmp_path), 1.0, lambda: "")
+        exited = tmp_path / "exited-worker.prom"
+        exited.write_text("# TYPE test_total counter\ntest_total 2\n# TYPE test_in_flight gauge\ntest_in_flight 4\n")
+        os.utime(exited, (time.time() - 10, time.time() - 10))
+
+        merged = snapshots.merged(
+            "# TYPE test_total counter\ntest_total 5\n# TYPE test_in_flight gauge\ntest_in_flight 1\n"
+        )
+
+        assert merged == "# TYPE test_total counter\ntest_total 7\n# TYPE test_in_flight gauge\ntest_in_flight 1\n"
+
+    async def test_endpoint_renders_on_the_event_loop(self, tmp_path):
+        """Test that /metrics renders on the loop thread and only reads the snapshot files from a thread."""
+        app = FastAPI()
+        app.include_router(metrics_router)
+        app.state.metrics_snapshots = WorkerMetricsSnapshots(str(tmp_path), 1.0, lambda: "")
+        (tmp_path / "other-worker.prom").write_text("# TYPE test_total counter\ntest_total 2\n")
+        render_threads = []
+
+        def render():
+            render_threads.append(threading.get_ident())
+            return ["# TYPE test_total counter", "test_total 5"]
+
+        with patch.object(registry, "render", render):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert "test_total 7" in response.text.splitlines()
+        assert render_threads == [threading.get_ident()]
@@ -0,0 +1,173 @@
+"""Unit tests for the outbox relay loop and confirmed NATS batch publishing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.database.operations import TodoDatabase
+from src.services.nats_service import _PUBLISH_METRICS, NATSService
+from src.services.outbox_relay import OutboxRelay
+
+
+def _relay(relay_outbox: AsyncMock, batch_size: int = 2) -> OutboxRelay:
+    relay = OutboxRelay(batch_size=batch_size, interval_seconds=10, publish_timeout_seconds=0.5)
+    relay._db = MagicMock()
+    relay._db.relay_outbox = relay_outbox
+    relay.nats_service = MagicMock(is_connected=True)
+    return relay
+
+
+def _connected_nats(publish: AsyncMock, flush: AsyncMock) -> NATSService:
+    nats_service = NATSService()
+    nats_service.nc = MagicMock()
+    nats_service.nc.publish = publish
+    nats_service.nc.flush = flush
+    nats_service.is_connected = True
+    return nats_service
+
+
+class TestOutboxRelay:
+    """Test when and how much the relay drains."""
+
+    async def test_drain_skipped_without_nats(self):
+        """Test that nothing is read from the outbox while NATS is unavailable."""
+        relay = _relay(AsyncMock(return_value=1))
+        relay.nats_service = None
+
+        assert await relay.drain_once() == 0
+        relay._db.relay_outbox.assert_not_called()
+
+    async def test_drain_counts_published_events(self):
+        """Test that one drain relays one batch with the configured size."""
+        relay = _relay(AsyncMock(return_value=2))
+
+        assert await relay.drain_once() == 2
+        assert relay.published_total == 2
+        assert relay._db.relay_outbox.call_args.args[1] == 2
+
+    async def test_loop_drains_full_batches_until_outbox_is_empty(self):
+        """Test that the loop keeps draining while batches come back full."""
+        drained = asyncio.Event()
+        results = iter([2, 2, 1])
+
+        async def relay_outbox(publish, limit, claim_seconds):
+            result = next(results, 0)
+            if result == 1:
+                drained.set()
+            return result
+
+        relay = _relay(AsyncMock(side_effect=relay_outbox))
+        relay.start()
+        try:
+            await asyncio.wait_for(drained.wait(), timeout=1)
+        finally:
+            await relay.stop()
+
+        assert relay.published_total == 5
+        assert relay._db.relay_outbox.call_count == 3
+
+    async def test_notify_wakes_the_loop_before_the_poll_interval(self):
+        """Test that a local write gets its events relayed without waiting for the next poll."""
+        calls = asyncio.Queue()
+        relay = _relay(AsyncMock(side_effect=lambda publish, limit, claim_seconds: calls.put_nowait(limit) or 0))
+        relay.start()
+        try:
+            await asyncio.wait_for(calls.get(), timeout=1)
+            relay.notify()
+            await asyncio.wait_for(calls.get(), timeout=1)
+        finally:
+            await relay.stop()
+
+    async def test_failed_drain_does_not_stop_the_loop(self):
+        """Test that a database error is logged and the relay keeps running."""
+        relay = _relay(AsyncMock(side_effect=ConnectionError("database down")))
+        relay.start()
+        await asyncio.sleep(0.05)
+
+        assert not relay._task.done()
+        await relay.stop()
+
+
+class TestRelayOutboxClaims:
+    """Test that relay_outbox publishes between its claim and settle transactions."""
+
+    async def test_publish_runs_between_claim_and_settle(self):
+        """Test that the claimed events are published outside a transaction and the confirmed prefix is settled."""
+        rows = [MagicMock(id=1, payload={"id": "1"}), MagicMock(id=2, payload={"id": "2"})]
+        steps = []
+        publish = AsyncMock(side_effect=lambda messages: steps.append("publish") or 1)
+
+        with (
+            patch.object(
+                TodoDatabase, "_claim_outbox", AsyncMock(side_effect=lambda *a: steps.append("claim") or rows)
+            ),
+            patch.object(TodoDatabase, "_settle_outbox", AsyncMock(side_effect=lambda *a: steps.append("settle"))),
+        ):
+            assert await TodoDatabase().relay_outbox(publish, 2, 30) == 1
+            TodoDatabase._settle_outbox.assert_awaited_once_with(rows, 1)
+
+        assert steps == ["claim", "publish", "settle"]
+        publish.assert_awaited_once_with([{"id": "1"}, {"id": "2"}])
+
+    async def test_publish_outliving_the_claim_is_cut_off(self):
+        """Test that a publish still running halfway through the claim is abandoned and the events released."""
+        rows = [MagicMock(id=1, payload={"id": "1"})]
+
+        async def slow_publish(messages):
+            await asyncio.sleep(1)
+            return 1
+
+        with (
+            patch.object(TodoDatabase, "_claim_outbox", AsyncMock(return_value=rows)),
+            patch.object(TodoDatabase, "_settle_outbox", AsyncMock()),
+        ):
+            assert await TodoDatabase().relay_outbox(slow_publish, 1, 0.02) == 0
+            TodoDatabase._settle_outbox.assert_awaited_once_with(rows, 0)
+
+    async def test_nothing_claimed_publishes_nothing(self):
+        """Test that a round another relay holds, or an empty outbox, skips publishing and settling."""
+        publish = AsyncMock()
+
+        with (
+            patch.object(TodoDatabase, "_claim_outbox", AsyncMock(return_value=[])),
+            patch.object(TodoDatabase, "_settle_outbox", AsyncMock()),
+        ):
+            assert await TodoDatabase().relay_outbox(publish, 10, 30) == 0
+            TodoDatabase._settle_outbox.assert_not_called()
+
+        publish.assert_not_called()
+
+
+class TestPublishEventBatch:
+    """Test that only events NATS confirmed are reported as published."""
+
+    async def test_batch_confirmed_by_flush(self):
+        """Test that all messages are published in order and confirmed by one flush."""
+        nats_service = _connected_nats(AsyncMock(), AsyncMock())
+        messages = [{"id": "1", "action": "created"}, {"id": "1", "action": "updated"}]
+
+        assert await nats_service.publish_event_batch(messages, timeout=0.5) == 2
+        payloads = [call.args[1] for call in nats_service.nc.publish.call_args_list]
+        assert payloads == [b'{"id":"1","action":"created"}', b'{"id":"1","action":"updated"}']
+        nats_service.nc.flush.assert_awaited_once_with(timeout=0.5)
+
+    async def test_failed_flush_confirms_nothing(self):
+        """Test that a flush timeout leaves every message unconfirmed."""
+        nats_service = _connected_nats(AsyncMock(), AsyncMock(side_effect=TimeoutError()))
+
+        assert await nats_service.publish_event_batch([{"id": "1"}], timeout=0.5) == 0
+
+    async def test_publish_failure_confirms_the_prefix(self):
+        """Test that messages written before a publish error are still confirmed."""
+        nats_service = _connected_nats(AsyncMock(side_effect=[None, ConnectionError("closed")]), AsyncMock())
+
+        assert await nats_service.publish_event_batch([{"id": "1"}, {"id": "2"}, {"id": "3"}], timeout=0.5) == 1
+
+    async def test_publish_latency_and_failures_are_recorded(self):
+        """Test that the outbox path records each batch and the events NATS did not confirm."""
+        seconds, published, failures = _PUBLISH_METRICS["outbox"]
+        before = (seconds.count, published.value, failures.value)
+        nats_service = _connected_nats(AsyncMock(), AsyncMock(side_effect=TimeoutError()))
+
+        await nats_service.publish_event_batch([{"id": "1"}, {"id": "2"}], timeout=0.5)
+
+        assert (seconds.count, published.value, failures.value) == (before[0] + 1, before[1] + 2, before[2] + 2)
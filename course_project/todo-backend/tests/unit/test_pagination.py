@@ -0,0 +1,51 @@
+"""Unit tests for keyset pagination cursors."""
+
+import base64
+from datetime import UTC, datetime
+
+import pytest
+
+from src.database.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class TestPaginationCursor:
+    """Test opaque cursor encoding used by GET /todos pagination."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes back to the exact sort key, including microseconds."""
+        created_at = datetime(2025, 7, 21, 10, 0, 0, 123456, tzinfo=UTC)
+
+        cursor = encode_cursor(created_at, 42)
+
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    def test_cursor_accepts_string_ids(self):
+        """Test that API-style string IDs are encoded as integers."""
+        created_at = datetime(2025, 7, 21, 10, 0, 0, tzinfo=UTC)
+
+        assert decode_cursor(encode_cursor(created_at, "7")) == (created_at, 7)
+
+    def test_cursor_is_url_safe(self):
+        """Test that cursors can be placed in a query string without escaping."""
+        cursor = encode_cursor(datetime(2025, 7, 21, 10, 0, 0, tzinfo=UTC), 123456789)
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            "",
+            base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+            base64.urlsafe_b64encode(b'["2025-07-21T10:00:00", "1; DROP TABLE todos"]').decode(),
+            base64.urlsafe_b64encode(b'["yesterday", 1]').decode(),
+            base64.urlsafe_b64encode(b'["2025-07-21T10:00:00", true]').decode(),
+            base64.urlsafe_b64encode(b'["2025-07-21T10:00:00", 99999999999]').decode(),
+        ],
+    )
+    def test_invalid_cursor_raises(self, cursor):
+        """Test that malformed or tampered cursors are rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
@@ -0,0 +1,72 @@
+"""Unit tests for connection pool instrumentation and the metrics endpoint rendering."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from src.api.routes.metrics import _update_pool_gauges
+from src.database.pool_metrics import InstrumentedAsyncQueuePool, get_pool_metrics, pool_metrics
+from src.observability.metrics import registry
+
+
+class TestPoolMetrics:
+    """Test the wait-time histogram and counters."""
+
+    def test_observe_wait_fills_cumulative_buckets(self):
+        """Test that waits land in the right bucket and buckets are cumulative."""
+        metrics = get_pool_metrics("bucket-test")
+
+        metrics.observe_wait(0.005)
+        metrics.observe_wait(0.05)
+        metrics.observe_wait(50.0)
+
+        assert metrics.checkouts.value == 3
+        assert metrics.wait_seconds.sum == pytest.approx(50.055)
+        buckets = dict(metrics.wait_seconds.cumulative_buckets())
+        assert (buckets["0.005"], buckets["0.05"], buckets["30.0"], buckets["+Inf"]) == (1, 2, 2, 3)
+
+    def test_metrics_are_shared_per_pool_name(self):
+        """Test that the registry returns the same metrics for the same pool name."""
+        assert get_pool_metrics("shared-test") is get_pool_metrics("shared-test")
+
+
+class TestInstrumentedPool:
+    """Test checkout timing and timeout counting on a pool with fake connections."""
+
+    async def test_checkout_and_timeout_are_recorded(self):
+        """Test that a checkout is timed and an exhausted pool counts a timeout."""
+        pool_metrics.pop("instrumented-test", None)
+        pool = InstrumentedAsyncQueuePool(
+            MagicMock, pool_size=1, max_overflow=0, timeout=0.01, logging_name="instrumented-test"
+        )
+
+        connection = await greenlet_spawn(pool.connect)
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+        assert pool.checkedout() == 1
+        connection.close()
+
+        metrics = pool_metrics["instrumented-test"]
+        assert metrics.checkouts.value == 1
+        assert metrics.timeouts.value == 1
+
+
+class TestMetricsRendering:
+    """Test the Prometheus text rendering of pool metrics."""
+
+    def test_pool_series_include_gauges_counters_and_histogram(self):
+        """Test that each pool gets labelled gauge, counter and histogram lines."""
+        get_pool_metrics("render-test").observe_wait(0.05)
+        _update_pool_gauges(
+            [{"pool": "render-test", "size": 5, "checked_out": 2, "checked_in": 3, "overflow": 0, "max_overflow": 10}]
+        )
+
+        lines = registry.render()
+
+        assert 'todo_backend_db_pool_checked_out{pool="render-test"} 2' in lines
+        assert "# TYPE todo_backend_db_pool_timeouts_total counter" in lines
+        assert 'todo_backend_db_pool_checkouts_total{pool="render-test"} 1' in lines
+        assert 'todo_backend_db_pool_wait_seconds_bucket{pool="render-test",le="+Inf"} 1' in lines
+        assert 'todo_backend_db_pool_wait_seconds_count{pool="render-test"} 1' in lines
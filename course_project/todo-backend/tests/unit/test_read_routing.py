@@ -0,0 +1,70 @@
+"""Unit tests for read-replica routing in DatabaseManager."""
+
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from src.database.connection import DatabaseManager
+
+
+def _manager_with_replicas(count: int) -> DatabaseManager:
+    """Build a manager whose session factories return labelled mocks instead of real sessions."""
+    manager = DatabaseManager()
+    manager.session_factory = MagicMock(return_value="primary")
+    manager.read_session_factories = [MagicMock(return_value=f"replica-{i}") for i in range(count)]
+    return manager
+
+
+class TestReadRouting:
+    """Test how read sessions are spread across replicas."""
+
+    def test_without_replicas_reads_use_primary(self):
+        """Test that reads fall through to the primary when no replicas are configured."""
+        manager = _manager_with_replicas(0)
+
+        assert manager.get_read_session() == ("primary", None)
+
+    def test_reads_round_robin_across_replicas(self):
+        """Test that successive reads rotate through the replicas."""
+        manager = _manager_with_replicas(2)
+
+        picks = [manager.get_read_session() for _ in range(4)]
+
+        assert picks == [("replica-0", 0), ("replica-1", 1), ("replica-0", 0), ("replica-1", 1)]
+
+    def test_unhealthy_replica_is_skipped_until_retry(self):
+        """Test that a failed replica leaves rotation and comes back after the retry delay."""
+        manager = _manager_with_replicas(2)
+
+        with patch("src.database.connection.time.monotonic", return_value=100.0):
+            manager.mark_replica_unhealthy(0, OSError("connection refused"))
+            assert [manager.get_read_session()[1] for _ in range(3)] == [1, 1, 1]
+
+        with patch("src.database.connection.time.monotonic", return_value=1000.0):
+            assert {manager.get_read_session()[1] for _ in range(2)} == {0, 1}
+
+    def test_all_replicas_unhealthy_falls_back_to_primary(self):
+        """Test that reads still succeed on the primary when every replica is down."""
+        manager = _manager_with_replicas(2)
+        manager.mark_replica_unhealthy(0, OSError("down"))
+        manager.mark_replica_unhealthy(1, OSError("down"))
+
+        assert manager.get_read_session() == ("primary", None)
+
+    def test_reads_use_primary_inside_read_your_writes_window(self):
+        """Test that reads right after a write see the primary, then return to replicas."""
+        manager = _manager_with_replicas(1)
+
+        with patch("src.database.connection.time.monotonic", return_value=100.0):
+            manager.mark_write()
+            assert manager.get_read_session() == ("primary", None)
+
+        with patch("src.database.connection.time.monotonic", return_value=200.0):
+            assert manager.get_read_session() == ("replica-0", 0)
+
+    def test_connection_errors_are_distinguished_from_query_errors(self):
+        """Test that only connectivity failures trigger replica fallback."""
+        assert DatabaseManager.is_connection_error(OSError("refused"))
+        assert DatabaseManager.is_connection_error(OperationalError("SELECT 1", {}, Exception("gone")))
+        assert not DatabaseManager.is_connection_error(ProgrammingError("SELECT x", {}, Exception("bad sql")))
+        assert not DatabaseManager.is_connection_error(ValueError("not a db error"))
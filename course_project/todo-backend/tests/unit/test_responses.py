@@ -0,0 +1,57 @@
+"""Unit tests for the zero-revalidation JSON response used by the todo routes."""
+
+from datetime import UTC, datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from src.api.responses import PydanticJSONResponse
+from src.models.todo import Todo, TodoStatus
+
+TODO_LIST = TypeAdapter(list[Todo])
+
+
+def _todos(count: int) -> list[Todo]:
+    created = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+    return [
+        Todo(
+            id=str(i),
+            text=f"Todo ünïcode {i}",
+            status=TodoStatus.DONE if i % 2 else TodoStatus.NOT_DONE,
+            created_at=created,
+            updated_at=None if i % 3 else created,
+        )
+        for i in range(count)
+    ]
+
+
+class TestPydanticJSONResponse:
+    """Test that the fast path renders what the response_model path would."""
+
+    def test_list_matches_response_model_serialization(self):
+        """Test byte equality with FastAPI's response_model serialization of list[Todo]."""
+        todos = _todos(5)
+        assert PydanticJSONResponse(todos).body == TODO_LIST.dump_json(TODO_LIST.validate_python(todos))
+
+    def test_single_model_matches_model_dump_json(self):
+        """Test byte equality with model_dump_json for a single todo."""
+        todo = _todos(1)[0]
+        assert PydanticJSONResponse(todo).body == todo.model_dump_json().encode()
+
+    def test_route_skips_response_revalidation(self):
+        """Test that a returned response is not validated against response_model again."""
+        app = FastAPI()
+        # Built without validation and violating max_length=140: only a re-validation would reject it
+        unchecked = Todo.model_construct(
+            id="1", text="x" * 200, status=TodoStatus.NOT_DONE, created_at=datetime.now(UTC)
+        )
+
+        @app.get("/todo", response_model=Todo)
+        async def get_todo():
+            return PydanticJSONResponse(unchecked)
+
+        response = TestClient(app).get("/todo")
+
+        assert response.status_code == 200
+        assert response.json()["text"] == "x" * 200
@@ -0,0 +1,118 @@
+"""Unit tests for fast startup: schema-version skip, pool pre-warming and parallel dependency setup."""
+
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.database import models
+from src.database.connection import DatabaseManager
+from src.database.models import schema_version
+
+
+class _FakeEngine:
+    """Engine stand-in whose connections take a moment to open and track how many are open at once."""
+
+    def __init__(self, fail_on: int | None = None):
+        self.open = 0
+        self.max_open = 0
+        self.opened = 0
+        self.fail_on = fail_on
+
+    @contextlib.asynccontextmanager
+    async def connect(self):
+        self.opened += 1
+        if self.opened == self.fail_on:
+            raise OSError("connection refused")
+        self.open += 1
+        self.max_open = max(self.max_open, self.open)
+        await asyncio.sleep(0.01)
+        try:
+            yield MagicMock()
+        finally:
+            self.open -= 1
+
+
+class TestSchemaVersion:
+    """Test the schema fingerprint and the create_all skip."""
+
+    def test_version_is_stable_and_tracks_ddl(self):
+        """Test the fingerprint is deterministic and changes when the applied DDL changes."""
+        version = schema_version()
+        assert version == schema_version()
+
+        with patch.object(models, "TODO_STATS_DDL", (*models.TODO_STATS_DDL, "SELECT 1")):
+            assert schema_version() != version
+
+    async def test_matching_marker_skips_create_all(self):
+        """Test that no DDL transaction is opened when the stored version matches."""
+        manager = DatabaseManager()
+        manager.engine = MagicMock()
+        manager._stored_schema_version = AsyncMock(return_value=schema_version())
+
+        await manager._create_tables()
+
+        manager.engine.begin.assert_not_called()
+
+
+class TestPrewarm:
+    """Test pool pre-warming."""
+
+    async def test_opens_pool_size_connections_at_once(self):
+        """Test that pre-warming holds db_pool_size connections simultaneously, then releases them."""
+        manager = DatabaseManager()
+        manager.engine = _FakeEngine()
+
+        with patch("src.database.connection.settings.db_pool_size", 4):
+            await manager.prewarm()
+
+        assert manager.engine.max_open == 4
+        assert manager.engine.open == 0
+
+    async def test_failure_releases_opened_connections(self):
+        """Test that a failed connection is raised after the others are returned."""
+        manager = DatabaseManager()
+        manager.engine = _FakeEngine(fail_on=2)
+
+        with patch("src.database.connection.settings.db_pool_size", 3), pytest.raises(OSError):
+            await manager.prewarm()
+
+        assert manager.engine.open == 0
+
+
+class TestLifespan:
+    """Test that startup runs database and NATS setup concurrently."""
+
+    async def test_database_and_nats_start_in_parallel(self):
+        """Test startup takes about as long as the slower dependency, not the sum."""
+        from src.main import create_app, lifespan
+
+        async def slow_database() -> bool:
+            await asyncio.sleep(0.2)
+            return True
+
+        async def slow_nats():
+            await asyncio.sleep(0.2)
+            return None
+
+        app = create_app()
+        with (
+            patch("src.main.start_database", slow_database),
+            patch("src.main.start_nats", slow_nats),
+            patch("src.main.health_monitor") as health_monitor,
+            patch("src.main.outbox_relay") as outbox_relay,
+            patch("src.main.db_manager") as db_manager,
+        ):
+            health_monitor.stop = AsyncMock()
+            outbox_relay.stop = AsyncMock()
+            db_manager.close = AsyncMock()
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            async with lifespan(app):
+                elapsed = loop.time() - started
+
+        assert elapsed < 0.35
+        assert app.state.nats_service is None
+        health_monitor.start.assert_called_once()
+        outbox_relay.start.assert_called_once()
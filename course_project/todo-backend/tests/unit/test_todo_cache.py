@@ -0,0 +1,118 @@
+"""Unit tests for the in-process todo read cache."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from src.models.todo import Todo, TodoVersion
+from src.services.todo_cache import TodoCache
+
+
+def _todo(todo_id: str, text: str = "Cached todo") -> Todo:
+    return Todo(id=todo_id, text=text)
+
+
+class TestTodoCache:
+    """Test TTL, size bound, invalidation and counters."""
+
+    def test_list_round_trip_counts_hits_and_misses(self):
+        """Test that a stored list is served and lookups are counted."""
+        cache = TodoCache(ttl_seconds=60, max_items=10)
+
+        assert cache.get_list() is None
+        cache.set_list([_todo("1"), _todo("2")], cache.generation())
+
+        assert [todo.id for todo in cache.get_list()] == ["1", "2"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_cached_list_is_a_copy(self):
+        """Test that callers cannot mutate the cached list."""
+        cache = TodoCache(ttl_seconds=60, max_items=10)
+        cache.set_list([_todo("1")], cache.generation())
+
+        cache.get_list().clear()
+
+        assert len(cache.get_list()) == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries older than the TTL are treated as misses."""
+        cache = TodoCache(ttl_seconds=5, max_items=10)
+        with patch("src.services.todo_cache.time.monotonic", return_value=100.0):
+            cache.set_item(_todo("1"), cache.generation())
+            cache.set_list([_todo("1")], cache.generation())
+
+        with patch("src.services.todo_cache.time.monotonic", return_value=106.0):
+            assert cache.get_item("1") is None
+            assert cache.get_list() is None
+
+    def test_item_cache_is_size_bounded_lru(self):
+        """Test that the least recently used todo is evicted first."""
+        cache = TodoCache(ttl_seconds=60, max_items=2)
+        cache.set_item(_todo("1"), cache.generation())
+        cache.set_item(_todo("2"), cache.generation())
+        cache.get_item("1")
+
+        cache.set_item(_todo("3"), cache.generation())
+
+        assert cache.get_item("2") is None
+        assert cache.get_item("1") is not None
+        assert cache.get_item("3") is not None
+
+    def test_invalidate_drops_item_and_list(self):
+        """Test that invalidating one todo also drops the list that contains it."""
+        cache = TodoCache(ttl_seconds=60, max_items=10)
+        cache.set_item(_todo("1"), cache.generation())
+        cache.set_item(_todo("2"), cache.generation())
+        cache.set_list([_todo("1"), _todo("2")], cache.generation())
+
+        cache.invalidate("1")
+
+        assert cache.get_item("1") is None
+        assert cache.get_item("2") is not None
+        assert cache.get_list() is None
+
+    def test_stale_read_is_not_stored_after_invalidation(self):
+        """Test that a read racing with a write cannot repopulate the cache with old data."""
+        cache = TodoCache(ttl_seconds=60, max_items=10)
+        generation = cache.generation()
+
+        cache.invalidate("1")  # A write lands while the read is in flight
+        cache.set_item(_todo("1", "Old text"), generation)
+        cache.set_list([_todo("1", "Old text")], generation)
+
+        assert cache.get_item("1") is None
+        assert cache.get_list() is None
+
+    def test_disabled_cache_never_serves(self):
+        """Test that a disabled cache always misses."""
+        cache = TodoCache(ttl_seconds=60, max_items=10, enabled=False)
+        cache.set_list([_todo("1")], cache.generation())
+        cache.set_item(_todo("1"), cache.generation())
+
+        assert cache.get_list() is None
+        assert cache.get_item("1") is None
+
+    def test_json_list_is_invalidated_with_the_list(self):
+        """Test that the encoded list slot follows the same invalidation as the object list."""
+        cache = TodoCache(ttl_seconds=60, max_items=10)
+        cache.set_list_json(b'[{"id":"1"}]', cache.generation())
+        assert cache.get_list_json() == b'[{"id":"1"}]'
+
+        cache.invalidate("1")
+
+        assert cache.get_list_json() is None
+
+    def test_version_is_invalidated_with_the_list(self):
+        """Test that the collection version slot is dropped by any invalidation and by stale generations."""
+        cache = TodoCache(ttl_seconds=60, max_items=10)
+        version = TodoVersion(3, datetime.now(UTC))
+        cache.set_version(version, cache.generation())
+        assert cache.get_version() == version
+
+        cache.invalidate("1")
+        assert cache.get_version() is None
+
+        stale_generation = cache.generation()
+        cache.invalidate()
+        cache.set_version(version, stale_generation)
+        assert cache.get_version() is None
@@ -0,0 +1,50 @@
+"""Unit tests for the filter, sort and cursor SQL built for todo listings."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.database.operations import TODO_JSON_COLUMNS, TodoDatabase
+from src.database.pagination import encode_cursor
+from src.models.todo import TodoSort, TodoStatus
+
+
+def _compile(**kwargs) -> tuple[str, dict]:
+    compiled = TodoDatabase._list_query(select(*TODO_JSON_COLUMNS), **kwargs).compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+class TestListQuery:
+    """Test that listing queries match the partial and trigram indexes."""
+
+    def test_status_predicates_match_partial_index_predicates(self):
+        """Test that status filters are written as the partial index WHERE clauses."""
+        not_done_sql, _ = _compile(status=TodoStatus.NOT_DONE)
+        done_sql, _ = _compile(status=TodoStatus.DONE)
+
+        assert "WHERE NOT todos.completed" in not_done_sql
+        assert "WHERE todos.completed ORDER BY" in done_sql
+
+    def test_search_escapes_like_wildcards(self):
+        """Test that % and _ in the search text are matched literally."""
+        sql, params = _compile(q="50%_off")
+
+        assert "ILIKE" in sql
+        assert "%50\\%\\_off%" in params.values()
+
+    def test_ascending_sort_pages_forward(self):
+        """Test that an ascending sort orders ascending and keyset-compares with >."""
+        cursor = encode_cursor(datetime(2025, 1, 1, tzinfo=UTC), 7)
+        sql, params = _compile(sort=TodoSort.UPDATED_ASC, limit=10, cursor=cursor)
+
+        assert "ORDER BY todos.updated_at ASC, todos.id ASC" in sql
+        assert "(todos.updated_at, todos.id) >" in sql
+        assert 11 in params.values()
+
+    def test_default_sort_is_newest_first_without_limit(self):
+        """Test the default listing is newest first and unbounded."""
+        sql, _ = _compile()
+
+        assert "ORDER BY todos.created_at DESC, todos.id DESC" in sql
+        assert "LIMIT" not in sql
@@ -180,3 +180,30 @@ class TestTodoService:
         await service.create_todo(todo_data)
 
         assert await service.get_todo_count() == initial_count + 1
+
+    async def test_reads_are_cached_and_writes_invalidate(self, test_db_manager):
+        """Test that repeated reads hit the cache and updates are visible immediately."""
+        service = TodoService()
+        created = await service.create_todo(TodoCreate(text="Cached todo"))
+
+        await service.get_todo_by_id(created.id)
+        hits_before = service.cache.hits
+        await service.get_todo_by_id(created.id)
+        assert service.cache.hits == hits_before + 1
+
+        await service.update_todo(created.id, text="Fresh text")
+
+        assert (await service.get_todo_by_id(created.id)).text == "Fresh text"
+        assert [todo.text for todo in await service.get_all_todos()] == ["Fresh text"]
+
+    async def test_remote_event_invalidates_cache(self, test_db_manager):
+        """Test that a todo event from another replica drops the cached entry."""
+        service = TodoService()
+        created = await service.create_todo(TodoCreate(text="Replica todo"))
+        await service.get_all_todos()
+
+        # Simulate another replica changing the row and announcing it over NATS
+        await TodoService()._db.update_todo(created.id, text="Changed elsewhere")
+        service.handle_todo_event({"id": created.id, "action": "updated"})
+
+        assert [todo.text for todo in await service.get_all_todos()] == ["Changed elsewhere"]
@@ -0,0 +1,241 @@
+"""Unit tests for tracing spans, their export and their propagation over HTTP and NATS."""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.database.operation_metrics import instrumented
+from src.database.operations import TodoDatabase
+from src.middleware.api_middleware import APIMiddleware
+from src.models.todo import Todo
+from src.observability.tracing import (
+    TRACEPARENT_HEADER,
+    FileSpanExporter,
+    RingBufferSpanExporter,
+    SpanKind,
+    Tracer,
+    parse_traceparent,
+    tracer,
+)
+from src.services.event_publisher import BatchedEventPublisher
+from src.services.nats_service import NATSService
+
+BROADCASTER_TRACING = Path(__file__).parents[3] / "broadcaster" / "src" / "observability" / "tracing.py"
+
+REMOTE_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_PARENT = f"00-{REMOTE_TRACE_ID}-00f067aa0ba902b7-01"
+
+
+@pytest.fixture
+def spans(monkeypatch) -> RingBufferSpanExporter:
+    """Export the global tracer's spans to a fresh ring buffer for the test."""
+    buffer = RingBufferSpanExporter(100)
+    monkeypatch.setattr(tracer, "exporters", [buffer])
+    monkeypatch.setattr(tracer, "buffer", buffer)
+    return buffer
+
+
+class TestTraceparent:
+    """Test parsing of the W3C trace context header."""
+
+    def test_valid_header(self):
+        """Test that trace and parent span IDs are extracted."""
+        assert parse_traceparent(REMOTE_PARENT) == (REMOTE_TRACE_ID, "00f067aa0ba902b7")
+
+    @pytest.mark.parametrize(
+        "value",
+        [None, "", "garbage", f"00-{'0' * 32}-00f067aa0ba902b7-01", f"ff-{REMOTE_TRACE_ID}-00f067aa0ba902b7-01"],
+    )
+    def test_invalid_headers_are_ignored(self, value):
+        """Test that missing, malformed and all-zero contexts start a new trace instead."""
+        assert parse_traceparent(value) is None
+
+
+class TestTracer:
+    """Test span nesting, errors and exporters."""
+
+    def test_nested_spans_share_the_trace(self, spans):
+        """Test that a span started inside another becomes its child."""
+        with tracer.span("outer") as outer, tracer.span("inner") as inner:
+            pass
+
+        assert [span.name for span in spans.spans] == ["inner", "outer"]
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_span_id == outer.span_id
+        assert outer.parent_span_id is None
+        assert outer.end_ns >= outer.start_ns
+
+    def test_remote_parent_continues_the_trace(self, spans):
+        """Test that a traceparent header parents the span, and the span can be propagated on."""
+        with tracer.span("consume", SpanKind.CONSUMER, traceparent=REMOTE_PARENT) as span:
+            pass
+
+        assert (span.trace_id, span.parent_span_id) == (REMOTE_TRACE_ID, "00f067aa0ba902b7")
+        assert span.traceparent == f"00-{REMOTE_TRACE_ID}-{span.span_id}-01"
+
+    def test_exception_marks_the_span_failed(self, spans):
+        """Test that an exception is recorded on the span and re-raised."""
+        with pytest.raises(RuntimeError), tracer.span("failing"):
+            raise RuntimeError("boom")
+
+        (span,) = spans.spans
+        assert span.to_otlp()["status"] == {"code": 2, "message": "RuntimeError: boom"}
+
+    def test_tracer_without_exporters_is_a_noop(self):
+        """Test that spans cost nothing and carry no context until tracing is configured."""
+        with Tracer().span("ignored", attributes={"a": 1}) as span:
+            span.set_attribute("b", 2)
+
+        assert span.traceparent is None
+
+    def test_ring_buffer_finds_traces_by_request_id(self, spans):
+        """Test that a request ID finds every span of its trace."""
+        with tracer.span("GET /todos", SpanKind.SERVER, {"request_id": "req-1"}), tracer.span("db"):
+            pass
+        with tracer.span("other"):
+            pass
+
+        assert {span.name for span in spans.find(request_id="req-1")} == {"GET /todos", "db"}
+        assert [span.name for span in spans.find(limit=1)] == ["other"]
+
+    def test_file_exporter_writes_otlp_json_lines(self, tmp_path):
+        """Test that queued spans are written as one ExportTraceServiceRequest per line."""
+        path = tmp_path / "spans.jsonl"
+        exporter = FileSpanExporter(str(path), "todo-backend")
+        local = Tracer()
+        local.exporters = [exporter]
+        exporter.start()
+        with local.span("write", attributes={"count": 2, "ok": True, "ratio": 0.5, "name": "x"}):
+            pass
+        exporter.stop()
+
+        (line,) = path.read_text().splitlines()
+        resource_spans = json.loads(line)["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "todo-backend"}
+        (span,) = resource_spans["scopeSpans"][0]["spans"]
+        assert span["name"] == "write"
+        assert span["kind"] == SpanKind.INTERNAL
+        assert [attribute["value"] for attribute in span["attributes"]] == [
+            {"intValue": "2"},
+            {"boolValue": True},
+            {"doubleValue": 0.5},
+            {"stringValue": "x"},
+        ]
+
+    @pytest.mark.skipif(not BROADCASTER_TRACING.exists(), reason="broadcaster sources not available")
+    def test_broadcaster_copy_is_identical(self):
+        """Test that both services share the exact same tracing module."""
+        own = Path(__file__).parents[2] / "src" / "observability" / "tracing.py"
+
+        assert BROADCASTER_TRACING.read_text() == own.read_text()
+
+
+class TestRequestAndDatabaseSpans:
+    """Test the server span of APIMiddleware and the spans of instrumented database operations."""
+
+    async def test_request_span_parents_database_spans(self, spans, caplog):
+        """Test that route handlers run in a server span correlated with X-Request-ID and the log record."""
+
+        @instrumented
+        async def get_todo(todo_id: str) -> dict:
+            return {"id": todo_id}
+
+        app = FastAPI()
+
+        @app.get("/todos/{todo_id}")
+        async def read(todo_id: str):
+            return await get_todo(todo_id)
+
+        app.add_middleware(APIMiddleware)
+        caplog.set_level(logging.INFO, logger="request_logger")
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/todos/7", headers={"X-Request-ID": "req-7", TRACEPARENT_HEADER: REMOTE_PARENT})
+
+        database_span, server_span = spans.spans
+        assert server_span.name == "GET /todos/{todo_id}"
+        assert server_span.kind == SpanKind.SERVER
+        assert server_span.trace_id == REMOTE_TRACE_ID
+        assert server_span.attributes["request_id"] == "req-7"
+        assert server_span.attributes["http.response.status_code"] == 200
+        assert database_span.name == "TodoDatabase.get_todo"
+        assert database_span.parent_span_id == server_span.span_id
+
+        (record,) = [json.loads(r.getMessage()) for r in caplog.records if r.name == "request_logger"]
+        assert record["trace_id"] == REMOTE_TRACE_ID
+
+
+class TestNATSPropagation:
+    """Test that published events carry the producer span in a traceparent header."""
+
+    async def test_direct_publish_sends_traceparent(self, spans):
+        """Test the producer span and the header of a message published inside the request."""
+        nats_service = NATSService()
+        nats_service.nc = MagicMock(publish=AsyncMock())
+        nats_service.is_connected = True
+
+        assert await nats_service.publish_todo_event({"id": "1"}, "created")
+
+        (span,) = spans.spans
+        assert (span.name, span.kind) == ("NATSService.publish_todo_event", SpanKind.PRODUCER)
+        payload, headers = (
+            nats_service.nc.publish.call_args.args[1],
+            nats_service.nc.publish.call_args.kwargs["headers"],
+        )
+        assert headers[TRACEPARENT_HEADER] == span.traceparent
+        assert json.loads(payload) == {"id": "1", "action": "created"}
+
+    async def test_queued_event_keeps_the_request_trace(self, spans):
+        """Test that the batched publisher sends the traceparent captured when the event was queued."""
+        nats_service = NATSService()
+        nats_service.nc = MagicMock(publish=AsyncMock(), flush=AsyncMock())
+        nats_service.is_connected = True
+        nats_service.publisher = BatchedEventPublisher(nats_service._send_batch, 10, 10, 60)
+
+        with tracer.span("POST /todos", SpanKind.SERVER) as request_span:
+            await nats_service.publish_todo_event({"id": "1"}, "created")
+        await nats_service.publisher.stop()
+
+        producer_span = next(span for span in spans.spans if span.kind == SpanKind.PRODUCER)
+        assert producer_span.parent_span_id == request_span.span_id
+        payload, headers = (
+            nats_service.nc.publish.call_args.args[1],
+            nats_service.nc.publish.call_args.kwargs["headers"],
+        )
+        assert headers[TRACEPARENT_HEADER] == producer_span.traceparent
+        assert b"_traceparent" not in payload
+
+    async def test_outbox_event_keeps_the_write_trace(self, spans):
+        """Test that the relay publishes an outbox event with the traceparent of the write that queued it."""
+        session = MagicMock(execute=AsyncMock())
+        todo = Todo(id="1", text="Test todo", created_at=datetime(2024, 1, 1))
+        with tracer.span("POST /todos", SpanKind.SERVER) as request_span:
+            await TodoDatabase._queue_events(session, [todo], "created")
+        ((_, rows), _) = session.execute.call_args
+        nats_service = NATSService()
+        nats_service.nc = MagicMock(publish=AsyncMock(), flush=AsyncMock())
+        nats_service.is_connected = True
+
+        assert await nats_service.publish_event_batch([row["payload"] for row in rows], 1.0) == 1
+
+        payload, headers = (
+            nats_service.nc.publish.call_args.args[1],
+            nats_service.nc.publish.call_args.kwargs["headers"],
+        )
+        assert headers[TRACEPARENT_HEADER] == request_span.traceparent
+        assert json.loads(payload) == {**todo.event_payload(), "action": "created"}
+
+    async def test_outbox_event_outside_a_span_has_no_trace(self, spans):
+        """Test that an event queued outside any span is published without a traceparent."""
+        session = MagicMock(execute=AsyncMock())
+        todo = Todo(id="1", text="Test todo", created_at=datetime(2024, 1, 1))
+
+        await TodoDatabase._queue_events(session, [todo], "created")
+
+        ((_, rows), _) = session.execute.call_args
+        assert rows[0]["payload"] == {**todo.event_payload(), "action": "created"}